@@ -1,26 +1,35 @@
 import uvicorn
 
 from contextlib import asynccontextmanager
-from typing import List, Optional
-from fastapi import FastAPI, HTTPException
+from datetime import datetime, timedelta, timezone
+from typing import List, Literal, Optional
+from uuid import uuid4
+from fastapi import FastAPI, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field, field_validator
 from celery.result import AsyncResult
 
+from core import metrics
 from core.config import settings
 from core.logging import log
 
-from workers.celery_app import celery_app
-from workers.tasks import process_news_url, process_news_batch, health_check, publish_batch_to_wordpress as batch_task, publish_to_wordpress, process_and_publish
+from workers.celery_app import celery_app, queue_depths, queue_stats, QUEUES, RATE_QUEUES
+from workers.tasks import process_news_url, process_news_batch, health_check, publish_batch_to_wordpress as batch_task, publish_to_wordpress, process_and_publish, reconcile_publish_stats, enqueue_unique, enqueue_publish
 
 
+from domain.entities import FAILURE_CLASSES, StageTimings
 from domain.factories import UseCaseFactory, ScraperFactory
-from domain.usecases import ProcessNewsInput
+from domain.usecases import ProcessNewsInput, ProcessNewsUseCase
 
-from services.wordpress_publisher import WordPressPublisherService
 from services.llm_service_adapter import LLMServiceAdapter
 
-from infra.mongo_news_repository import MongoNewsRepository
+from infra.resource_container import container
+
+from core.cache import TTLCache
+
+from api.pagination import encode_cursor, decode_cursor, encode_score_cursor, decode_score_cursor
+from api.search import search_terms, build_snippet
 
 
 # Pydantic Models para Request/Response
@@ -29,6 +38,10 @@ class ProcessNewsRequest(BaseModel):
     url: str = Field(..., description="URL da notícia")
     schema_name: str = Field(
         default="g1", description="Nome do schema YAML (sem extensão)")
+    force: bool = Field(
+        default=False, description="Ignora a política de frescor e reprocessa")
+    priority: Literal["high", "normal", "low"] = Field(
+        default="normal", description="Faixa de prioridade (high: notícia urgente)")
 
     @field_validator('url')
     @classmethod
@@ -52,6 +65,13 @@ class ProcessBatchRequest(BaseModel):
     urls: List[str] = Field(..., min_length=1,
                             max_length=50, description="Lista de URLs")
     schema_name: str = Field(default="g1", description="Nome do schema YAML")
+    force: bool = Field(
+        default=False, description="Ignora a política de frescor e reprocessa")
+    write_mode: Optional[Literal["live", "backfill"]] = Field(
+        default=None,
+        description="Gravação imediata (live) ou em lote adiada (backfill); padrão: BATCH_WRITE_MODE")
+    priority: Literal["high", "normal", "low"] = Field(
+        default="low", description="Faixa de prioridade das URLs do lote")
 
 
 class TaskResponse(BaseModel):
@@ -65,6 +85,7 @@ class TaskStatusResponse(BaseModel):
     """Response com status detalhado da task"""
     task_id: str
     status: str
+    stage: Optional[str] = None
     result: Optional[dict] = None
     error: Optional[str] = None
 
@@ -81,6 +102,10 @@ class SourcesResponse(BaseModel):
     total: int
 
 
+# Cache das buscas mais frequentes (por processo da API)
+search_cache = TTLCache(settings.SEARCH_CACHE_SIZE, settings.SEARCH_CACHE_TTL)
+
+
 # Helper functions
 def validate_schema(schema_name: str) -> None:
     """Valida se o schema existe, lança HTTPException se não"""
@@ -108,11 +133,13 @@ def validate_url_source(url: str) -> None:
 async def lifespan(app: FastAPI):
     """Gerencia o ciclo de vida da aplicação"""
     # Startup
+    container.init()
     log.info("API iniciada")
     log.info(f"Schemas disponíveis: {settings.list_schemas()}")
     log.info(f"Fontes disponíveis: {ScraperFactory.list_available_sources()}")
     yield
     # Shutdown
+    container.close()
     log.info("API encerrada")
 
 
@@ -196,6 +223,27 @@ async def health_llm():
     }
 
 
+@app.get("/metrics", tags=["Health"])
+async def get_metrics():
+    """
+    Métricas no formato Prometheus
+
+    Profundidade e idade da mensagem mais antiga por fila (lidas do broker
+    na coleta) e pools de conexão da API. As métricas de tasks vêm dos
+    exportadores dos workers (METRICS_PORT), ou também daqui quando API e
+    workers compartilham o PROMETHEUS_MULTIPROC_DIR.
+    """
+    if not metrics.AVAILABLE or not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=503, detail="Métricas desativadas (requer prometheus_client)")
+
+    def collect():
+        metrics.observe_http_pool(container.http_session())
+        return metrics.render(queue_stats=lambda: queue_stats(QUEUES))
+
+    payload, content_type = await run_in_threadpool(collect)
+    return Response(content=payload, media_type=content_type)
+
+
 @app.get("/schemas", response_model=SchemasResponse, tags=["Schemas"])
 async def list_schemas():
     """Lista todos os schemas de prompt disponíveis"""
@@ -225,15 +273,38 @@ async def process_news(request: ProcessNewsRequest):
     validate_schema(request.schema_name)
     validate_url_source(request.url)
 
-    # Envia para a fila
-    task = process_news_url.delay(request.url, request.schema_name)
+    # URL em quarentena (falha definitiva recente): não ocupa a fila
+    dead_letters = container.dead_letters()
+    if dead_letters is not None and not request.force:
+        entry = await run_in_threadpool(dead_letters.quarantined, request.url)
+        if entry is not None:
+            raise HTTPException(status_code=409, detail={
+                "message": "URL em quarentena por falha definitiva. Use force=true ou /dead-letters/{id}/requeue.",
+                "dead_letter_id": entry['_id'],
+                "failure": entry.get('failure'),
+                "attempts": entry.get('attempts'),
+                "quarantined_until": entry['quarantined_until'].isoformat()
+            })
+
+    # Envia para a fila (a mesma URL já enfileirada devolve a task existente)
+    task_id, duplicate = await run_in_threadpool(
+        enqueue_unique, process_news_url, request.url, request.schema_name, request.force,
+        priority=request.priority)
+
+    if duplicate:
+        log.info(f"URL já em processamento: {task_id}")
+        return TaskResponse(
+            task_id=task_id,
+            status="duplicate",
+            message=f"URL já está na fila ou em processamento. Use /status/{task_id} para acompanhar."
+        )
 
-    log.info(f"Task criada: {task.id}")
+    log.info(f"Task criada: {task_id}")
 
     return TaskResponse(
-        task_id=task.id,
+        task_id=task_id,
         status="queued",
-        message=f"Notícia enviada para processamento. Use /status/{task.id} para acompanhar."
+        message=f"Notícia enviada para processamento. Use /status/{task_id} para acompanhar."
     )
 
 
@@ -265,7 +336,9 @@ async def process_news_batch_endpoint(request: ProcessBatchRequest):
         )
 
     # Envia batch para a fila
-    task = process_news_batch.delay(request.urls, request.schema_name)
+    task = process_news_batch.delay(
+        request.urls, request.schema_name, request.force, request.write_mode,
+        request.priority)
 
     log.info(f"Batch task criada: {task.id}")
 
@@ -276,8 +349,40 @@ async def process_news_batch_endpoint(request: ProcessBatchRequest):
     )
 
 
+async def _expand_task_result(result):
+    """
+    Completa o resultado compacto de uma task com a notícia do MongoDB
+
+    As tasks devolvem apenas a referência (mongodb_id); o artigo e o resumo
+    são lidos aqui, com projeção, somente quando pedidos.
+    """
+    if not isinstance(result, dict) or not result.get("mongodb_id") or "article" in result:
+        return result
+
+    news = await container.async_news_repository().find_by_id(
+        result["mongodb_id"], fields="article")
+    if not news:
+        # Ainda no buffer de gravação (modo backfill) ou removida
+        return result
+
+    article = {field: news.get(field) for field in ProcessNewsUseCase.ARTICLE_FIELDS}
+    article["images"] = article["images"] or []
+    return {
+        **result,
+        "llm_processing": {
+            "status": news.get("llm_status"),
+            "resumo": news.get("summary")
+        },
+        "article": article
+    }
+
+
 @app.get("/status/{task_id}", response_model=TaskStatusResponse, tags=["Status"])
-async def get_task_status(task_id: str):
+async def get_task_status(
+    task_id: str,
+    include_article: bool = Query(
+        True, description="Busca no MongoDB o artigo e o resumo da notícia processada")
+):
     """
     Consulta o status de uma task
 
@@ -286,6 +391,9 @@ async def get_task_status(task_id: str):
     - SUCCESS: Task concluída com sucesso
     - FAILURE: Task falhou
     - RETRY: Task sendo re-executada
+
+    `stage` é a última etapa concluída (scraped, summarised, persisted,
+    published), de onde um retry retoma.
     """
     task_result = AsyncResult(task_id, app=celery_app)
 
@@ -294,15 +402,43 @@ async def get_task_status(task_id: str):
         status=task_result.status
     )
 
+    checkpoints = container.checkpoint_store()
+    if checkpoints is not None:
+        checkpoint = await run_in_threadpool(checkpoints.load, task_id)
+        if checkpoint:
+            response.stage = checkpoint.get('stage')
+
     if task_result.ready():
         if task_result.successful():
             response.result = task_result.result
+            if include_article:
+                response.result = await _expand_task_result(response.result)
         else:
             response.error = str(task_result.result)
 
     return response
 
 
+@app.get("/batch/{batch_id}", tags=["Status"])
+async def get_batch_status(batch_id: str):
+    """
+    Consulta o progresso agregado de um lote
+
+    Aceita o task_id devolvido por /process/batch e /publish/batch.
+    Retorna contagens por estado, vazão (tasks/min) e ETA com uma única
+    leitura, sem consultar cada task filha.
+    """
+    batch = await run_in_threadpool(container.batch_tracker().get, batch_id)
+    if batch is not None:
+        return batch
+
+    # O lote ainda não foi criado: a task que o enfileira não executou
+    task_result = AsyncResult(batch_id, app=celery_app)
+    if task_result.status in ("PENDING", "STARTED", "RETRY"):
+        return {"batch_id": batch_id, "status": "waiting", "task_status": task_result.status}
+    raise HTTPException(status_code=404, detail="Lote não encontrado")
+
+
 @app.delete("/task/{task_id}", tags=["Status"])
 async def revoke_task(task_id: str):
     """Cancela uma task pendente"""
@@ -337,10 +473,13 @@ async def process_news_sync(request: ProcessNewsRequest):
         input_data = ProcessNewsInput(
             url=request.url,
             schema_name=request.schema_name,
-            task_id="sync"
+            # Sem checkpoint: cada requisição síncrona começa do zero
+            task_id=None,
+            force=request.force
         )
 
-        output = use_case.execute(input_data)
+        # Scraping, LLM e pymongo são bloqueantes: executa fora do event loop
+        output = await run_in_threadpool(use_case.execute, input_data)
 
         if output.status == "error":
             raise HTTPException(status_code=400, detail=output.error)
@@ -352,6 +491,8 @@ async def process_news_sync(request: ProcessNewsRequest):
             "mongodb_id": output.mongodb_id,
             "title": output.title,
             "schema_used": output.schema_used,
+            "freshness": output.freshness,
+            "timings": output.timings,
             "llm_processing": {
                 "status": output.llm_status,
                 "resumo": output.resumo
@@ -383,6 +524,10 @@ async def publish_to_wordpress(request: ProcessNewsRequest, category: str = None
     validate_schema(request.schema_name)
     validate_url_source(request.url)
 
+    # Dono da reserva de publicação desta requisição
+    owner = f"api-{uuid4().hex}"
+    repo = container.async_news_repository()
+
     try:
         # 1. Processa a notícia
         use_case = UseCaseFactory.create_process_news_usecase(
@@ -392,14 +537,27 @@ async def publish_to_wordpress(request: ProcessNewsRequest, category: str = None
         input_data = ProcessNewsInput(
             url=request.url,
             schema_name=request.schema_name,
-            task_id="publish"
+            # Sem checkpoint, como em /process/sync: o dono fica só na reserva
+            task_id=None,
+            force=request.force,
+            # Gravada com a notícia: o dispatcher não a publica em paralelo
+            publish_claim=container.news_repository().publish_claim(
+                owner, settings.PUBLISH_CLAIM_TTL)
         )
 
-        output = use_case.execute(input_data)
+        output = await run_in_threadpool(use_case.execute, input_data)
 
         if output.status == "error":
             raise HTTPException(status_code=400, detail=output.error)
 
+        if not await repo.claim_publish(output.mongodb_id, owner, settings.PUBLISH_CLAIM_TTL):
+            # A reserva gravada pelo upsert não vale para notícia já publicada
+            await repo.release_publish_claim(output.mongodb_id, owner)
+            raise HTTPException(
+                status_code=409,
+                detail="Notícia já publicada ou com publicação em andamento"
+            )
+
         # 2. Prepara dados para publicação
         processed_data = {
             "status": output.status,
@@ -415,16 +573,22 @@ async def publish_to_wordpress(request: ProcessNewsRequest, category: str = None
         }
 
         # 3. Publica no WordPress
-        publisher = WordPressPublisherService()
-        result = publisher.publish_from_processed_news(
-            processed_data, category)
+        timings = StageTimings(output.timings)
+        publisher = container.wordpress_publisher()
+        with timings.span("publish"):
+            result = await run_in_threadpool(
+                publisher.publish_from_processed_news, processed_data, category)
 
         if not result.success:
+            await repo.mark_publish_error(output.mongodb_id, result.error)
+            await repo.release_publish_claim(output.mongodb_id, owner)
             raise HTTPException(
                 status_code=502,
                 detail=f"Erro ao publicar no WordPress: {result.error}"
             )
 
+        await repo.mark_as_published(
+            output.mongodb_id, result.post_id, result.post_url, timings.as_dict())
         log.success(f"[PUBLISH] Post criado: ID {result.post_id}")
 
         return {
@@ -435,6 +599,7 @@ async def publish_to_wordpress(request: ProcessNewsRequest, category: str = None
                 "post_url": result.post_url
             },
             "title": output.title,
+            "timings": timings.as_dict(),
             "llm_processing": {
                 "status": output.llm_status,
                 "resumo": output.resumo
@@ -469,6 +634,8 @@ class ProcessAndPublishBatchRequest(BaseModel):
     """Request para processar e publicar múltiplas URLs"""
     urls: List[str] = Field(..., min_length=1, max_length=50)
     schema_name: str = Field(default="g1")
+    force: bool = Field(default=False)
+    priority: Literal["high", "normal", "low"] = Field(default="normal")
 
 
 @app.post("/publish/batch", tags=["WordPress"])
@@ -514,9 +681,9 @@ async def publish_single_from_db(mongodb_id: str, async_mode: bool = True):
         async_mode: Se True, usa Celery (retorna task_id). Se False, síncrono.
     """
 
-    # Verifica se a notícia existe
-    repo = MongoNewsRepository()
-    news = repo.find_by_id(mongodb_id)
+    # Verifica se a notícia existe (o documento completo só é lido se for publicar)
+    repo = container.async_news_repository()
+    news = await repo.find_by_id(mongodb_id, fields="summary")
 
     if not news:
         raise HTTPException(status_code=404, detail="Notícia não encontrada")
@@ -530,7 +697,13 @@ async def publish_single_from_db(mongodb_id: str, async_mode: bool = True):
         }
 
     if async_mode:
-        task = publish_to_wordpress.delay(mongodb_id)
+        # Reserva a notícia para a task (dispatcher e varredura a ignoram)
+        task = await run_in_threadpool(enqueue_publish, mongodb_id)
+        if task is None:
+            raise HTTPException(
+                status_code=409,
+                detail="Notícia já publicada ou com publicação em andamento"
+            )
 
         return TaskResponse(
             task_id=task.id,
@@ -538,20 +711,35 @@ async def publish_single_from_db(mongodb_id: str, async_mode: bool = True):
             message=f"Publicação enviada. Use /status/{task.id} para acompanhar."
         )
     else:
-        # Modo síncrono
-        publisher = WordPressPublisherService()
-        result = publisher.publish_from_processed_news(news)
+        # Modo síncrono: só publica com a reserva da notícia
+        owner = f"api-{uuid4().hex}"
+        if not await repo.claim_publish(mongodb_id, owner, settings.PUBLISH_CLAIM_TTL):
+            raise HTTPException(
+                status_code=409,
+                detail="Notícia já publicada ou com publicação em andamento"
+            )
+
+        news = await repo.find_by_id(mongodb_id)
+        timings = StageTimings()
+        publisher = container.wordpress_publisher()
+        with timings.span("publish"):
+            # O publicador usa requests (bloqueante)
+            result = await run_in_threadpool(
+                publisher.publish_from_processed_news, news)
 
         if result.success:
-            repo.mark_as_published(mongodb_id, result.post_id, result.post_url)
+            await repo.mark_as_published(
+                mongodb_id, result.post_id, result.post_url, timings.as_dict())
             return {
                 "status": "published",
                 "mongodb_id": mongodb_id,
                 "wordpress_post_id": result.post_id,
-                "wordpress_url": result.post_url
+                "wordpress_url": result.post_url,
+                "timings": timings.as_dict()
             }
         else:
-            repo.mark_publish_error(mongodb_id, result.error)
+            await repo.mark_publish_error(mongodb_id, result.error)
+            await repo.release_publish_claim(mongodb_id, owner)
             raise HTTPException(
                 status_code=502,
                 detail=f"Erro ao publicar: {result.error}"
@@ -585,13 +773,16 @@ async def process_and_publish_batch(request: ProcessAndPublishBatchRequest):
             detail=f"URLs não suportadas: {unsupported_urls}"
         )
 
-    # Cria tasks
+    # Cria tasks (URLs repetidas ou já enfileiradas reaproveitam a task existente)
     task_ids = []
     for url in request.urls:
-        task = process_and_publish.delay(url, request.schema_name)
+        task_id, duplicate = await run_in_threadpool(
+            enqueue_unique, process_and_publish, url, request.schema_name, request.force,
+            priority=request.priority)
         task_ids.append({
             "url": url,
-            "task_id": task.id
+            "task_id": task_id,
+            "duplicate": duplicate
         })
 
     return {
@@ -602,6 +793,110 @@ async def process_and_publish_batch(request: ProcessAndPublishBatchRequest):
     }
 
 
+@app.get("/news", tags=["News"])
+async def list_news(
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    source: Optional[str] = None,
+    llm_status: Optional[str] = None,
+    published: Optional[bool] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    fields: str = "summary"
+):
+    """
+    Lista notícias armazenadas, da mais recente para a mais antiga
+
+    Paginação por cursor: envie o `next_cursor` da resposta para obter a
+    próxima página. O cursor é válido apenas com os mesmos filtros.
+
+    - fields: summary (padrão), ids ou full
+    - published: true (publicadas) ou false (não publicadas)
+    - created_from / created_to: intervalo de criação (ISO 8601)
+    """
+    try:
+        after = decode_cursor(cursor) if cursor else None
+        repo = container.async_news_repository()
+        items, has_more = await repo.list_news(
+            limit=limit,
+            after=after,
+            source=source,
+            llm_status=llm_status,
+            published=published,
+            created_from=created_from,
+            created_to=created_to,
+            fields=fields
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "count": len(items),
+        "has_more": has_more,
+        "next_cursor": encode_cursor(items[-1]) if has_more else None,
+        "items": items
+    }
+
+
+@app.get("/news/search", tags=["News"])
+async def search_news(
+    q: str = Query(..., min_length=2, max_length=200),
+    limit: int = Query(default=20, ge=1, le=50),
+    cursor: Optional[str] = None,
+    source: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None
+):
+    """
+    Busca textual nas notícias (título, subtítulo, resumo e conteúdo)
+
+    Resultados ordenados por relevância, com trecho destacado (<mark>).
+    Aceita "frases entre aspas" e -exclusões. Paginação por cursor: envie
+    o `next_cursor` da resposta para obter a próxima página.
+    """
+    cache_key = (q, limit, cursor, source, created_from, created_to)
+    cached = search_cache.get(cache_key)
+    if cached is not None:
+        return {**cached, "cached": True}
+
+    try:
+        after = decode_score_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    repo = container.async_news_repository()
+    items, has_more = await repo.search_news(
+        q,
+        limit=limit,
+        after=after,
+        source=source,
+        created_from=created_from,
+        created_to=created_to
+    )
+
+    terms = search_terms(q)
+    response = {
+        "query": q,
+        "count": len(items),
+        "has_more": has_more,
+        "next_cursor": encode_score_cursor(items[-1]) if has_more else None,
+        "items": [
+            {
+                "mongodb_id": item["_id"],
+                "title": item.get("title"),
+                "url": item.get("url"),
+                "source": item.get("source"),
+                "created_at": item.get("created_at"),
+                "score": round(item["score"], 4),
+                "snippet": build_snippet(item, terms)
+            }
+            for item in items
+        ]
+    }
+    search_cache.set(cache_key, response)
+    return {**response, "cached": False}
+
+
 @app.get("/publish/pending", tags=["WordPress"])
 async def list_pending_publications(limit: int = 50):
     """
@@ -610,8 +905,8 @@ async def list_pending_publications(limit: int = 50):
     Retorna notícias processadas com sucesso mas pendentes de publicação.
     """
 
-    repo = MongoNewsRepository()
-    pending = repo.find_pending_publish(limit=limit)
+    repo = container.async_news_repository()
+    pending = await repo.find_pending_publish(limit=limit, fields="summary")
 
     return {
         "total": len(pending),
@@ -630,7 +925,7 @@ async def list_pending_publications(limit: int = 50):
 
 
 @app.get("/publish/stats", tags=["WordPress"])
-async def get_publish_statistics():
+async def get_publish_statistics(exact: bool = False):
     """
     Retorna estatísticas de publicação
 
@@ -638,17 +933,178 @@ async def get_publish_statistics():
     - published: Notícias publicadas no WordPress
     - pending: Notícias pendentes de publicação
     - with_errors: Notícias com erro de publicação
+
+    Lê os contadores mantidos incrementalmente. Use `exact=true` para
+    recalcular a partir da coleção (consulta mais cara).
     """
 
-    repo = MongoNewsRepository()
-    stats = repo.get_publish_stats()
+    repo = container.async_news_repository()
+    stats = await repo.get_publish_stats(exact=exact)
 
     return {
         "stats": stats,
+        "exact": exact,
         "message": "Use /publish/batch com publish_pending=true para publicar pendentes"
     }
 
 
+@app.post("/publish/stats/reconcile", tags=["WordPress"])
+async def reconcile_publish_statistics():
+    """
+    Reconstrói os contadores de publicação a partir da coleção
+
+    Enfileira a task de reconciliação para corrigir desvios nos contadores.
+    """
+    task = reconcile_publish_stats.delay()
+
+    return {
+        "task_id": task.id,
+        "status": "queued",
+        "message": "Reconciliação dos contadores enfileirada"
+    }
+
+
+@app.get("/stats/pipeline", tags=["Stats"])
+async def get_pipeline_statistics(hours: int = 24, source: Optional[str] = None):
+    """
+    Retorna percentis (p50, p90, p99) de duração por etapa do pipeline
+
+    Etapas: fetch, parse, extract, clean, llm, persist, publish.
+    Agrupado por fonte, considerando notícias extraídas nas últimas `hours` horas.
+    """
+    if hours <= 0:
+        raise HTTPException(status_code=400, detail="hours deve ser positivo")
+
+    since = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+    repo = container.async_news_repository()
+    stats = await repo.get_pipeline_stats(since=since, source=source)
+
+    return {
+        "window_hours": hours,
+        "unit": "ms",
+        "sources": stats
+    }
+
+
+@app.get("/rates", tags=["Stats"])
+async def get_rate_limits():
+    """
+    Retorna os limites por minuto atuais do LLM e do WordPress
+
+    Com o controle adaptativo, inclui o último ajuste AIMD (motivo, chamadas,
+    erros, throttling e latência média do ciclo), a faixa permitida e a
+    profundidade atual das filas que dependem de cada serviço.
+    """
+    def collect():
+        rates = {}
+        for name, queues in RATE_QUEUES.items():
+            budget = container.rate_budget(name)
+            controller = container.rate_controller(name)
+            rates[name] = {
+                "per_minute": budget.per_minute,
+                "reserved_high": budget.reserved_high,
+                "adaptive": controller.status() if controller is not None else None,
+                "queues": queue_depths(queues)
+            }
+        return rates
+
+    return {
+        "adaptive_enabled": settings.ADAPTIVE_RATE_ENABLED,
+        "interval_seconds": settings.ADAPTIVE_RATE_INTERVAL,
+        "rates": await run_in_threadpool(collect)
+    }
+
+
+def _dead_letter_store():
+    """Registro de dead letters (503 se desativado)"""
+    dead_letters = container.dead_letters()
+    if dead_letters is None:
+        raise HTTPException(status_code=503, detail="Dead letters desativados (DEAD_LETTER_ENABLED)")
+    return dead_letters
+
+
+@app.get("/dead-letters", tags=["Dead Letters"])
+async def list_dead_letters(
+    failure: Optional[str] = Query(None, description=f"Classe da falha: {', '.join(FAILURE_CLASSES)}"),
+    quarantined: bool = Query(False, description="Apenas URLs ainda em quarentena"),
+    limit: int = Query(50, ge=1, le=500),
+    skip: int = Query(0, ge=0)
+):
+    """
+    Lista as URLs com falha definitiva, da mais recente para a mais antiga
+
+    Cada registro traz a classe da última falha, as falhas por classe,
+    o último erro, a última task e até quando a URL fica em quarentena.
+    """
+    dead_letters = _dead_letter_store()
+
+    def collect():
+        return dead_letters.counts(), dead_letters.list(
+            failure=failure, quarantined_only=quarantined, limit=limit, skip=skip)
+
+    counts, items = await run_in_threadpool(collect)
+    return {
+        "counts": counts,
+        "total": sum(counts.values()),
+        "items": items
+    }
+
+
+@app.get("/dead-letters/{entry_id}", tags=["Dead Letters"])
+async def get_dead_letter(entry_id: str):
+    """Detalha um registro de dead letter"""
+    entry = await run_in_threadpool(_dead_letter_store().get, entry_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Registro não encontrado")
+    return entry
+
+
+@app.delete("/dead-letters/{entry_id}", tags=["Dead Letters"])
+async def delete_dead_letter(entry_id: str):
+    """Remove um registro: a URL sai da quarentena e pode ser submetida de novo"""
+    entry = await run_in_threadpool(_dead_letter_store().release, entry_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Registro não encontrado")
+    return {"status": "deleted", "dead_letter_id": entry_id, "url": entry.get('url')}
+
+
+@app.delete("/dead-letters", tags=["Dead Letters"])
+async def purge_dead_letters(
+    failure: Optional[str] = Query(None, description="Apenas desta classe de falha"),
+    older_than_days: Optional[int] = Query(None, ge=0, description="Apenas com a última falha há mais de N dias")
+):
+    """Remove registros em massa (sem filtros, remove todos)"""
+    deleted = await run_in_threadpool(
+        _dead_letter_store().purge, failure=failure, older_than_days=older_than_days)
+    log.info(f"Dead letters removidos: {deleted}")
+    return {"status": "purged", "deleted": deleted}
+
+
+@app.post("/dead-letters/{entry_id}/requeue", tags=["Dead Letters"])
+async def requeue_dead_letter(
+    entry_id: str,
+    priority: Literal["high", "normal", "low"] = "normal"
+):
+    """
+    Remove a URL da quarentena e a envia de novo para processamento
+
+    Uma nova falha volta a registrá-la (as contagens recomeçam do zero).
+    """
+    entry = await run_in_threadpool(_dead_letter_store().release, entry_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Registro não encontrado")
+
+    task_id, duplicate = await run_in_threadpool(
+        enqueue_unique, process_news_url, entry['url'], entry.get('schema_name') or "g1",
+        priority=priority)
+    return TaskResponse(
+        task_id=task_id,
+        status="duplicate" if duplicate else "queued",
+        message=f"URL reenviada para processamento. Use /status/{task_id} para acompanhar."
+    )
+
+
 @app.get("/wordpress/health", tags=["WordPress"])
 async def wordpress_health():
     """
@@ -659,7 +1115,7 @@ async def wordpress_health():
     - plugin_active: Se o plugin Content Receiver está ativado
     - ready: Se tudo está pronto para publicar
     """
-    publisher = WordPressPublisherService()
+    publisher = container.wordpress_publisher()
     health = publisher.health_check()
 
     return {
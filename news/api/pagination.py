@@ -0,0 +1,81 @@
+"""
+Cursores opacos para paginação por chave (keyset)
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Dict, Tuple
+
+from bson import ObjectId
+
+
+def _encode(payload: Dict[str, Any]) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> Dict[str, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, ValueError) as e:
+        raise ValueError("Cursor inválido") from e
+    if not isinstance(payload, dict) or not ObjectId.is_valid(payload.get("i")):
+        raise ValueError("Cursor inválido")
+    return payload
+
+
+def encode_cursor(item: Dict[str, Any]) -> str:
+    """
+    Gera o cursor de continuação a partir do último item da página
+
+    Args:
+        item: Documento com '_id' e 'created_at'
+
+    Returns:
+        Token opaco (base64 urlsafe)
+    """
+    return _encode({"c": item["created_at"].isoformat(), "i": str(item["_id"])})
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Lê um cursor gerado por encode_cursor
+
+    Args:
+        cursor: Token opaco
+
+    Returns:
+        Tupla (created_at, _id) do último item da página anterior
+
+    Raises:
+        ValueError: Se o cursor for inválido
+    """
+    payload = _decode(cursor)
+    try:
+        return datetime.fromisoformat(payload["c"]), payload["i"]
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError("Cursor inválido") from e
+
+
+def encode_score_cursor(item: Dict[str, Any]) -> str:
+    """Gera o cursor de uma busca ordenada por relevância ('score', '_id')"""
+    return _encode({"s": item["score"], "i": str(item["_id"])})
+
+
+def decode_score_cursor(cursor: str) -> Tuple[float, str]:
+    """
+    Lê um cursor gerado por encode_score_cursor
+
+    Returns:
+        Tupla (score, _id) do último item da página anterior
+
+    Raises:
+        ValueError: Se o cursor for inválido
+    """
+    payload = _decode(cursor)
+    try:
+        return float(payload["s"]), payload["i"]
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError("Cursor inválido") from e
@@ -0,0 +1,96 @@
+"""
+Trechos destacados para os resultados da busca textual
+"""
+import html
+import re
+import unicodedata
+from typing import Any, Dict, List, Optional
+
+
+def search_terms(query: str) -> List[str]:
+    """
+    Extrai os termos positivos da consulta (ignora -exclusões)
+
+    Args:
+        query: Consulta no formato do $text do MongoDB
+
+    Returns:
+        Termos normalizados (sem acento, minúsculos)
+    """
+    terms = []
+    for token in re.findall(r'-?"[^"]+"|\S+', query):
+        if token.startswith('-'):
+            continue
+        token = token.strip('"')
+        terms.extend(_fold(word) for word in token.split() if len(word) > 1)
+    return terms
+
+
+def _fold(text: str) -> str:
+    """Remove acentos e caixa, preservando o comprimento do texto"""
+    return ''.join(unicodedata.normalize('NFD', char)[0].lower() for char in text)
+
+
+def build_snippet(
+    item: Dict[str, Any],
+    terms: List[str],
+    width: int = 200
+) -> Optional[str]:
+    """
+    Monta um trecho do texto ao redor do primeiro termo encontrado
+
+    Procura no resumo, no subtítulo e no conteúdo (nesta ordem). O texto é
+    escapado e os termos são marcados com <mark>.
+
+    Args:
+        item: Documento retornado pela busca
+        terms: Termos de search_terms()
+        width: Tamanho aproximado do trecho
+
+    Returns:
+        Trecho em HTML ou None
+    """
+    fallback = None
+    for field in ('summary', 'subtitle', 'content'):
+        text = item.get(field)
+        if not text:
+            continue
+        fallback = fallback or text
+
+        folded = _fold(text)
+        positions = [folded.find(term) for term in terms]
+        positions = [p for p in positions if p >= 0]
+        if positions:
+            start = max(0, min(positions) - width // 4)
+            return _highlight(text, terms, start, width)
+
+    if fallback:
+        return _highlight(fallback, terms, 0, width)
+    return None
+
+
+def _highlight(text: str, terms: List[str], start: int, width: int) -> str:
+    """Recorta o texto e marca as ocorrências dos termos"""
+    end = min(len(text), start + width)
+    fragment = text[start:end]
+    folded = _fold(fragment)
+
+    # Intervalos a marcar, sem sobreposição
+    spans = []
+    for term in terms:
+        for match in re.finditer(re.escape(term), folded):
+            spans.append((match.start(), match.end()))
+    spans.sort()
+
+    parts, cursor = [], 0
+    for span_start, span_end in spans:
+        if span_start < cursor:
+            continue
+        parts.append(html.escape(fragment[cursor:span_start]))
+        parts.append(f"<mark>{html.escape(fragment[span_start:span_end])}</mark>")
+        cursor = span_end
+    parts.append(html.escape(fragment[cursor:]))
+
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(text) else ""
+    return prefix + ''.join(parts).strip() + suffix
@@ -0,0 +1,55 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Cache LRU em memória com tamanho máximo e expiração por tempo
+
+    Thread-safe. Ao atingir o tamanho máximo, remove o item usado há
+    mais tempo; itens expirados são descartados na leitura.
+    """
+
+    def __init__(self, max_size: int = 256, ttl_seconds: float = 60):
+        """
+        Args:
+            max_size: Quantidade máxima de itens (0 desativa o cache)
+            ttl_seconds: Tempo de vida de cada item
+        """
+        self.max_size = max(0, max_size)
+        self.ttl_seconds = ttl_seconds
+        self._items: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Retorna o valor em cache (ou None se ausente/expirado)"""
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Armazena um valor, removendo o menos usado se necessário"""
+        if self.max_size == 0:
+            return
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove todos os itens"""
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
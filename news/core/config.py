@@ -14,21 +14,120 @@ class Settings:
     # MongoDB
     MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017/")
     MONGODB_DB = os.getenv("MONGODB_DB", "news_feed_db")
+    MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", "50"))
+    MONGODB_MIN_POOL_SIZE = int(os.getenv("MONGODB_MIN_POOL_SIZE", "0"))
+    MONGODB_ENSURE_INDEXES = os.getenv(
+        "MONGODB_ENSURE_INDEXES", "true").lower() == "true"
 
-    # Redis/Celery
-    REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-    CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", REDIS_URL)
+    # Corpo das notícias: inline (no documento) ou split (coleção news_bodies)
+    NEWS_BODY_STORAGE = os.getenv("NEWS_BODY_STORAGE", "inline")
+    NEWS_BODY_COMPRESSION = os.getenv("NEWS_BODY_COMPRESSION", "none")
+
+    # HTTP (sessões compartilhadas do scraper, LLM e WordPress)
+    HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+    HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "20"))
+
+    # Redis/Celery: sem REDIS_URL, travas, orçamentos e lotes usam o Redis do
+    # broker (não caem para o estado local de cada processo)
+    CELERY_BROKER_URL = os.getenv(
+        "CELERY_BROKER_URL", os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+    REDIS_URL = os.getenv("REDIS_URL", CELERY_BROKER_URL)
     CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", REDIS_URL)
+    # Compressão dos resultados no backend: "", "zlib", "gzip" ou "bzip2"
+    CELERY_RESULT_COMPRESSION = os.getenv("CELERY_RESULT_COMPRESSION", "")
 
     # LLM
     LLM_API_URL = os.getenv("LM_API_URL", "http://localhost:1234/api/v1/chat")
     LLM_MODEL = os.getenv("LM_MODEL", "qwen/qwen3-coder-next")
     LLM_API_TOKEN = os.getenv("LM_API_TOKEN", "")
 
+    # Backfill (pipeline em lote)
+    BATCH_FETCH_CONCURRENCY = int(os.getenv("BATCH_FETCH_CONCURRENCY", "8"))
+    BATCH_PARSE_WORKERS = int(os.getenv("BATCH_PARSE_WORKERS", "2"))
+    BATCH_LLM_CONCURRENCY = int(os.getenv("BATCH_LLM_CONCURRENCY", "2"))
+    BATCH_WRITE_SIZE = int(os.getenv("BATCH_WRITE_SIZE", "50"))
+
+    # Orçamentos de chamadas por minuto (compartilhados entre workers via Redis)
+    # com parte reservada para a faixa de prioridade alta
+    LLM_RATE_PER_MINUTE = int(os.getenv("LLM_RATE_PER_MINUTE", "10"))
+    LLM_RATE_RESERVED_HIGH = int(os.getenv("LLM_RATE_RESERVED_HIGH", "3"))
+    WORDPRESS_RATE_PER_MINUTE = int(os.getenv("WORDPRESS_RATE_PER_MINUTE", "30"))
+    WORDPRESS_RATE_RESERVED_HIGH = int(os.getenv("WORDPRESS_RATE_RESERVED_HIGH", "10"))
+    RATE_BUDGET_MAX_WAIT = float(os.getenv("RATE_BUDGET_MAX_WAIT", "120"))
+
+    # Controle adaptativo (AIMD) dos orçamentos: o limite por minuto parte do
+    # valor acima e varia entre MIN e MAX conforme latência, erros e filas
+    ADAPTIVE_RATE_ENABLED = os.getenv("ADAPTIVE_RATE_ENABLED", "true").lower() == "true"
+    ADAPTIVE_RATE_INTERVAL = int(os.getenv("ADAPTIVE_RATE_INTERVAL", "60"))
+    ADAPTIVE_RATE_INCREASE = int(os.getenv("ADAPTIVE_RATE_INCREASE", "1"))
+    ADAPTIVE_RATE_DECREASE = float(os.getenv("ADAPTIVE_RATE_DECREASE", "0.5"))
+    LLM_RATE_MIN = int(os.getenv("LLM_RATE_MIN", "2"))
+    LLM_RATE_MAX = int(os.getenv("LLM_RATE_MAX", "60"))
+    LLM_LATENCY_TARGET = float(os.getenv("LLM_LATENCY_TARGET", "30"))
+    WORDPRESS_RATE_MIN = int(os.getenv("WORDPRESS_RATE_MIN", "5"))
+    WORDPRESS_RATE_MAX = int(os.getenv("WORDPRESS_RATE_MAX", "120"))
+    WORDPRESS_LATENCY_TARGET = float(os.getenv("WORDPRESS_LATENCY_TARGET", "5"))
+
+    # Métricas Prometheus (requer prometheus_client); cada worker expõe as
+    # suas em METRICS_PORT (0 desativa) e a API em /metrics
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    METRICS_PORT = int(os.getenv("METRICS_PORT", "9100"))
+
+    # Deduplicação no enfileiramento (trava por URL no Redis)
+    DEDUP_ENABLED = os.getenv("DEDUP_ENABLED", "true").lower() == "true"
+    DEDUP_ENQUEUE_TTL = int(os.getenv("DEDUP_ENQUEUE_TTL", "600"))
+    DEDUP_RUNNING_TTL = int(os.getenv("DEDUP_RUNNING_TTL", "360"))
+
+    # Checkpoints por etapa: retries retomam da primeira etapa não concluída
+    CHECKPOINTS_ENABLED = os.getenv("CHECKPOINTS_ENABLED", "true").lower() == "true"
+    CHECKPOINT_TTL_HOURS = int(os.getenv("CHECKPOINT_TTL_HOURS", "24"))
+
+    # Dead letters: URLs com falha definitiva ficam em quarentena (novas
+    # submissões terminam sem baixar a página)
+    DEAD_LETTER_ENABLED = os.getenv("DEAD_LETTER_ENABLED", "true").lower() == "true"
+    DEAD_LETTER_QUARANTINE_HOURS = int(os.getenv("DEAD_LETTER_QUARANTINE_HOURS", "72"))
+    DEAD_LETTER_MAX_ATTEMPTS = int(os.getenv("DEAD_LETTER_MAX_ATTEMPTS", "3"))
+    DEAD_LETTER_TTL_DAYS = int(os.getenv("DEAD_LETTER_TTL_DAYS", "30"))
+
+    # Gravação adiada (write-behind) do pipeline de backfill
+    WRITE_BEHIND_MAX_BATCH = int(os.getenv("WRITE_BEHIND_MAX_BATCH", "100"))
+    WRITE_BEHIND_MAX_DELAY = float(os.getenv("WRITE_BEHIND_MAX_DELAY", "2.0"))
+    BATCH_WRITE_MODE = os.getenv("BATCH_WRITE_MODE", "live")
+
+    # Retenção: arquivamento de publicadas e TTL de falhas nunca publicadas
+    RETENTION_ARCHIVE_AFTER_DAYS = int(os.getenv("RETENTION_ARCHIVE_AFTER_DAYS", "90"))
+    RETENTION_ARCHIVE_TARGET = os.getenv("RETENTION_ARCHIVE_TARGET", "collection")
+    RETENTION_ARCHIVE_DIR = os.getenv("RETENTION_ARCHIVE_DIR", "archive")
+    RETENTION_FAILED_TTL_DAYS = int(os.getenv("RETENTION_FAILED_TTL_DAYS", "30"))
+    RETENTION_BATCH_SIZE = int(os.getenv("RETENTION_BATCH_SIZE", "200"))
+    RETENTION_BATCH_PAUSE = float(os.getenv("RETENTION_BATCH_PAUSE", "0.5"))
+    RETENTION_MAX_BATCHES = int(os.getenv("RETENTION_MAX_BATCHES", "50"))
+
+    # Busca textual (cache LRU em memória por processo da API)
+    SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "256"))
+    SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "60"))
+
+    # Dispatcher de publicação (change stream com fallback para polling)
+    PUBLISH_DISPATCHER_MODE = os.getenv("PUBLISH_DISPATCHER_MODE", "auto")
+    PUBLISH_DISPATCHER_POLL_INTERVAL = float(
+        os.getenv("PUBLISH_DISPATCHER_POLL_INTERVAL", "5"))
+    PUBLISH_DISPATCHER_BATCH_SIZE = int(
+        os.getenv("PUBLISH_DISPATCHER_BATCH_SIZE", "100"))
+    # Reserva de publicação por notícia (dispatcher, varredura, tasks e API):
+    # cobre a espera na fila e a chamada ao WordPress
+    PUBLISH_CLAIM_TTL = int(os.getenv("PUBLISH_CLAIM_TTL", "900"))
+
+    # Tarefas periódicas (beat): a agenda fica em BEAT_SCHEDULE_FILE
+    DISCOVERY_MAX_ITEMS = int(os.getenv("DISCOVERY_MAX_ITEMS", "50"))
+    DISCOVERY_PRIORITY = os.getenv("DISCOVERY_PRIORITY", "normal")
+    PUBLISH_SWEEP_BATCH = int(os.getenv("PUBLISH_SWEEP_BATCH", "50"))
+    PERIODIC_LOCK_TTL = int(os.getenv("PERIODIC_LOCK_TTL", "300"))
+
     # Paths
     BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     SCHEMAS_DIR = os.path.join(BASE_DIR, "schemas")
     LOGS_DIR = os.path.join(BASE_DIR, "logs")
+    BEAT_SCHEDULE_FILE = os.getenv("BEAT_SCHEDULE_FILE", os.path.join(BASE_DIR, "beat_schedule.yaml"))
 
     @classmethod
     def get_schema_path(cls, schema_name: str) -> str:
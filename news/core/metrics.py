@@ -0,0 +1,295 @@
+"""
+Métricas no formato Prometheus: filas, tasks, workers e pools de conexão
+
+Requer o pacote prometheus_client; sem ele as funções deste módulo não
+fazem nada e o /metrics da API responde 503.
+
+Com PROMETHEUS_MULTIPROC_DIR definido (worker prefork), cada processo grava
+suas métricas em arquivos nesse diretório e a exportação soma os processos.
+O diretório deve começar vazio a cada inicialização do worker.
+"""
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import prometheus_client
+    from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+    from prometheus_client.core import GaugeMetricFamily
+except ImportError:
+    prometheus_client = None
+
+try:
+    from pymongo import monitoring
+except ImportError:
+    monitoring = None
+
+try:
+    from core.logging import log
+except ImportError:
+    from loguru import logger as log
+
+
+AVAILABLE = prometheus_client is not None
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+# Durações: de publicações (segundos) a chamadas ao LLM e backfills (minutos)
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+# Status de resultado (sem exceção) que contam como erro
+_ERROR_STATUSES = ("error", "processing_error", "publish_error")
+
+if AVAILABLE:
+    TASK_DURATION = Histogram(
+        "news_task_duration_seconds", "Duração da execução das tasks",
+        ["task"], buckets=LATENCY_BUCKETS)
+    TASK_QUEUE_WAIT = Histogram(
+        "news_task_queue_wait_seconds", "Tempo entre o enfileiramento e o início da task",
+        ["task", "queue"], buckets=LATENCY_BUCKETS)
+    TASKS = Counter(
+        "news_tasks", "Tasks finalizadas por resultado (success, error, failure, retry)",
+        ["task", "outcome"])
+    LLM_CALLS = Counter(
+        "news_llm_calls", "Chamadas ao LLM por status (timeout e unavailable usam fallback)",
+        ["status"])
+    ACTIVE_TASKS = Gauge(
+        "news_worker_active_tasks", "Tasks em execução",
+        ["worker"], multiprocess_mode="livesum")
+    WORKER_CONCURRENCY = Gauge(
+        "news_worker_concurrency", "Concorrência configurada do worker",
+        ["worker"], multiprocess_mode="livemax")
+    MONGO_POOL = Gauge(
+        "news_mongo_pool_connections", "Conexões do pool do MongoDB (open, in_use)",
+        ["state"], multiprocess_mode="livesum")
+    MONGO_CHECKOUT_FAILURES = Counter(
+        "news_mongo_pool_checkout_failures", "Falhas ao obter conexão do pool do MongoDB",
+        ["reason"])
+    HTTP_POOL = Gauge(
+        "news_http_pool_connections", "Conexões da sessão HTTP por host (created, idle)",
+        ["host", "state"], multiprocess_mode="livesum")
+
+# Início das tasks em execução neste processo, por task_id
+_started: Dict[str, float] = {}
+_started_lock = threading.Lock()
+
+
+def task_started(
+    task_id: str,
+    task_name: str,
+    worker: Optional[str],
+    queue: Optional[str],
+    enqueued_at: Optional[float]
+) -> None:
+    """
+    Registra o início de uma task (sinal task_prerun)
+
+    Args:
+        task_id: ID da task
+        task_name: Nome da task
+        worker: Hostname do worker
+        queue: Fila de onde a task veio
+        enqueued_at: Timestamp do enfileiramento (header enqueued_at)
+    """
+    if not AVAILABLE:
+        return
+    now = time.time()
+    with _started_lock:
+        _started[task_id] = now
+    ACTIVE_TASKS.labels(worker or "unknown").inc()
+    if enqueued_at:
+        TASK_QUEUE_WAIT.labels(task_name, queue or "unknown").observe(
+            max(0.0, now - float(enqueued_at)))
+
+
+def task_finished(
+    task_id: str,
+    task_name: str,
+    worker: Optional[str],
+    state: Optional[str],
+    retval: Any = None
+) -> None:
+    """
+    Registra o fim de uma task (sinal task_postrun)
+
+    Args:
+        task_id: ID da task
+        task_name: Nome da task
+        worker: Hostname do worker
+        state: Estado final (SUCCESS, FAILURE, RETRY...)
+        retval: Retorno da task (status de erro contam como 'error')
+    """
+    if not AVAILABLE:
+        return
+    with _started_lock:
+        started = _started.pop(task_id, None)
+    if started is not None:
+        ACTIVE_TASKS.labels(worker or "unknown").dec()
+        TASK_DURATION.labels(task_name).observe(time.time() - started)
+
+    if state == "SUCCESS":
+        failed = isinstance(retval, dict) and retval.get("status") in _ERROR_STATUSES
+        outcome = "error" if failed else "success"
+    else:
+        outcome = (state or "unknown").lower()
+    TASKS.labels(task_name, outcome).inc()
+
+
+def observe_llm(status: str) -> None:
+    """Conta uma chamada ao LLM pelo status (error:<detalhe> vira 'error')"""
+    if AVAILABLE:
+        LLM_CALLS.labels((status or "unknown").split(":", 1)[0]).inc()
+
+
+def set_worker_concurrency(worker: str, concurrency: int) -> None:
+    """Registra a concorrência do worker (utilização = ativas / concorrência)"""
+    if AVAILABLE:
+        WORKER_CONCURRENCY.labels(worker).set(concurrency)
+
+
+def observe_http_pool(session) -> None:
+    """
+    Atualiza as conexões da sessão HTTP (requests) por host
+
+    Args:
+        session: requests.Session com HTTPAdapter (urllib3)
+    """
+    if not AVAILABLE or session is None:
+        return
+    try:
+        for adapter in session.adapters.values():
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                HTTP_POOL.labels(pool.host, "created").set(pool.num_connections)
+                HTTP_POOL.labels(pool.host, "idle").set(pool.pool.qsize() if pool.pool else 0)
+    except Exception as e:
+        log.debug(f"Falha ao ler o pool HTTP: {e}")
+
+
+if AVAILABLE and monitoring is not None:
+    class MongoPoolMetrics(monitoring.ConnectionPoolListener):
+        """Listener do pymongo que acompanha as conexões do pool"""
+
+        def pool_created(self, event):
+            pass
+
+        def pool_ready(self, event):
+            pass
+
+        def pool_cleared(self, event):
+            pass
+
+        def pool_closed(self, event):
+            pass
+
+        def connection_created(self, event):
+            MONGO_POOL.labels("open").inc()
+
+        def connection_ready(self, event):
+            pass
+
+        def connection_closed(self, event):
+            MONGO_POOL.labels("open").dec()
+
+        def connection_check_out_started(self, event):
+            pass
+
+        def connection_check_out_failed(self, event):
+            MONGO_CHECKOUT_FAILURES.labels(str(event.reason)).inc()
+
+        def connection_checked_out(self, event):
+            MONGO_POOL.labels("in_use").inc()
+
+        def connection_checked_in(self, event):
+            MONGO_POOL.labels("in_use").dec()
+
+
+def mongo_event_listeners() -> list:
+    """Listeners para o MongoClient/AsyncIOMotorClient (vazio sem prometheus_client)"""
+    if AVAILABLE and monitoring is not None:
+        return [MongoPoolMetrics()]
+    return []
+
+
+class QueueCollector:
+    """Coletor da profundidade e da idade da mensagem mais antiga por fila"""
+
+    def __init__(self, stats: Callable[[], Dict[str, Tuple[Optional[int], Optional[float]]]]):
+        """
+        Args:
+            stats: Retorna {fila: (mensagens, idade em segundos)} na coleta
+        """
+        self._stats = stats
+
+    def collect(self):
+        depth = GaugeMetricFamily(
+            "news_queue_depth", "Mensagens aguardando na fila", labels=["queue"])
+        age = GaugeMetricFamily(
+            "news_queue_oldest_age_seconds", "Idade da mensagem mais antiga da fila",
+            labels=["queue"])
+        for queue, (messages, oldest) in self._stats().items():
+            if messages is not None:
+                depth.add_metric([queue], messages)
+            age.add_metric([queue], oldest or 0.0)
+        yield depth
+        yield age
+
+
+def _registry():
+    """Registro a exportar: agregado dos processos ou o global"""
+    if MULTIPROCESS:
+        from prometheus_client import multiprocess
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return prometheus_client.REGISTRY
+
+
+def render(queue_stats: Optional[Callable] = None) -> Tuple[bytes, str]:
+    """
+    Gera a exposição em texto das métricas
+
+    Args:
+        queue_stats: Fonte das métricas de fila, coletadas no momento
+
+    Returns:
+        Tupla (conteúdo, content type)
+    """
+    payload = prometheus_client.generate_latest(_registry())
+    if queue_stats is not None:
+        queues = CollectorRegistry(auto_describe=True)
+        queues.register(QueueCollector(queue_stats))
+        payload += prometheus_client.generate_latest(queues)
+    return payload, prometheus_client.CONTENT_TYPE_LATEST
+
+
+def start_exporter(port: int) -> bool:
+    """
+    Expõe as métricas do worker em um servidor HTTP (GET /metrics)
+
+    Args:
+        port: Porta do servidor
+
+    Returns:
+        True se o servidor foi iniciado
+    """
+    if not AVAILABLE:
+        log.warning("prometheus_client não instalado: métricas do worker desativadas")
+        return False
+    try:
+        prometheus_client.start_http_server(port, registry=_registry())
+        log.info(f"Métricas do worker em :{port}/metrics")
+        return True
+    except OSError as e:
+        log.error(f"Não foi possível expor métricas na porta {port}: {e}")
+        return False
+
+
+def mark_process_dead(pid: int) -> None:
+    """Descarta os gauges 'live' de um processo encerrado (modo multiprocesso)"""
+    if AVAILABLE and MULTIPROCESS:
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(pid)
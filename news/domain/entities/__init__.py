@@ -1,4 +1,9 @@
 from .news_article import NewsArticle
 from .llm_result import LLMResult
+from .freshness_policy import FreshnessPolicy
+from .stage_timings import StageTimings, PIPELINE_STAGES
+from .scrape_failure import ScrapeError, FAILURE_CLASSES, PERMANENT_FAILURES
 
-__all__ = ['NewsArticle', 'LLMResult']
+__all__ = ['NewsArticle', 'LLMResult', 'FreshnessPolicy',
+           'StageTimings', 'PIPELINE_STAGES',
+           'ScrapeError', 'FAILURE_CLASSES', 'PERMANENT_FAILURES']
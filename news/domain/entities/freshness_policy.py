@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any
+
+
+@dataclass
+class FreshnessPolicy:
+    """Política de frescor para reaproveitar notícias já processadas"""
+    max_age_seconds: int = 0
+    reuse_unchanged_summary: bool = True
+
+    @classmethod
+    def from_schema(cls, schema: Optional[Dict[str, Any]]) -> "FreshnessPolicy":
+        """
+        Cria a política a partir da seção 'freshness' do schema YAML
+
+        Args:
+            schema: Schema carregado (ou None)
+
+        Returns:
+            FreshnessPolicy configurada (desativada se não houver seção)
+        """
+        config = (schema or {}).get('freshness') or {}
+        return cls(
+            max_age_seconds=int(config.get('max_age_minutes', 0)) * 60,
+            reuse_unchanged_summary=bool(
+                config.get('reuse_unchanged_summary', True))
+        )
+
+    def is_fresh(self, processed_at: Optional[datetime], now: Optional[datetime] = None) -> bool:
+        """Verifica se um processamento ainda está dentro da idade máxima"""
+        if self.max_age_seconds <= 0 or processed_at is None:
+            return False
+        # PyMongo devolve datetimes ingênuos (UTC) por padrão
+        if processed_at.tzinfo is None:
+            processed_at = processed_at.replace(tzinfo=timezone.utc)
+        now = now or datetime.now(timezone.utc)
+        return (now - processed_at).total_seconds() <= self.max_age_seconds
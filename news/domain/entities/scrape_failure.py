@@ -0,0 +1,42 @@
+from typing import Optional
+
+# Classes de falha de uma URL
+# - not_found: página removida (404, 410)
+# - blocked: paywall ou acesso negado (401, 402, 403, 451)
+# - invalid_content: seletores do schema não encontram a notícia (validação)
+# - unsupported: nenhuma fonte do scraper atende a URL
+# - transient: timeout, falha de conexão, 429 ou 5xx
+# - exhausted: a task esgotou as tentativas por outra exceção
+PERMANENT_FAILURES = ("not_found", "blocked", "invalid_content", "unsupported")
+FAILURE_CLASSES = PERMANENT_FAILURES + ("transient", "exhausted")
+
+
+class ScrapeError(Exception):
+    """Falha classificada ao extrair uma notícia"""
+
+    def __init__(self, failure: str, message: str, status_code: Optional[int] = None):
+        """
+        Args:
+            failure: Classe da falha (FAILURE_CLASSES)
+            message: Descrição do erro
+            status_code: Status HTTP da página (se houver)
+        """
+        super().__init__(message)
+        self.failure = failure
+        self.status_code = status_code
+
+    @property
+    def permanent(self) -> bool:
+        """Uma nova tentativa teria o mesmo resultado"""
+        return self.failure in PERMANENT_FAILURES
+
+    @classmethod
+    def from_status(cls, status_code: int, url: str) -> "ScrapeError":
+        """Classifica uma resposta HTTP de erro"""
+        if status_code in (404, 410):
+            failure = "not_found"
+        elif status_code in (401, 402, 403, 451):
+            failure = "blocked"
+        else:
+            failure = "transient"
+        return cls(failure, f"HTTP {status_code} ao acessar {url}", status_code)
@@ -0,0 +1,41 @@
+import time
+from contextlib import contextmanager
+from typing import Optional, Dict, Iterator
+
+# Etapas do pipeline, na ordem em que são executadas
+PIPELINE_STAGES = ("fetch", "parse", "extract", "clean",
+                   "llm", "persist", "publish")
+
+
+class StageTimings:
+    """Coleta a duração (em milissegundos) de cada etapa do pipeline"""
+
+    def __init__(self, spans: Optional[Dict[str, float]] = None):
+        self._spans: Dict[str, float] = dict(spans or {})
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """Mede o bloco e acumula a duração na etapa informada"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, (time.perf_counter() - started) * 1000)
+
+    def add(self, stage: str, duration_ms: float) -> None:
+        """Acumula uma duração já medida em uma etapa"""
+        self._spans[stage] = round(self._spans.get(stage, 0.0) + duration_ms, 2)
+
+    def merge(self, spans: Dict[str, float]) -> None:
+        """Incorpora durações medidas em outro processo ou thread"""
+        for stage, duration_ms in spans.items():
+            self.add(stage, duration_ms)
+
+    def as_dict(self) -> Dict[str, float]:
+        """Retorna as durações por etapa"""
+        return dict(self._spans)
+
+    @property
+    def total_ms(self) -> float:
+        """Soma das durações registradas"""
+        return round(sum(self._spans.values()), 2)
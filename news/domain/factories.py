@@ -1,6 +1,12 @@
 from typing import Optional
-from domain.interfaces import ScraperInterface, NewsRepositoryInterface, LLMServiceInterface
-from domain.usecases import ProcessNewsUseCase
+from domain.entities import FreshnessPolicy
+from domain.interfaces import (
+    ScraperInterface,
+    NewsRepositoryInterface,
+    LLMServiceInterface,
+    CheckpointStoreInterface
+)
+from domain.usecases import ProcessNewsUseCase, ProcessNewsBatchUseCase
 
 
 class UseCaseFactory:
@@ -11,7 +17,10 @@ class UseCaseFactory:
         schema_name: str = "g1",
         scraper: Optional[ScraperInterface] = None,
         repository: Optional[NewsRepositoryInterface] = None,
-        llm_service: Optional[LLMServiceInterface] = None
+        llm_service: Optional[LLMServiceInterface] = None,
+        write_mode: str = "live",
+        priority: str = "normal",
+        checkpoints: Optional[CheckpointStoreInterface] = None
     ) -> ProcessNewsUseCase:
         """
         Cria um ProcessNewsUseCase com dependências
@@ -21,29 +30,105 @@ class UseCaseFactory:
             scraper: Scraper customizado (opcional)
             repository: Repository customizado (opcional)
             llm_service: LLM Service customizado (opcional)
+            write_mode: 'live' (gravação imediata) ou 'backfill' (gravação
+                adiada em lote, write-behind)
+            priority: Faixa da task; define o orçamento de chamadas ao LLM
+            checkpoints: Checkpoints por etapa (padrão: os do container,
+                se habilitados)
 
         Returns:
             ProcessNewsUseCase configurado
         """
+        # Dependências padrão vêm do container de recursos do processo
+        # (scraper por schema, cliente MongoDB e sessão HTTP compartilhados)
+        from infra.resource_container import container
+
         # Scraper padrão: G1 (passa schema_name para configuração)
         if scraper is None:
-            from scraper.g1_scraper import G1Scraper
-            scraper = G1Scraper(schema_name=schema_name)
+            scraper = container.scraper(schema_name)
 
-        # Repository padrão: MongoDB
+        # Repository padrão: MongoDB (com buffer de gravação no backfill)
         if repository is None:
-            from infra.mongo_news_repository import MongoNewsRepository
-            repository = MongoNewsRepository()
-
-        # LLM Service padrão
+            if write_mode == "backfill":
+                repository = container.write_behind_repository()
+            elif write_mode == "live":
+                repository = container.news_repository()
+            else:
+                raise ValueError(f"Modo de gravação desconhecido: {write_mode}")
+
+        # LLM Service padrão, limitado pelo orçamento da faixa de prioridade
         if llm_service is None:
-            from services.llm_service_adapter import LLMServiceAdapter
-            llm_service = LLMServiceAdapter()
+            from core.config import settings
+            from infra.rate_budget import BudgetedLLMService
+            llm_service = BudgetedLLMService(
+                container.llm_service(),
+                container.rate_budget("llm"),
+                priority=priority,
+                max_wait=settings.RATE_BUDGET_MAX_WAIT
+            )
+
+        # Checkpoints por etapa: retries da mesma task retomam de onde pararam
+        if checkpoints is None:
+            checkpoints = container.checkpoint_store()
+
+        # Política de frescor definida na seção 'freshness' do schema
+        freshness_policy = FreshnessPolicy.from_schema(
+            getattr(scraper, 'schema', None))
 
         return ProcessNewsUseCase(
             scraper=scraper,
             llm_service=llm_service,
-            repository=repository
+            repository=repository,
+            freshness_policy=freshness_policy,
+            checkpoints=checkpoints
+        )
+
+    @staticmethod
+    def create_process_news_batch_usecase(
+        schema_name: str = "g1",
+        fetch_concurrency: Optional[int] = None,
+        parse_workers: Optional[int] = None,
+        llm_concurrency: Optional[int] = None,
+        write_batch_size: Optional[int] = None
+    ) -> ProcessNewsBatchUseCase:
+        """
+        Cria um ProcessNewsBatchUseCase para backfills
+
+        Args:
+            schema_name: Nome do schema para o scraper
+            fetch_concurrency: Downloads simultâneos (padrão: settings)
+            parse_workers: Processos de parsing (padrão: settings)
+            llm_concurrency: Chamadas simultâneas ao LLM (padrão: settings)
+            write_batch_size: Documentos por bulk write (padrão: settings)
+
+        Returns:
+            ProcessNewsBatchUseCase configurado
+        """
+        from core.config import settings
+        from infra.rate_budget import BudgetedLLMService
+        from infra.resource_container import container
+
+        def pick(value, default):
+            return default if value is None else value
+
+        # Backfills usam a faixa baixa: a reserva da faixa alta fica livre
+        llm_service = BudgetedLLMService(
+            container.llm_service(),
+            container.rate_budget("llm"),
+            priority="low",
+            max_wait=settings.RATE_BUDGET_MAX_WAIT
+        )
+
+        return ProcessNewsBatchUseCase(
+            scraper=container.scraper(schema_name),
+            llm_service=llm_service,
+            repository=container.news_repository(),
+            fetch_concurrency=pick(
+                fetch_concurrency, settings.BATCH_FETCH_CONCURRENCY),
+            parse_workers=pick(parse_workers, settings.BATCH_PARSE_WORKERS),
+            llm_concurrency=pick(
+                llm_concurrency, settings.BATCH_LLM_CONCURRENCY),
+            write_batch_size=pick(write_batch_size, settings.BATCH_WRITE_SIZE)
         )
 
 
@@ -51,6 +136,7 @@ class ScraperFactory:
     """Factory para criar scrapers baseado na URL"""
 
     _scrapers = {}
+    _instances = {}
 
     @classmethod
     def register(cls, scraper_class):
@@ -77,7 +163,10 @@ class ScraperFactory:
             # Adicione outros scrapers aqui
 
         for source_name, scraper_class in cls._scrapers.items():
-            scraper = scraper_class()
+            # Reaproveita a instância (evita recarregar o YAML a cada validação)
+            if source_name not in cls._instances:
+                cls._instances[source_name] = scraper_class()
+            scraper = cls._instances[source_name]
             if scraper.can_handle(url):
                 return scraper
 
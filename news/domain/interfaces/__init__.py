@@ -1,11 +1,21 @@
 from domain.entities import NewsArticle, LLMResult
 from .scraper_interface import ScraperInterface
-from .repository_interface import NewsRepositoryInterface, LLMServiceInterface
+from .repository_interface import (
+    NewsRepositoryInterface,
+    AsyncNewsRepositoryInterface,
+    LLMServiceInterface,
+    RateBudgetExceeded
+)
+from .checkpoint_interface import CheckpointStoreInterface, CHECKPOINT_STAGES
 
 __all__ = [
     'ScraperInterface',
     'NewsArticle',
     'NewsRepositoryInterface',
+    'AsyncNewsRepositoryInterface',
     'LLMServiceInterface',
-    'LLMResult'
+    'LLMResult',
+    'RateBudgetExceeded',
+    'CheckpointStoreInterface',
+    'CHECKPOINT_STAGES'
 ]
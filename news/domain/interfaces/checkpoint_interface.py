@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Dict, Any, Iterable
+
+# Etapas concluídas de uma task, na ordem do pipeline
+CHECKPOINT_STAGES = ("scraped", "summarised", "persisted", "published")
+
+
+class CheckpointStoreInterface(ABC):
+    """
+    Interface para checkpoints por etapa de uma task
+
+    Um retry da mesma task (mesmo task_id) retoma da primeira etapa ainda
+    não concluída em vez de repetir download, LLM e publicação.
+    """
+
+    @abstractmethod
+    def load(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Busca o checkpoint da task
+
+        Args:
+            task_id: ID da task
+
+        Returns:
+            Última etapa concluída ('stage') e os dados salvos, ou None
+        """
+        pass
+
+    @abstractmethod
+    def save(
+        self,
+        task_id: str,
+        stage: str,
+        data: Optional[Dict[str, Any]] = None,
+        drop: Iterable[str] = ()
+    ) -> None:
+        """
+        Registra a conclusão de uma etapa
+
+        Args:
+            task_id: ID da task
+            stage: Etapa concluída (CHECKPOINT_STAGES)
+            data: Dados necessários para retomar das etapas seguintes
+            drop: Campos de etapas anteriores que não são mais necessários
+        """
+        pass
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Set, Tuple
 
 from domain.entities import LLMResult
 
@@ -50,7 +51,7 @@ class NewsRepositoryInterface(ABC):
     @abstractmethod
     def upsert(self, url: str, news_data: Dict[str, Any]) -> str:
         """
-        Insere ou atualiza uma notícia
+        Insere ou atualiza uma notícia (operação atômica por URL)
 
         Args:
             url: URL da notícia (chave única)
@@ -62,10 +63,123 @@ class NewsRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def list_recent(self, limit: int = 50) -> List[Dict[str, Any]]:
-        """Lista as notícias mais recentes"""
+    def upsert_many(self, news_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Insere ou atualiza várias notícias em uma única operação em lote
+
+        Args:
+            news_list: Lista de notícias (a chave única é o campo 'url')
+
+        Returns:
+            Dicionário com contagens de inseridas/atualizadas e erros
+        """
+        pass
+
+    @abstractmethod
+    def find_existing_urls(self, urls: List[str]) -> Set[str]:
+        """
+        Filtra as URLs que já estão no repositório
+
+        Args:
+            urls: URLs candidatas
+
+        Returns:
+            Conjunto das URLs já existentes
+        """
+        pass
+
+    @abstractmethod
+    def list_recent(self, limit: int = 50, fields: str = "full") -> List[Dict[str, Any]]:
+        """Lista as notícias mais recentes (fields: full, summary ou ids)"""
+        pass
+
+
+class AsyncNewsRepositoryInterface(ABC):
+    """
+    Interface assíncrona do repositório de notícias
+
+    Usada pelos endpoints da API (event loop); os workers Celery usam a
+    versão síncrona (NewsRepositoryInterface).
+    """
+
+    @abstractmethod
+    async def find_by_id(self, mongodb_id: str, fields: str = "full") -> Optional[Dict[str, Any]]:
+        """Busca notícia pelo ID (fields: full, summary ou ids)"""
+        pass
+
+    @abstractmethod
+    async def list_news(
+        self,
+        limit: int = 50,
+        after: Optional[Tuple[datetime, str]] = None,
+        source: Optional[str] = None,
+        llm_status: Optional[str] = None,
+        published: Optional[bool] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        fields: str = "summary"
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Lista notícias com paginação por chave (created_at, _id)"""
         pass
 
+    @abstractmethod
+    async def search_news(
+        self,
+        query: str,
+        limit: int = 20,
+        after: Optional[Tuple[float, str]] = None,
+        source: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Busca textual ordenada por relevância, paginada por (score, _id)"""
+        pass
+
+    @abstractmethod
+    async def find_pending_publish(self, limit: int = 50, fields: str = "full") -> List[Dict[str, Any]]:
+        """Busca notícias pendentes de publicação"""
+        pass
+
+    @abstractmethod
+    async def mark_as_published(
+        self,
+        mongodb_id: str,
+        post_id: int,
+        post_url: str,
+        timings: Optional[Dict[str, float]] = None
+    ) -> bool:
+        """Marca uma notícia como publicada no WordPress"""
+        pass
+
+    @abstractmethod
+    async def claim_publish(self, mongodb_id: str, owner: str, ttl: int) -> bool:
+        """Reserva a publicação da notícia (só um caminho publica cada notícia)"""
+        pass
+
+    @abstractmethod
+    async def release_publish_claim(self, mongodb_id: str, owner: str) -> bool:
+        """Libera a reserva de publicação se ela ainda for de owner"""
+        pass
+
+    @abstractmethod
+    async def mark_publish_error(self, mongodb_id: str, error: str) -> bool:
+        """Registra erro de publicação"""
+        pass
+
+    @abstractmethod
+    async def get_publish_stats(self, exact: bool = False) -> Dict[str, int]:
+        """Retorna estatísticas de publicação"""
+        pass
+
+    @abstractmethod
+    async def get_pipeline_stats(self, since: datetime, source: Optional[str] = None) -> Dict[str, Any]:
+        """Agrega as durações por etapa em percentis por fonte"""
+        pass
+
+
+class RateBudgetExceeded(RuntimeError):
+    """Sem orçamento de chamadas para a faixa dentro do tempo de espera"""
+
 
 class LLMServiceInterface(ABC):
     """Interface para serviço de LLM"""
@@ -82,5 +196,8 @@ class LLMServiceInterface(ABC):
 
         Returns:
             LLMResult com resumo
+
+        Raises:
+            RateBudgetExceeded: Sem orçamento de chamadas (a task deve ser adiada)
         """
         pass
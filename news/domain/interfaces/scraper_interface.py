@@ -1,19 +1,58 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, List
 
-from domain.entities import NewsArticle
+from domain.entities import NewsArticle, StageTimings
 
 
 class ScraperInterface(ABC):
     """Interface abstrata para scrapers de portais de notícias"""
 
     @abstractmethod
-    def scrape(self, url: str) -> Optional[NewsArticle]:
+    def scrape(self, url: str, timings: Optional[StageTimings] = None) -> Optional[NewsArticle]:
         """
         Extrai dados de uma notícia a partir da URL
 
         Args:
             url: URL da notícia
+            timings: Coletor de durações por etapa (opcional)
+
+        Returns:
+            NewsArticle com os dados extraídos ou None se falhar
+
+        Raises:
+            ScrapeError: Falha classificada (página removida, paywall,
+                conteúdo fora das validações do schema, erro transitório)
+        """
+        pass
+
+    @abstractmethod
+    def fetch_html(self, url: str, timings: Optional[StageTimings] = None) -> Optional[bytes]:
+        """
+        Baixa o HTML bruto da notícia, sem parsear
+
+        Args:
+            url: URL da notícia
+            timings: Coletor de durações por etapa (opcional)
+
+        Returns:
+            Conteúdo HTML em bytes ou None se falhar
+        """
+        pass
+
+    @abstractmethod
+    def parse_html(
+        self,
+        url: str,
+        html: bytes,
+        timings: Optional[StageTimings] = None
+    ) -> Optional[NewsArticle]:
+        """
+        Extrai a notícia a partir de um HTML já baixado
+
+        Args:
+            url: URL de origem do HTML
+            html: Conteúdo HTML em bytes
+            timings: Coletor de durações por etapa (opcional)
 
         Returns:
             NewsArticle com os dados extraídos ou None se falhar
@@ -38,3 +77,17 @@ class ScraperInterface(ABC):
     def source_name(self) -> str:
         """Retorna o nome da fonte (ex: 'g1', 'uol', 'folha')"""
         pass
+
+    def discover_urls(self, limit: int = 50) -> List[str]:
+        """
+        Lista URLs recentes da fonte (ex.: feeds RSS do schema)
+
+        Implementação padrão: a fonte não tem descoberta.
+
+        Args:
+            limit: Máximo de URLs
+
+        Returns:
+            URLs de notícias que o scraper pode processar
+        """
+        return []
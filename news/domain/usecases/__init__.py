@@ -1,7 +1,15 @@
 from .process_news_usecase import ProcessNewsUseCase, ProcessNewsInput, ProcessNewsOutput
+from .process_news_batch_usecase import (
+    ProcessNewsBatchUseCase,
+    ProcessNewsBatchInput,
+    ProcessNewsBatchOutput
+)
 
 __all__ = [
     'ProcessNewsUseCase',
     'ProcessNewsInput',
-    'ProcessNewsOutput'
+    'ProcessNewsOutput',
+    'ProcessNewsBatchUseCase',
+    'ProcessNewsBatchInput',
+    'ProcessNewsBatchOutput'
 ]
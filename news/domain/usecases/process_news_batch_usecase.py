@@ -0,0 +1,283 @@
+import multiprocessing
+import time
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    FIRST_COMPLETED,
+    wait
+)
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Tuple
+
+from domain.entities import NewsArticle, StageTimings
+from domain.interfaces import (
+    ScraperInterface,
+    NewsRepositoryInterface,
+    LLMServiceInterface
+)
+from domain.usecases.process_news_usecase import ProcessNewsUseCase
+
+try:
+    from core.logging import log
+except ImportError:
+    from loguru import logger as log
+
+
+# Scraper usado pelos processos de parsing (definido no initializer do pool)
+_parse_scraper: Optional[ScraperInterface] = None
+
+
+def _init_parse_worker(scraper: ScraperInterface) -> None:
+    """Guarda o scraper no processo de parsing (enviado uma única vez)"""
+    global _parse_scraper
+    _parse_scraper = scraper
+
+
+def _parse_in_worker(url: str, html: bytes) -> Tuple[Optional[NewsArticle], Dict[str, float]]:
+    """Executa o parsing do HTML no processo/thread do pool"""
+    timings = StageTimings()
+    article = _parse_scraper.parse_html(url, html, timings)
+    # As durações voltam junto com o artigo (o processo não compartilha memória)
+    return article, timings.as_dict()
+
+
+@dataclass
+class ProcessNewsBatchInput:
+    """Input para o caso de uso de processar notícias em lote"""
+    urls: List[str]
+    schema_name: str = "g1"
+    task_id: Optional[str] = None
+    priority: str = "low"
+
+
+@dataclass
+class ProcessNewsBatchOutput:
+    """Output do caso de uso de processar notícias em lote"""
+    status: str
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    inserted: int = 0
+    updated: int = 0
+    elapsed_seconds: float = 0.0
+    errors: List[Dict[str, str]] = field(default_factory=list)
+
+
+class ProcessNewsBatchUseCase:
+    """
+    Use Case para processar grandes lotes de notícias (backfill)
+
+    Executa um pipeline limitado, com concorrência própria por etapa:
+    1. Download concorrente (pool de threads, limite de fetch)
+    2. Parsing em pool de processos (CPU)
+    3. Processamento via LLM (pool de threads, limite próprio)
+    4. Persistência em lote (bulk write)
+    """
+
+    def __init__(
+        self,
+        scraper: ScraperInterface,
+        llm_service: LLMServiceInterface,
+        repository: NewsRepositoryInterface,
+        fetch_concurrency: int = 8,
+        parse_workers: int = 2,
+        llm_concurrency: int = 2,
+        write_batch_size: int = 50,
+        max_in_flight: Optional[int] = None
+    ):
+        """
+        Injeta dependências e limites de concorrência
+
+        Args:
+            scraper: Implementação de ScraperInterface
+            llm_service: Implementação de LLMServiceInterface
+            repository: Implementação de NewsRepositoryInterface
+            fetch_concurrency: Downloads simultâneos
+            parse_workers: Processos de parsing (0 = parsing em thread)
+            llm_concurrency: Chamadas simultâneas ao LLM
+            write_batch_size: Documentos por bulk write
+            max_in_flight: Máximo de URLs em andamento no pipeline
+        """
+        self._scraper = scraper
+        self._llm_service = llm_service
+        self._repository = repository
+        self._fetch_concurrency = max(1, fetch_concurrency)
+        self._parse_workers = max(0, parse_workers)
+        self._llm_concurrency = max(1, llm_concurrency)
+        self._write_batch_size = max(1, write_batch_size)
+        self._max_in_flight = max_in_flight or 2 * (
+            self._fetch_concurrency + self._llm_concurrency)
+
+    def execute(self, input_data: ProcessNewsBatchInput) -> ProcessNewsBatchOutput:
+        """
+        Executa o pipeline para todas as URLs do lote
+
+        Args:
+            input_data: Dados de entrada
+
+        Returns:
+            ProcessNewsBatchOutput com contagens e erros por URL
+        """
+        task_id = input_data.task_id or "no-task"
+        started = time.monotonic()
+
+        # Remove duplicadas preservando a ordem
+        urls = list(dict.fromkeys(input_data.urls))
+        output = ProcessNewsBatchOutput(status="success", total=len(urls))
+
+        log.info(
+            f"[BatchUseCase {task_id}] Iniciando pipeline com {len(urls)} URLs "
+            f"(fetch={self._fetch_concurrency}, parse={self._parse_workers}, "
+            f"llm={self._llm_concurrency}, lote={self._write_batch_size})")
+
+        supported = []
+        for url in urls:
+            if self._scraper.can_handle(url):
+                supported.append(url)
+            else:
+                self._record_error(
+                    output, url, "validate",
+                    f"URL não suportada pelo scraper {self._scraper.source_name}")
+
+        pending_urls = iter(supported)
+        in_flight: Dict[Future, Tuple[str, str]] = {}
+        timings: Dict[str, StageTimings] = {}
+        buffer: List[Dict[str, Any]] = []
+
+        with ThreadPoolExecutor(self._fetch_concurrency, thread_name_prefix="fetch") as fetch_pool, \
+                self._create_parse_pool() as parse_pool, \
+                ThreadPoolExecutor(self._llm_concurrency, thread_name_prefix="llm") as llm_pool:
+
+            def refill():
+                # Mantém o pipeline limitado: só baixa novas URLs quando há espaço
+                while len(in_flight) < self._max_in_flight:
+                    url = next(pending_urls, None)
+                    if url is None:
+                        return
+                    timings[url] = StageTimings()
+                    future = fetch_pool.submit(
+                        self._scraper.fetch_html, url, timings[url])
+                    in_flight[future] = ("fetch", url)
+
+            refill()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    stage, url = in_flight.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        timings.pop(url, None)
+                        self._record_error(output, url, stage, str(e))
+                        continue
+
+                    if stage == "parse":
+                        result, parse_spans = result
+                        timings[url].merge(parse_spans)
+
+                    if result is None:
+                        timings.pop(url, None)
+                        self._record_error(
+                            output, url, stage, "Não foi possível extrair a notícia")
+                    elif stage == "fetch":
+                        next_future = parse_pool.submit(
+                            _parse_in_worker, url, result)
+                        in_flight[next_future] = ("parse", url)
+                    elif stage == "parse":
+                        next_future = llm_pool.submit(
+                            self._summarise, result, input_data, timings[url])
+                        in_flight[next_future] = ("llm", url)
+                    else:
+                        timings.pop(url, None)
+                        buffer.append(result)
+                        if len(buffer) >= self._write_batch_size:
+                            self._flush(buffer, output, task_id)
+                            buffer = []
+
+                refill()
+
+        if buffer:
+            self._flush(buffer, output, task_id)
+
+        output.failed = len(output.errors)
+        output.elapsed_seconds = round(time.monotonic() - started, 3)
+        if output.failed and not output.succeeded:
+            output.status = "error"
+        elif output.failed:
+            output.status = "partial"
+
+        log.info(
+            f"[BatchUseCase {task_id}] Pipeline concluído em {output.elapsed_seconds}s: "
+            f"{output.succeeded} sucesso, {output.failed} falhas")
+        return output
+
+    def _create_parse_pool(self) -> Executor:
+        """Cria o pool de parsing (processos, com fallback para threads)"""
+        initargs = (self._scraper,)
+
+        # Workers prefork do Celery são daemônicos e não podem criar processos
+        if self._parse_workers == 0 or multiprocessing.current_process().daemon:
+            if self._parse_workers:
+                log.warning(
+                    "Processo daemônico: parsing executado em threads")
+            return ThreadPoolExecutor(
+                max(1, self._parse_workers),
+                thread_name_prefix="parse",
+                initializer=_init_parse_worker,
+                initargs=initargs
+            )
+
+        return ProcessPoolExecutor(
+            self._parse_workers,
+            initializer=_init_parse_worker,
+            initargs=initargs
+        )
+
+    def _summarise(
+        self,
+        article: NewsArticle,
+        input_data: ProcessNewsBatchInput,
+        timings: StageTimings
+    ) -> Dict[str, Any]:
+        """Processa a notícia com o LLM e monta o documento de persistência"""
+        with timings.span("llm"):
+            llm_result = self._llm_service.process_content(
+                content=article.content,
+                title=article.title,
+                subtitle=article.subtitle or ""
+            )
+        return ProcessNewsUseCase.build_document(
+            article=article,
+            llm_result=llm_result,
+            schema_name=input_data.schema_name,
+            task_id=input_data.task_id,
+            source=self._scraper.source_name,
+            timings=timings.as_dict(),
+            priority=input_data.priority
+        )
+
+    def _flush(self, documents: List[Dict[str, Any]], output: ProcessNewsBatchOutput, task_id: str) -> None:
+        """Persiste um lote de documentos com bulk write"""
+        log.info(
+            f"[BatchUseCase {task_id}] Gravando lote de {len(documents)} notícias")
+        try:
+            result = self._repository.upsert_many(documents)
+        except Exception as e:
+            for document in documents:
+                self._record_error(output, document['url'], "persist", str(e))
+            return
+
+        output.inserted += result.get("inserted", 0)
+        output.updated += result.get("updated", 0)
+        for error in result.get("errors", []):
+            self._record_error(output, error["url"], "persist", error["error"])
+        output.succeeded += len(documents) - len(result.get("errors", []))
+
+    @staticmethod
+    def _record_error(output: ProcessNewsBatchOutput, url: str, stage: str, error: str) -> None:
+        """Registra a falha de uma URL em uma etapa do pipeline"""
+        log.warning(f"Falha em '{stage}' para {url}: {error}")
+        output.errors.append({"url": url, "stage": stage, "error": error})
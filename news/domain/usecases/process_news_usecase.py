@@ -1,10 +1,15 @@
-from dataclasses import dataclass, asdict
+import hashlib
+from dataclasses import dataclass, asdict, field
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 
+from domain.entities import FreshnessPolicy, LLMResult, NewsArticle, ScrapeError, StageTimings
 from domain.interfaces import (
     ScraperInterface,
     NewsRepositoryInterface,
-    LLMServiceInterface
+    LLMServiceInterface,
+    RateBudgetExceeded,
+    CheckpointStoreInterface
 )
 
 try:
@@ -19,6 +24,11 @@ class ProcessNewsInput:
     url: str
     schema_name: str = "g1"
     task_id: Optional[str] = None
+    force: bool = False
+    priority: str = "normal"
+    # Reserva de publicação gravada junto com a notícia ({'owner', 'until'}):
+    # quem vai publicar em seguida impede que o dispatcher publique também
+    publish_claim: Optional[Dict[str, Any]] = None
 
 
 @dataclass
@@ -33,6 +43,10 @@ class ProcessNewsOutput:
     resumo: Optional[str] = None
     error: Optional[str] = None
     article: Optional[Dict[str, Any]] = None
+    freshness: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+    stage: Optional[str] = None
+    failure: Optional[str] = None
 
 
 class ProcessNewsUseCase:
@@ -40,16 +54,25 @@ class ProcessNewsUseCase:
     Use Case para processar uma notícia
 
     Orquestra o fluxo:
-    1. Extração via Scraper
-    2. Processamento via LLM
-    3. Persistência no Repository
+    1. Verificação de frescor no Repository
+    2. Extração via Scraper
+    3. Processamento via LLM (ou reaproveitamento do resumo salvo)
+    4. Persistência no Repository
+
+    Com um CheckpointStore, cada etapa concluída (scraped, summarised,
+    persisted) é registrada pelo task_id e um retry retoma da seguinte.
     """
 
+    ARTICLE_FIELDS = ('title', 'subtitle', 'content', 'author',
+                      'pub_date', 'url', 'images', 'source')
+
     def __init__(
         self,
         scraper: ScraperInterface,
         llm_service: LLMServiceInterface,
-        repository: NewsRepositoryInterface
+        repository: NewsRepositoryInterface,
+        freshness_policy: Optional[FreshnessPolicy] = None,
+        checkpoints: Optional[CheckpointStoreInterface] = None
     ):
         """
         Injeta dependências via construtor (Dependency Injection)
@@ -58,10 +81,14 @@ class ProcessNewsUseCase:
             scraper: Implementação de ScraperInterface
             llm_service: Implementação de LLMServiceInterface
             repository: Implementação de NewsRepositoryInterface
+            freshness_policy: Política de frescor (desativada se None)
+            checkpoints: Checkpoints por etapa (sem retomada se None)
         """
         self._scraper = scraper
         self._llm_service = llm_service
         self._repository = repository
+        self._freshness = freshness_policy or FreshnessPolicy()
+        self._checkpoints = checkpoints
 
     def execute(self, input_data: ProcessNewsInput) -> ProcessNewsOutput:
         """
@@ -74,6 +101,8 @@ class ProcessNewsUseCase:
             ProcessNewsOutput com resultado do processamento
         """
         task_id = input_data.task_id or "no-task"
+        timings = StageTimings()
+        stage = None
         log.info(
             f"[UseCase {task_id}] Iniciando processamento: {input_data.url}")
 
@@ -83,51 +112,129 @@ class ProcessNewsUseCase:
                 return ProcessNewsOutput(
                     status="error",
                     url=input_data.url,
-                    error=f"URL não suportada pelo scraper {self._scraper.source_name}"
+                    error=f"URL não suportada pelo scraper {self._scraper.source_name}",
+                    failure="unsupported"
                 )
 
-            # 2. Extrai a notícia
-            log.info(f"[UseCase {task_id}] Extraindo notícia...")
-            article = self._scraper.scrape(input_data.url)
+            # Retry: retoma da primeira etapa não concluída
+            checkpoint = self._load_checkpoint(input_data)
+            if checkpoint:
+                stage = checkpoint['stage']
+                timings.merge(checkpoint.get('timings', {}))
+                log.info(f"[UseCase {task_id}] Retomando após a etapa '{stage}'")
 
-            if not article:
-                return ProcessNewsOutput(
-                    status="error",
-                    url=input_data.url,
-                    error="Não foi possível extrair a notícia"
-                )
+            if checkpoint and checkpoint.get('mongodb_id'):
+                persisted = self._repository.find_by_url(
+                    checkpoint.get('url') or input_data.url)
+                if persisted is not None:
+                    output = self._output_from_document(persisted, input_data)
+                    output.freshness = "checkpoint"
+                    output.timings = timings.as_dict()
+                    output.stage = stage
+                    return output
+
+            # 2. Verifica se já existe um processamento recente
+            existing = None
+            if not input_data.force:
+                existing = self._repository.find_by_url(input_data.url)
+
+            # Resultados de fallback do LLM (timeout, indisponível) não contam como recentes
+            if (not checkpoint and existing and existing.get('llm_status') == "success"
+                    and self._freshness.is_fresh(self._processed_at(existing))):
+                log.info(
+                    f"[UseCase {task_id}] Notícia recente no repositório, reaproveitando: {existing['_id']}")
+                return self._output_from_document(existing, input_data)
+
+            # 3. Extrai a notícia
+            if checkpoint and checkpoint.get('article'):
+                article = NewsArticle(**checkpoint['article'])
+            else:
+                log.info(f"[UseCase {task_id}] Extraindo notícia...")
+                try:
+                    article = self._scraper.scrape(input_data.url, timings)
+                except ScrapeError as e:
+                    log.warning(f"[UseCase {task_id}] Falha na extração ({e.failure}): {e}")
+                    return ProcessNewsOutput(
+                        status="error",
+                        url=input_data.url,
+                        error=str(e),
+                        timings=timings.as_dict(),
+                        failure=e.failure
+                    )
+
+                if not article:
+                    return ProcessNewsOutput(
+                        status="error",
+                        url=input_data.url,
+                        error="Não foi possível extrair a notícia",
+                        timings=timings.as_dict(),
+                        failure="transient"
+                    )
+
+                stage = self._save_checkpoint(input_data, "scraped", {
+                    'article': asdict(article),
+                    'timings': timings.as_dict()
+                })
 
             log.info(f"[UseCase {task_id}] Notícia extraída: {article.title}")
 
-            # 3. Processa com LLM
-            log.info(f"[UseCase {task_id}] Processando com LLM...")
-            llm_result = self._llm_service.process_content(
-                content=article.content,
-                title=article.title,
-                subtitle=article.subtitle or ""
-            )
+            # 4. Processa com LLM, a menos que o conteúdo não tenha mudado
+            content_hash = self._content_hash(article.content)
+            freshness = None
+
+            if checkpoint and checkpoint.get('llm'):
+                llm_result = LLMResult(**checkpoint['llm'])
+            elif self._can_reuse_summary(existing, content_hash):
+                log.info(
+                    f"[UseCase {task_id}] Conteúdo inalterado, reaproveitando resumo salvo")
+                llm_result = LLMResult(
+                    resumo=existing['summary'],
+                    status=existing['llm_status']
+                )
+                freshness = "unchanged"
+            else:
+                log.info(f"[UseCase {task_id}] Processando com LLM...")
+                with timings.span("llm"):
+                    llm_result = self._llm_service.process_content(
+                        content=article.content,
+                        title=article.title,
+                        subtitle=article.subtitle or ""
+                    )
+                stage = self._save_checkpoint(input_data, "summarised", {
+                    'llm': {'resumo': llm_result.resumo, 'status': llm_result.status},
+                    'timings': timings.as_dict()
+                })
 
             log.info(f"[UseCase {task_id}] LLM Status: {llm_result.status}")
 
-            # 4. Prepara documento para persistência
-            document = {
-                "title": article.title,
-                "subtitle": article.subtitle,
-                "content": article.content,
-                "summary": llm_result.resumo,
-                "llm_status": llm_result.status,
-                "author": article.author,
-                "pub_date": article.pub_date,
-                "url": article.url,
-                "images": article.images,
-                "source": article.source or self._scraper.source_name,
-                "schema_used": input_data.schema_name,
-                "task_id": input_data.task_id
-            }
-
-            # 5. Persiste no repositório (upsert)
+            # 5. Prepara documento para persistência
+            document = self.build_document(
+                article=article,
+                llm_result=llm_result,
+                schema_name=input_data.schema_name,
+                task_id=input_data.task_id,
+                source=self._scraper.source_name,
+                content_hash=content_hash,
+                timings=timings.as_dict(),
+                priority=input_data.priority
+            )
+            if existing:
+                # Identidade já conhecida: o repositório pode adiar a gravação
+                document['_id'] = existing['_id']
+            if input_data.publish_claim:
+                document['publish_claim'] = input_data.publish_claim
+
+            # 6. Persiste no repositório (upsert)
             log.info(f"[UseCase {task_id}] Salvando no repositório...")
-            result_id = self._repository.upsert(article.url, document)
+            with timings.span("persist"):
+                result_id = self._repository.upsert(article.url, document)
+
+            # Artigo e resumo já estão no repositório: o checkpoint guarda só o ID
+            stage = self._save_checkpoint(input_data, "persisted", {
+                'mongodb_id': result_id,
+                'url': article.url,
+                'timings': timings.as_dict()
+            }, drop=('article', 'llm'))
 
             log.info(
                 f"[UseCase {task_id}] Processamento concluído: {result_id}")
@@ -140,13 +247,145 @@ class ProcessNewsUseCase:
                 schema_used=input_data.schema_name,
                 llm_status=llm_result.status,
                 resumo=llm_result.resumo,
-                article=asdict(article)
+                article=asdict(article),
+                freshness=freshness,
+                timings=timings.as_dict(),
+                stage=stage
             )
 
+        except RateBudgetExceeded:
+            # Falta de orçamento não é erro da notícia: quem chamou adia
+            raise
         except Exception as e:
             log.exception(f"[UseCase {task_id}] Erro: {e}")
             return ProcessNewsOutput(
                 status="error",
                 url=input_data.url,
-                error=str(e)
+                error=str(e),
+                timings=timings.as_dict(),
+                stage=stage
             )
+
+    def _load_checkpoint(self, input_data: ProcessNewsInput) -> Optional[Dict[str, Any]]:
+        """
+        Checkpoint de uma execução anterior da mesma task
+
+        Um checkpoint gravado para outra URL com o mesmo task_id (ex.: ID
+        fixo reaproveitado entre requisições) é ignorado.
+        """
+        if self._checkpoints is None or not input_data.task_id:
+            return None
+        checkpoint = self._checkpoints.load(input_data.task_id)
+        if checkpoint and checkpoint.get('input_url', input_data.url) != input_data.url:
+            log.warning(
+                f"[UseCase {input_data.task_id}] Checkpoint de outra URL ignorado: "
+                f"{checkpoint.get('input_url')}")
+            return None
+        return checkpoint
+
+    def _save_checkpoint(
+        self,
+        input_data: ProcessNewsInput,
+        stage: str,
+        data: Dict[str, Any],
+        drop: tuple = ()
+    ) -> str:
+        """Registra a etapa concluída (com a URL de entrada) e a retorna"""
+        if self._checkpoints is not None and input_data.task_id:
+            self._checkpoints.save(
+                input_data.task_id, stage, {**data, 'input_url': input_data.url}, drop)
+        return stage
+
+    @classmethod
+    def build_document(
+        cls,
+        article: NewsArticle,
+        llm_result: LLMResult,
+        schema_name: str,
+        task_id: Optional[str],
+        source: str,
+        content_hash: Optional[str] = None,
+        timings: Optional[Dict[str, float]] = None,
+        priority: str = "normal"
+    ) -> Dict[str, Any]:
+        """
+        Monta o documento de persistência de uma notícia processada
+
+        Args:
+            article: Notícia extraída
+            llm_result: Resultado do LLM (ou resumo reaproveitado)
+            schema_name: Schema usado no processamento
+            task_id: ID da task que processou
+            source: Fonte padrão caso o artigo não informe
+            content_hash: Hash do conteúdo (calculado se omitido)
+            timings: Durações por etapa medidas até aqui
+            priority: Faixa de prioridade (define a fila da publicação)
+
+        Returns:
+            Documento pronto para o repositório
+        """
+        return {
+            "status": "success",
+            "title": article.title,
+            "subtitle": article.subtitle,
+            "content": article.content,
+            "summary": llm_result.resumo,
+            "llm_status": llm_result.status,
+            "author": article.author,
+            "pub_date": article.pub_date,
+            "url": article.url,
+            "images": article.images,
+            "source": article.source or source,
+            "schema_used": schema_name,
+            "task_id": task_id,
+            "content_hash": content_hash or cls._content_hash(article.content),
+            "fetched_at": datetime.now(timezone.utc),
+            "timings": timings or {},
+            "priority": priority
+        }
+
+    def _can_reuse_summary(self, existing: Optional[Dict[str, Any]], content_hash: str) -> bool:
+        """Verifica se o resumo salvo pode ser reaproveitado (conteúdo idêntico)"""
+        if not existing or not self._freshness.reuse_unchanged_summary:
+            return False
+        return (
+            existing.get('content_hash') == content_hash
+            and existing.get('llm_status') == "success"
+            and bool(existing.get('summary'))
+        )
+
+    def _output_from_document(
+        self,
+        document: Dict[str, Any],
+        input_data: ProcessNewsInput
+    ) -> ProcessNewsOutput:
+        """Monta o output a partir de um documento já persistido"""
+        article = {field: document.get(field)
+                   for field in self.ARTICLE_FIELDS}
+        article['images'] = article['images'] or []
+
+        return ProcessNewsOutput(
+            status="success",
+            mongodb_id=str(document['_id']),
+            url=document.get('url', input_data.url),
+            title=document.get('title'),
+            schema_used=document.get('schema_used', input_data.schema_name),
+            llm_status=document.get('llm_status'),
+            resumo=document.get('summary'),
+            article=article,
+            freshness="fresh"
+        )
+
+    @staticmethod
+    def _processed_at(document: Dict[str, Any]) -> Optional[datetime]:
+        """Retorna o momento da última extração do documento"""
+        return (
+            document.get('fetched_at')
+            or document.get('updated_at')
+            or document.get('created_at')
+        )
+
+    @staticmethod
+    def _content_hash(content: str) -> str:
+        """Gera o hash do conteúdo extraído"""
+        return hashlib.sha256((content or "").encode('utf-8')).hexdigest()
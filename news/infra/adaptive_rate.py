@@ -0,0 +1,260 @@
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any
+
+try:
+    from core.logging import log
+except ImportError:
+    from loguru import logger as log
+
+
+class AdaptiveRateController:
+    """
+    Controle AIMD do limite de chamadas por minuto de um serviço externo
+
+    Os workers registram cada chamada (latência, erro, throttling) em
+    contadores no Redis; a cada ciclo (task adjust_rate_limits) o limite é:
+
+    - reduzido multiplicativamente (x decrease) se houve throttling (429),
+      erros/timeouts acima de ERROR_RATIO ou latência média acima do alvo;
+    - aumentado aditivamente (+ increase) se o serviço está saudável e há
+      fila esperando (demanda reprimida);
+    - mantido nos demais casos.
+
+    O limite fica no Redis e é lido pelo RateBudget de todos os workers.
+    Sem Redis, contadores e limite são locais ao processo.
+    """
+
+    # Proporção de erros/timeouts que caracteriza sobrecarga
+    ERROR_RATIO = 0.1
+    # Tempo (s) que um worker reaproveita o limite lido do Redis
+    CACHE_SECONDS = 5.0
+
+    # Lê e zera os contadores do ciclo de forma atômica
+    _SNAPSHOT_SCRIPT = """
+        local stats = redis.call('hgetall', KEYS[1])
+        redis.call('del', KEYS[1])
+        return stats
+    """
+
+    def __init__(
+        self,
+        redis_client,
+        name: str,
+        initial: int,
+        min_rate: int,
+        max_rate: int,
+        latency_target: float,
+        increase: int = 1,
+        decrease: float = 0.5
+    ):
+        """
+        Args:
+            redis_client: Cliente redis-py (None usa estado local)
+            name: Nome do serviço (ex.: 'llm', 'wordpress')
+            initial: Limite inicial (chamadas por minuto)
+            min_rate: Limite mínimo
+            max_rate: Limite máximo
+            latency_target: Latência média (s) acima da qual o limite é reduzido
+            increase: Incremento aditivo por ciclo
+            decrease: Fator multiplicativo de redução (0 < decrease < 1)
+        """
+        self._redis = redis_client
+        self.name = name
+        self.min_rate = max(1, min_rate)
+        self.max_rate = max(self.min_rate, max_rate)
+        self.initial = min(max(initial, self.min_rate), self.max_rate)
+        self.latency_target = latency_target
+        self.increase = max(1, increase)
+        self.decrease = decrease
+        self._lock = threading.Lock()
+        self._local_stats: Dict[str, float] = {}
+        self._local_state: Dict[str, Any] = {'limit': self.initial}
+        self._cached: Optional[int] = None
+        self._cached_at = 0.0
+
+    @property
+    def _stats_key(self) -> str:
+        return f"rate:{self.name}:stats"
+
+    @property
+    def _state_key(self) -> str:
+        return f"rate:{self.name}:state"
+
+    def limit(self) -> int:
+        """Limite atual (chamadas por minuto)"""
+        now = time.monotonic()
+        if self._cached is not None and now - self._cached_at < self.CACHE_SECONDS:
+            return self._cached
+
+        limit = int(self._read_state().get('limit', self.initial))
+        self._cached, self._cached_at = limit, now
+        return limit
+
+    def record(
+        self,
+        latency: Optional[float] = None,
+        error: bool = False,
+        throttled: bool = False
+    ) -> None:
+        """
+        Registra uma chamada ao serviço
+
+        Não propaga erros: a observação não pode derrubar a task.
+
+        Args:
+            latency: Duração da chamada em segundos (None se não concluiu)
+            error: Timeout, falha de conexão ou erro 5xx
+            throttled: O serviço respondeu 429 (Too Many Requests)
+        """
+        increments = {'calls': 1}
+        if latency is not None and not error:
+            increments['latency_count'] = 1
+            increments['latency_sum'] = latency
+        if error:
+            increments['errors'] = 1
+        if throttled:
+            increments['throttled'] = 1
+
+        if self._redis is not None:
+            try:
+                pipe = self._redis.pipeline(transaction=False)
+                for field, value in increments.items():
+                    if isinstance(value, float):
+                        pipe.hincrbyfloat(self._stats_key, field, value)
+                    else:
+                        pipe.hincrby(self._stats_key, field, value)
+                pipe.expire(self._stats_key, 3600)
+                pipe.execute()
+                return
+            except Exception as e:
+                log.warning(f"Redis indisponível para observar '{self.name}', usando contador local: {e}")
+
+        with self._lock:
+            for field, value in increments.items():
+                self._local_stats[field] = self._local_stats.get(field, 0) + value
+
+    def adjust(self, queue_depth: int = 0) -> Dict[str, Any]:
+        """
+        Aplica um ciclo AIMD com as chamadas registradas desde o último ciclo
+
+        Args:
+            queue_depth: Tasks aguardando nas filas que usam o serviço
+
+        Returns:
+            Estado do controle (limite anterior e novo, motivo, métricas)
+        """
+        stats = self._snapshot()
+        calls = int(stats.get('calls', 0))
+        errors = int(stats.get('errors', 0))
+        throttled = int(stats.get('throttled', 0))
+        latency_count = int(stats.get('latency_count', 0))
+        avg_latency = (stats.get('latency_sum', 0.0) / latency_count
+                       if latency_count else None)
+
+        previous = int(self._read_state().get('limit', self.initial))
+        if throttled:
+            limit, reason = self._decreased(previous), "throttled"
+        elif calls and errors / calls >= self.ERROR_RATIO:
+            limit, reason = self._decreased(previous), "errors"
+        elif avg_latency is not None and avg_latency > self.latency_target:
+            limit, reason = self._decreased(previous), "latency"
+        elif calls and queue_depth > 0:
+            limit, reason = min(self.max_rate, previous + self.increase), "backlog"
+        else:
+            limit, reason = previous, "steady"
+
+        state = {
+            'limit': limit,
+            'previous_limit': previous,
+            'reason': reason,
+            'calls': calls,
+            'errors': errors,
+            'throttled': throttled,
+            'avg_latency': round(avg_latency, 3) if avg_latency is not None else None,
+            'queue_depth': queue_depth,
+            'updated_at': datetime.now(timezone.utc).isoformat()
+        }
+        self._write_state(state)
+        self._cached = None
+
+        if limit != previous:
+            log.info(f"[Rate {self.name}] {previous} -> {limit}/min ({reason})")
+        return state
+
+    def status(self) -> Dict[str, Any]:
+        """Estado atual do controle (limite, último ajuste e faixa permitida)"""
+        state = self._read_state()
+        return {
+            **state,
+            'limit': int(state.get('limit', self.initial)),
+            'min': self.min_rate,
+            'max': self.max_rate,
+            'latency_target': self.latency_target
+        }
+
+    def _decreased(self, limit: int) -> int:
+        return max(self.min_rate, int(limit * self.decrease))
+
+    def _snapshot(self) -> Dict[str, float]:
+        """Lê e zera os contadores do ciclo"""
+        if self._redis is not None:
+            try:
+                raw = self._redis.eval(self._SNAPSHOT_SCRIPT, 1, self._stats_key)
+                return {
+                    self._decode(raw[i]): float(self._decode(raw[i + 1]))
+                    for i in range(0, len(raw), 2)
+                }
+            except Exception as e:
+                log.warning(f"Falha ao ler observações de '{self.name}': {e}")
+
+        with self._lock:
+            stats, self._local_stats = self._local_stats, {}
+        return stats
+
+    def _read_state(self) -> Dict[str, Any]:
+        if self._redis is not None:
+            try:
+                raw = self._redis.hgetall(self._state_key)
+                if raw:
+                    return self._parse_state(
+                        {self._decode(k): self._decode(v) for k, v in raw.items()})
+                return {'limit': self.initial}
+            except Exception as e:
+                log.warning(f"Falha ao ler o limite de '{self.name}': {e}")
+
+        with self._lock:
+            return dict(self._local_state)
+
+    def _write_state(self, state: Dict[str, Any]) -> None:
+        if self._redis is not None:
+            try:
+                # Redis não guarda None: campos vazios viram ''
+                self._redis.hset(self._state_key, mapping={
+                    k: '' if v is None else v for k, v in state.items()})
+                return
+            except Exception as e:
+                log.warning(f"Falha ao gravar o limite de '{self.name}': {e}")
+
+        with self._lock:
+            self._local_state = dict(state)
+
+    @staticmethod
+    def _parse_state(raw: Dict[str, str]) -> Dict[str, Any]:
+        """Converte os campos do hash do Redis (strings) para os tipos do estado"""
+        state: Dict[str, Any] = {}
+        for field, value in raw.items():
+            if value == '':
+                state[field] = None
+            elif field in ('limit', 'previous_limit', 'calls', 'errors', 'throttled', 'queue_depth'):
+                state[field] = int(float(value))
+            elif field == 'avg_latency':
+                state[field] = float(value)
+            else:
+                state[field] = value
+        return state
+
+    @staticmethod
+    def _decode(value):
+        return value.decode() if isinstance(value, bytes) else value
@@ -0,0 +1,173 @@
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any
+
+from pymongo import ReturnDocument
+
+from infra.mongodb_infra import MongoDBInfra
+
+try:
+    from core.logging import log
+except ImportError:
+    from loguru import logger as log
+
+
+class BatchTracker:
+    """
+    Progresso agregado dos lotes de tasks (groups do Celery)
+
+    Um documento por lote na coleção 'batches', com contadores por estado
+    incrementados ($inc atômico) pelos sinais das tasks filhas. Consultar
+    o progresso é uma única leitura, independente do tamanho do lote.
+    """
+
+    COLLECTION = "batches"
+    # Variação dos contadores para cada evento de uma task filha
+    EVENTS = {
+        "started": {'counts.started': 1},
+        "succeeded": {'counts.started': -1, 'counts.succeeded': 1},
+        "failed": {'counts.started': -1, 'counts.failed': 1},
+        # URL em quarentena (dead letter): terminou sem processar
+        "quarantined": {'counts.started': -1, 'counts.quarantined': 1},
+        "retried": {'counts.started': -1, 'counts.retried': 1},
+    }
+
+    def __init__(self, db: MongoDBInfra):
+        """
+        Args:
+            db: Instância de MongoDBInfra
+        """
+        self._db = db
+
+    @property
+    def _collection(self):
+        return self._db.db[self.COLLECTION]
+
+    def create(
+        self,
+        batch_id: str,
+        kind: str,
+        total: int,
+        task_ids: Optional[List[str]] = None
+    ) -> None:
+        """
+        Registra um lote antes de enfileirar as tasks filhas
+
+        Args:
+            batch_id: ID do group (o mesmo da task que criou o lote)
+            kind: Tipo do lote ('process' ou 'publish')
+            total: Quantidade de tasks filhas
+            task_ids: IDs das tasks filhas
+        """
+        self._collection.update_one(
+            {'_id': batch_id},
+            {
+                '$set': {
+                    'kind': kind,
+                    'total': total,
+                    'task_ids': task_ids or [],
+                    'created_at': datetime.now(timezone.utc),
+                    'finished_at': None
+                },
+                '$setOnInsert': {
+                    'counts': {
+                        'started': 0, 'succeeded': 0, 'failed': 0,
+                        'quarantined': 0, 'retried': 0
+                    }
+                }
+            },
+            upsert=True
+        )
+
+    def record(self, batch_id: str, event: str) -> None:
+        """
+        Contabiliza um evento de uma task filha
+
+        Não propaga erros: o acompanhamento não pode derrubar a task.
+
+        Args:
+            batch_id: ID do lote
+            event: 'started', 'succeeded', 'failed', 'quarantined' ou 'retried'
+        """
+        now = datetime.now(timezone.utc)
+        try:
+            batch = self._collection.find_one_and_update(
+                {'_id': batch_id},
+                {'$inc': self.EVENTS[event], '$set': {'updated_at': now}},
+                projection={'total': 1, 'counts': 1, 'finished_at': 1},
+                return_document=ReturnDocument.AFTER
+            )
+            if batch is None or batch.get('finished_at'):
+                return
+
+            counts = batch.get('counts', {})
+            if self._done(counts) >= batch.get('total', 0):
+                self._collection.update_one(
+                    {'_id': batch_id, 'finished_at': None},
+                    {'$set': {'finished_at': now}}
+                )
+                log.info(f"[Batch {batch_id}] Lote concluído")
+        except Exception as e:
+            log.error(f"[Batch {batch_id}] Erro ao registrar evento '{event}': {e}")
+
+    def get(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retorna o progresso do lote
+
+        Args:
+            batch_id: ID do lote
+
+        Returns:
+            Contagens por estado, vazão (tasks/min) e ETA, ou None
+        """
+        batch = self._collection.find_one({'_id': batch_id}, {'task_ids': 0})
+        if batch is None:
+            return None
+
+        counts = batch.get('counts', {})
+        total = batch.get('total', 0)
+        started = max(0, counts.get('started', 0))
+        succeeded = counts.get('succeeded', 0)
+        failed = counts.get('failed', 0)
+        quarantined = counts.get('quarantined', 0)
+        done = self._done(counts)
+
+        created_at = self._utc(batch['created_at'])
+        finished_at = self._utc(batch.get('finished_at'))
+        elapsed = ((finished_at or datetime.now(timezone.utc)) - created_at).total_seconds()
+        rate = done / elapsed if elapsed > 0 else 0.0
+
+        eta_seconds = None
+        if finished_at is None and rate > 0:
+            eta_seconds = round((total - done) / rate, 1)
+
+        return {
+            "batch_id": batch_id,
+            "kind": batch.get('kind'),
+            "total": total,
+            "counts": {
+                "pending": max(0, total - done - started),
+                "started": started,
+                "succeeded": succeeded,
+                "failed": failed,
+                "quarantined": quarantined,
+                "retried": counts.get('retried', 0)
+            },
+            "progress": round(done / total, 4) if total else 1.0,
+            "throughput_per_minute": round(rate * 60, 2),
+            "eta_seconds": eta_seconds,
+            "elapsed_seconds": round(elapsed, 1),
+            "created_at": created_at,
+            "finished_at": finished_at
+        }
+
+    @staticmethod
+    def _done(counts: Dict[str, int]) -> int:
+        """Tasks filhas concluídas (com sucesso, falha ou em quarentena)"""
+        return counts.get('succeeded', 0) + counts.get('failed', 0) + counts.get('quarantined', 0)
+
+    @staticmethod
+    def _utc(value: Optional[datetime]) -> Optional[datetime]:
+        """Datas lidas do MongoDB vêm sem fuso (UTC)"""
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
@@ -0,0 +1,221 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Iterable, Set
+
+from pymongo import ReturnDocument
+from pymongo.errors import OperationFailure
+
+from domain.entities import PERMANENT_FAILURES
+from infra.dedup_lock import normalize_url
+from infra.mongodb_infra import MongoDBInfra
+
+try:
+    from core.logging import log
+except ImportError:
+    from loguru import logger as log
+
+
+class DeadLetterStore:
+    """
+    URLs que falharam de forma definitiva, na coleção 'news_dead_letters'
+
+    Um documento por URL normalizada com a classe da última falha, o
+    número de falhas (por classe), o último erro e a task. A URL entra em
+    quarentena na primeira falha permanente (404, paywall, seletores) ou
+    após max_attempts falhas transitórias; enquanto durar a quarentena,
+    novas submissões terminam sem baixar a página. Os documentos expiram
+    por TTL ttl_days após a última falha.
+    """
+
+    COLLECTION = "news_dead_letters"
+    TTL_INDEX_NAME = "dead_letter_ttl"
+    FAILURE_INDEX_NAME = "dead_letter_failure"
+
+    def __init__(
+        self,
+        db: MongoDBInfra,
+        quarantine_hours: int = 72,
+        max_attempts: int = 3,
+        ttl_days: int = 30
+    ):
+        """
+        Args:
+            db: Instância de MongoDBInfra
+            quarantine_hours: Duração da quarentena
+            max_attempts: Falhas transitórias até a quarentena
+            ttl_days: Validade dos registros (a partir da última falha)
+        """
+        self._db = db
+        self._quarantine = timedelta(hours=quarantine_hours)
+        self._max_attempts = max(1, max_attempts)
+        self._ttl = timedelta(days=ttl_days)
+
+    @property
+    def _collection(self):
+        return self._db.db[self.COLLECTION]
+
+    @staticmethod
+    def entry_id(url: str) -> str:
+        """ID do registro: hash da URL normalizada"""
+        return hashlib.sha1(normalize_url(url).encode('utf-8')).hexdigest()
+
+    def ensure_indexes(self) -> None:
+        """Cria o índice TTL (expires_at) e o de listagem por classe"""
+        try:
+            self._collection.create_index(
+                [('expires_at', 1)], name=self.TTL_INDEX_NAME, expireAfterSeconds=0)
+            self._collection.create_index(
+                [('failure', 1), ('last_failed_at', -1)], name=self.FAILURE_INDEX_NAME)
+        except OperationFailure as e:
+            log.error(f"Falha ao criar índices de dead letters: {e}")
+
+    def record(
+        self,
+        url: str,
+        schema_name: str,
+        failure: str,
+        error: str,
+        task_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Registra uma falha definitiva da URL
+
+        Não propaga erros: o registro não pode derrubar a task.
+
+        Args:
+            url: URL da notícia
+            schema_name: Schema usado
+            failure: Classe da falha (FAILURE_CLASSES)
+            error: Último erro
+            task_id: Task que falhou
+
+        Returns:
+            Registro atualizado (ou None se não foi possível gravar)
+        """
+        now = datetime.now(timezone.utc)
+        fields = {
+            'url': url,
+            'schema_name': schema_name,
+            'failure': failure,
+            'last_error': error,
+            'last_task_id': task_id,
+            'last_failed_at': now,
+            'expires_at': now + self._ttl
+        }
+        if failure in PERMANENT_FAILURES:
+            fields['quarantined_until'] = now + self._quarantine
+
+        entry_id = self.entry_id(url)
+        try:
+            entry = self._collection.find_one_and_update(
+                {'_id': entry_id},
+                {
+                    '$set': fields,
+                    '$inc': {'attempts': 1, f'failures.{failure}': 1},
+                    '$setOnInsert': {'first_failed_at': now}
+                },
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            if 'quarantined_until' not in fields and entry['attempts'] >= self._max_attempts:
+                entry['quarantined_until'] = now + self._quarantine
+                self._collection.update_one(
+                    {'_id': entry_id},
+                    {'$set': {'quarantined_until': entry['quarantined_until']}}
+                )
+        except Exception as e:
+            log.error(f"Falha ao registrar dead letter de {url}: {e}")
+            return None
+
+        if entry.get('quarantined_until'):
+            log.warning(
+                f"URL em quarentena até {entry['quarantined_until']:%Y-%m-%d %H:%M} "
+                f"({failure}, {entry['attempts']} falhas): {url}")
+        return entry
+
+    def quarantined(self, url: str) -> Optional[Dict[str, Any]]:
+        """Registro da URL se ela estiver em quarentena (senão None)"""
+        try:
+            return self._collection.find_one({
+                '_id': self.entry_id(url),
+                'quarantined_until': {'$gt': datetime.now(timezone.utc)}
+            })
+        except Exception as e:
+            # Sem o registro a URL é processada normalmente
+            log.warning(f"Falha ao consultar quarentena de {url}: {e}")
+            return None
+
+    def find_quarantined(self, urls: Iterable[str]) -> Set[str]:
+        """Filtra as URLs em quarentena (uma consulta para o lote)"""
+        ids = {self.entry_id(url): url for url in urls}
+        if not ids:
+            return set()
+        cursor = self._collection.find(
+            {'_id': {'$in': list(ids)}, 'quarantined_until': {'$gt': datetime.now(timezone.utc)}},
+            {'_id': 1}
+        )
+        return {ids[document['_id']] for document in cursor}
+
+    def list(
+        self,
+        failure: Optional[str] = None,
+        quarantined_only: bool = False,
+        limit: int = 50,
+        skip: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Lista os registros mais recentes
+
+        Args:
+            failure: Filtra por classe de falha
+            quarantined_only: Apenas URLs ainda em quarentena
+            limit: Máximo de registros
+            skip: Registros a pular (paginação)
+
+        Returns:
+            Registros ordenados pela última falha
+        """
+        query: Dict[str, Any] = {}
+        if failure:
+            query['failure'] = failure
+        if quarantined_only:
+            query['quarantined_until'] = {'$gt': datetime.now(timezone.utc)}
+        cursor = (self._collection.find(query)
+                  .sort('last_failed_at', -1).skip(skip).limit(limit))
+        return list(cursor)
+
+    def counts(self) -> Dict[str, int]:
+        """Registros por classe de falha"""
+        return {
+            group['_id']: group['count']
+            for group in self._collection.aggregate([
+                {'$group': {'_id': '$failure', 'count': {'$sum': 1}}}
+            ])
+        }
+
+    def get(self, entry_id: str) -> Optional[Dict[str, Any]]:
+        """Busca um registro pelo ID"""
+        return self._collection.find_one({'_id': entry_id})
+
+    def release(self, entry_id: str) -> Optional[Dict[str, Any]]:
+        """Remove o registro (fim da quarentena) e o retorna"""
+        return self._collection.find_one_and_delete({'_id': entry_id})
+
+    def purge(self, failure: Optional[str] = None, older_than_days: Optional[int] = None) -> int:
+        """
+        Remove registros em massa
+
+        Args:
+            failure: Apenas desta classe de falha
+            older_than_days: Apenas com a última falha há mais de N dias
+
+        Returns:
+            Quantidade removida
+        """
+        query: Dict[str, Any] = {}
+        if failure:
+            query['failure'] = failure
+        if older_than_days is not None:
+            query['last_failed_at'] = {
+                '$lt': datetime.now(timezone.utc) - timedelta(days=older_than_days)}
+        return self._collection.delete_many(query).deleted_count
@@ -0,0 +1,216 @@
+import threading
+import time
+from typing import Optional, Dict, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+try:
+    from core.logging import log
+except ImportError:
+    from loguru import logger as log
+
+
+# Parâmetros de rastreamento que não mudam a notícia
+TRACKING_PARAMS = ('utm_', 'fbclid', 'gclid', 'mc_cid', 'mc_eid')
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normaliza uma URL para deduplicação
+
+    Host e esquema em minúsculas, sem fragmento, porta padrão, barra final
+    e parâmetros de rastreamento; parâmetros restantes ordenados.
+
+    Args:
+        url: URL original
+
+    Returns:
+        URL canônica
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and (scheme, parts.port) not in (('http', 80), ('https', 443)):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAMS)
+    )
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+
+class EnqueueLock:
+    """
+    Trava de curta duração por chave, guardando o ID da task dona
+
+    Usa Redis (SET NX EX) quando disponível; sem Redis, um dicionário em
+    memória por processo faz o papel (deduplica apenas no próprio processo
+    e as travas expiram pelo TTL). Se o Redis falhar, a trava é obtida no
+    dicionário local, e a renovação e a liberação dessa trava também
+    ficam nele, mesmo depois que o Redis voltar.
+    """
+
+    LOCAL_MAX_KEYS = 10000
+    # Sufixo do dono que não pode ser substituído (faixa alta ou já em execução)
+    PINNED_SUFFIX = "@pinned"
+
+    # Renova/remove a trava apenas se ela ainda pertencer à task
+    _EXTEND_SCRIPT = """
+        if redis.call('get', KEYS[1]) == ARGV[1] then
+            return redis.call('expire', KEYS[1], ARGV[2])
+        end
+        return 0
+    """
+    _SWAP_SCRIPT = """
+        if redis.call('get', KEYS[1]) == ARGV[1] then
+            return redis.call('set', KEYS[1], ARGV[2], 'EX', ARGV[3]) and 1 or 0
+        end
+        return 0
+    """
+    _RELEASE_SCRIPT = """
+        if redis.call('get', KEYS[1]) == ARGV[1] then
+            return redis.call('del', KEYS[1])
+        end
+        return 0
+    """
+
+    def __init__(self, redis_client=None, prefix: str = "dedup"):
+        """
+        Args:
+            redis_client: Cliente redis-py (None usa a trava local)
+            prefix: Prefixo das chaves
+        """
+        self._redis = redis_client
+        self._prefix = prefix
+        self._local: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def key(self, name: str, *parts: str) -> str:
+        """Monta a chave da trava (ex.: dedup:process_news_url:g1:<url>)"""
+        return ':'.join((self._prefix, name) + parts)
+
+    def url_key(self, name: str, url: str, schema_name: str) -> str:
+        """Chave de uma task por URL (URL normalizada e schema, em qualquer faixa)"""
+        return self.key(name, schema_name, normalize_url(url))
+
+    @classmethod
+    def pinned(cls, task_id: str) -> str:
+        """
+        Dono que não pode ser substituído
+
+        Uma task na fila das faixas normal/baixa guarda só o seu ID e pode
+        ser trocada por uma nova task na faixa alta (swap); tasks da faixa
+        alta e tasks já em execução guardam o ID com PINNED_SUFFIX.
+        """
+        return task_id + cls.PINNED_SUFFIX
+
+    @classmethod
+    def is_pinned(cls, owner: str) -> bool:
+        return owner.endswith(cls.PINNED_SUFFIX)
+
+    @classmethod
+    def task_of(cls, owner: str) -> str:
+        """ID da task dona da trava"""
+        return owner[:-len(cls.PINNED_SUFFIX)] if cls.is_pinned(owner) else owner
+
+    def acquire(self, key: str, owner: str, ttl: int) -> Optional[str]:
+        """
+        Tenta obter a trava
+
+        Args:
+            key: Chave da trava
+            owner: ID da task que ficará com a trava
+            ttl: Validade em segundos
+
+        Returns:
+            None se a trava foi obtida; senão, o ID da task dona
+        """
+        if self._redis is not None:
+            try:
+                if self._redis.set(key, owner, nx=True, ex=ttl):
+                    return None
+                current = self._redis.get(key)
+                if current is None:
+                    # Expirou entre o SET e o GET: tenta mais uma vez
+                    return None if self._redis.set(key, owner, nx=True, ex=ttl) else owner
+                return current.decode() if isinstance(current, bytes) else current
+            except Exception as e:
+                log.warning(f"Redis indisponível para deduplicação, usando trava local: {e}")
+
+        now = time.monotonic()
+        with self._lock:
+            if len(self._local) > self.LOCAL_MAX_KEYS:
+                self._local = {k: v for k, v in self._local.items() if v[1] > now}
+            current = self._local.get(key)
+            if current and current[1] > now:
+                return current[0]
+            self._local[key] = (owner, now + ttl)
+            return None
+
+    def owner_of(self, key: str) -> Optional[str]:
+        """Dono atual da trava (None se livre)"""
+        now = time.monotonic()
+        with self._lock:
+            current = self._local.get(key)
+            if current and current[1] > now:
+                return current[0]
+
+        if self._redis is not None:
+            try:
+                current = self._redis.get(key)
+                return current.decode() if isinstance(current, bytes) else current
+            except Exception as e:
+                log.warning(f"Redis indisponível para consultar trava {key}: {e}")
+        return None
+
+    def swap(self, key: str, owner: str, new_owner: str, ttl: int) -> bool:
+        """Troca o dono da trava (atômico) se ela ainda pertencer a owner"""
+        if self._redis is not None and not self._owns_local(key, owner):
+            try:
+                return bool(self._redis.eval(self._SWAP_SCRIPT, 1, key, owner, new_owner, ttl))
+            except Exception as e:
+                log.warning(f"Redis indisponível para trocar trava {key}, usando trava local: {e}")
+
+        with self._lock:
+            current = self._local.get(key)
+            if current and current[0] == owner and current[1] > time.monotonic():
+                self._local[key] = (new_owner, time.monotonic() + ttl)
+                return True
+            return False
+
+    def extend(self, key: str, owner: str, ttl: int) -> bool:
+        """Renova a trava se ela ainda pertencer a owner"""
+        if self._redis is not None and not self._owns_local(key, owner):
+            try:
+                return bool(self._redis.eval(self._EXTEND_SCRIPT, 1, key, owner, ttl))
+            except Exception as e:
+                log.warning(f"Redis indisponível para renovar trava {key}, usando trava local: {e}")
+
+        with self._lock:
+            current = self._local.get(key)
+            if current and current[0] == owner:
+                self._local[key] = (owner, time.monotonic() + ttl)
+                return True
+            return False
+
+    def release(self, key: str, owner: str) -> bool:
+        """Libera a trava se ela ainda pertencer a owner"""
+        if self._redis is not None and not self._owns_local(key, owner):
+            try:
+                return bool(self._redis.eval(self._RELEASE_SCRIPT, 1, key, owner))
+            except Exception as e:
+                log.warning(f"Redis indisponível para liberar trava {key}, usando trava local: {e}")
+
+        with self._lock:
+            current = self._local.get(key)
+            if current and current[0] == owner:
+                del self._local[key]
+                return True
+            return False
+
+    def _owns_local(self, key: str, owner: str) -> bool:
+        """Indica se owner obteve a trava no dicionário local (Redis fora do ar)"""
+        with self._lock:
+            current = self._local.get(key)
+            return bool(current and current[0] == owner and current[1] > time.monotonic())
@@ -0,0 +1,85 @@
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, Iterable
+
+from pymongo.errors import OperationFailure
+
+from domain.interfaces import CheckpointStoreInterface, CHECKPOINT_STAGES
+from infra.mongodb_infra import MongoDBInfra
+
+try:
+    from core.logging import log
+except ImportError:
+    from loguru import logger as log
+
+
+class MongoCheckpointStore(CheckpointStoreInterface):
+    """
+    Checkpoints das tasks na coleção 'task_checkpoints'
+
+    Um documento por task_id com a última etapa concluída, o momento de
+    cada etapa e os dados para retomar (artigo extraído, resultado do LLM,
+    ID da notícia, post publicado). Os documentos expiram por TTL.
+    """
+
+    COLLECTION = "task_checkpoints"
+    TTL_INDEX_NAME = "checkpoint_ttl"
+
+    def __init__(self, db: MongoDBInfra, ttl_hours: int = 24):
+        """
+        Args:
+            db: Instância de MongoDBInfra
+            ttl_hours: Validade dos checkpoints (a partir da última etapa)
+        """
+        self._db = db
+        self._ttl_hours = ttl_hours
+
+    @property
+    def _collection(self):
+        return self._db.db[self.COLLECTION]
+
+    def ensure_indexes(self) -> None:
+        """Cria o índice TTL sobre updated_at"""
+        try:
+            self._collection.create_index(
+                [('updated_at', 1)],
+                name=self.TTL_INDEX_NAME,
+                expireAfterSeconds=self._ttl_hours * 3600
+            )
+        except OperationFailure as e:
+            log.error(f"Falha ao criar índice TTL de checkpoints: {e}")
+
+    def load(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Busca o checkpoint da task"""
+        return self._collection.find_one({'_id': task_id})
+
+    def save(
+        self,
+        task_id: str,
+        stage: str,
+        data: Optional[Dict[str, Any]] = None,
+        drop: Iterable[str] = ()
+    ) -> None:
+        """
+        Registra a conclusão de uma etapa
+
+        Não propaga erros: sem checkpoint, o retry apenas refaz a etapa.
+        """
+        if stage not in CHECKPOINT_STAGES:
+            raise ValueError(f"Etapa desconhecida: {stage}")
+
+        now = datetime.now(timezone.utc)
+        update: Dict[str, Any] = {
+            '$set': {
+                **(data or {}),
+                'stage': stage,
+                f'stages.{stage}': now,
+                'updated_at': now
+            }
+        }
+        if drop:
+            update['$unset'] = {field: "" for field in drop}
+
+        try:
+            self._collection.update_one({'_id': task_id}, update, upsert=True)
+        except Exception as e:
+            log.warning(f"[Task {task_id}] Falha ao gravar checkpoint '{stage}': {e}")
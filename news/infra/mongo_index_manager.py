@@ -0,0 +1,155 @@
+from typing import Dict, Any, List
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from pymongo.errors import OperationFailure
+
+from infra.mongodb_infra import MongoDBInfra
+from infra.mongo_news_repository import MongoNewsRepository
+
+try:
+    from core.logging import log
+except ImportError:
+    from loguru import logger as log
+
+
+class NewsIndexManager:
+    """
+    Declara, cria e verifica os índices da coleção de notícias
+
+    Cada índice corresponde a um formato de consulta do MongoNewsRepository.
+    A verificação executa explain() em todas as consultas e acusa COLLSCAN.
+    """
+
+    INDEXES = [
+        # find_by_url / upsert: uma notícia por URL
+        IndexModel([('url', ASCENDING)], name='url_unique', unique=True),
+        # find_pending_publish (ordenado por created_at)
+        IndexModel(
+            [('status', ASCENDING), ('wordpress_published', ASCENDING),
+             ('created_at', DESCENDING)],
+            name='pending_publish'
+        ),
+        # find_published
+        IndexModel(
+            [('wordpress_published', ASCENDING),
+             ('wordpress_published_at', DESCENDING)],
+            name='published_recent'
+        ),
+        # list_recent e paginação por chave (created_at, _id) em list_news
+        IndexModel(
+            [('created_at', DESCENDING), ('_id', DESCENDING)],
+            name='created_keyset'
+        ),
+        # list_news filtrado por fonte
+        IndexModel(
+            [('source', ASCENDING), ('created_at', DESCENDING),
+             ('_id', DESCENDING)],
+            name='source_keyset'
+        ),
+        # list_news filtrado por estado de publicação
+        IndexModel(
+            [('wordpress_published', ASCENDING), ('created_at', DESCENDING),
+             ('_id', DESCENDING)],
+            name='published_keyset'
+        ),
+        # Polling do dispatcher de publicação (posição por updated_at, _id)
+        IndexModel(
+            [('updated_at', ASCENDING), ('_id', ASCENDING)],
+            name='updated_watermark'
+        ),
+        # search_news: busca textual em português, com pesos por campo
+        # (no modo split o content fica em news_bodies e não é indexado)
+        IndexModel(
+            [('title', TEXT), ('subtitle', TEXT), ('summary', TEXT),
+             ('content', TEXT)],
+            name='news_text',
+            default_language='portuguese',
+            language_override='search_language',
+            weights={'title': 10, 'subtitle': 5, 'summary': 3, 'content': 1}
+        ),
+        # get_pipeline_stats (janela por data de extração)
+        IndexModel([('fetched_at', DESCENDING)], name='fetched_recent'),
+    ]
+
+    def __init__(self, db: MongoDBInfra):
+        """
+        Inicializa o gerenciador
+
+        Args:
+            db: Instância de MongoDBInfra
+        """
+        self._db = db
+
+    @property
+    def _collection(self):
+        return self._db.db[MongoNewsRepository.COLLECTION]
+
+    def ensure_indexes(self) -> List[str]:
+        """
+        Cria os índices declarados (operação idempotente)
+
+        Cada índice é criado separadamente para que uma falha (ex: URLs
+        duplicadas impedindo o índice único) não bloqueie os demais.
+
+        Returns:
+            Nomes dos índices criados ou já existentes
+        """
+        created = []
+        for index in self.INDEXES:
+            name = index.document['name']
+            try:
+                self._collection.create_indexes([index])
+                created.append(name)
+            except OperationFailure as e:
+                log.error(f"Falha ao criar índice '{name}': {e}")
+        log.info(f"Índices garantidos em '{MongoNewsRepository.COLLECTION}': {created}")
+        return created
+
+    def verify_query_plans(self, repository: MongoNewsRepository) -> Dict[str, Dict[str, Any]]:
+        """
+        Verifica o plano vencedor de cada consulta do repositório
+
+        Args:
+            repository: Repositório cujas consultas serão explicadas
+
+        Returns:
+            Dicionário {consulta: {"stages": [...], "collscan": bool}}
+        """
+        report = {}
+        for name, explain in repository.explain_queries().items():
+            stages = []
+            for plan in self._winning_plans(explain):
+                stages.extend(self._plan_stages(plan))
+            report[name] = {
+                "stages": stages,
+                "collscan": "COLLSCAN" in stages
+            }
+        return report
+
+    @classmethod
+    def _winning_plans(cls, node: Any) -> List[Dict[str, Any]]:
+        """Localiza os winningPlan no explain (find, aggregate ou sharded)"""
+        plans = []
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == 'winningPlan':
+                    plans.append(value)
+                else:
+                    plans.extend(cls._winning_plans(value))
+        elif isinstance(node, list):
+            for item in node:
+                plans.extend(cls._winning_plans(item))
+        return plans
+
+    @classmethod
+    def _plan_stages(cls, node: Any) -> List[str]:
+        """Lista os estágios de um plano, do topo para as folhas"""
+        stages = []
+        if isinstance(node, dict):
+            if 'stage' in node:
+                stages.append(node['stage'])
+            for value in node.values():
+                stages.extend(cls._plan_stages(value))
+        elif isinstance(node, list):
+            for item in node:
+                stages.extend(cls._plan_stages(item))
+        return stages
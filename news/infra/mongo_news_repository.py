@@ -1,9 +1,15 @@
 
-from typing import Optional, List, Dict, Any
-from datetime import datetime, timezone
+import math
+from typing import Optional, List, Dict, Any, Set, Tuple
+from datetime import datetime, timedelta, timezone
 from bson import ObjectId
+from pymongo import UpdateOne, ReturnDocument
+from pymongo.errors import BulkWriteError, OperationFailure
+from domain.entities import PIPELINE_STAGES
 from domain.interfaces import NewsRepositoryInterface
 from infra.mongodb_infra import MongoDBInfra
+from infra.news_body_store import NewsBodyStore
+from infra.news_archive import NewsArchive
 
 try:
     from core.logging import log
@@ -18,42 +24,125 @@ class MongoNewsRepository(NewsRepositoryInterface):
     """
 
     COLLECTION = "news"
+    COUNTERS_COLLECTION = "news_counters"
+    PUBLISH_STATS_ID = "publish_stats"
+    PUBLISH_STATS_FIELDS = ("total", "published", "pending", "with_errors")
+    # Estado anterior necessário para ajustar os contadores
+    PUBLISH_STATE_PROJECTION = {'status': 1, 'wordpress_published': 1, 'publish_error': 1}
+    # Ordem da listagem paginada (chave única e estável)
+    KEYSET_SORT = [('created_at', -1), ('_id', -1)]
+    # Campos retornados pela busca textual (content é usado para o trecho)
+    SEARCH_PROJECTION = {
+        'title': 1, 'subtitle': 1, 'summary': 1, 'content': 1,
+        'url': 1, 'source': 1, 'created_at': 1, 'score': 1
+    }
 
-    def __init__(self, db: MongoDBInfra = None):
+    # Conjuntos de campos nomeados para as consultas (None = documento inteiro)
+    PROJECTIONS: Dict[str, Optional[Dict[str, int]]] = {
+        "full": None,
+        "summary": {
+            'title': 1,
+            'url': 1,
+            'source': 1,
+            'status': 1,
+            'llm_status': 1,
+            'created_at': 1,
+            'wordpress_published': 1,
+            'wordpress_post_id': 1,
+            'wordpress_url': 1,
+            'wordpress_published_at': 1,
+            'publish_attempts': 1,
+            'publish_error': 1,
+        },
+        "ids": {'_id': 1},
+        # Notícia processada, para expandir resultados de tasks (/status)
+        "article": {
+            'title': 1,
+            'subtitle': 1,
+            'content': 1,
+            'author': 1,
+            'pub_date': 1,
+            'url': 1,
+            'images': 1,
+            'source': 1,
+            'summary': 1,
+            'llm_status': 1,
+            'schema_used': 1,
+            NewsBodyStore.SPLIT_FLAG: 1,
+        },
+    }
+    PERCENTILES = (0.5, 0.9, 0.99)
+
+    def __init__(
+        self,
+        db: MongoDBInfra = None,
+        body_store: NewsBodyStore = None,
+        archive: NewsArchive = None
+    ):
         """
         Inicializa o repositório
 
         Args:
             db: Instância de MongoDBInfra (injetada)
+            body_store: Armazenamento dos corpos (padrão: configurado pelas settings)
+            archive: Arquivo das notícias retiradas pela retenção
         """
         self._db = db or MongoDBInfra()
+        self._bodies = body_store or NewsBodyStore(self._db)
+        self._archive = archive or NewsArchive(self._db)
 
     def save(self, news_data: Dict[str, Any]) -> str:
         """Salva uma nova notícia"""
+        body = self._bodies.split(news_data)
+        if body:
+            self._bodies.save(body)
         news_data['created_at'] = datetime.now(timezone.utc)
         news_data['wordpress_published'] = False
         news_data['wordpress_post_id'] = None
         news_data['wordpress_url'] = None
         news_data['publish_error'] = None
-        return self._db.insert_one(self.COLLECTION, news_data)
+        result_id = self._db.insert_one(self.COLLECTION, news_data)
+        self._inc_publish_stats(
+            total=1, pending=int(news_data.get('status') == 'success'))
+        return result_id
 
     def find_by_url(self, url: str) -> Optional[Dict[str, Any]]:
-        """Busca notícia pela URL"""
-        return self._db.find_by_url(self.COLLECTION, url)
+        """Busca notícia pela URL (com o corpo, mesmo se armazenado à parte)"""
+        return self._bodies.attach(self._db.find_by_url(self.COLLECTION, url))
+
+    def find_by_id(self, mongodb_id: str, fields: str = "full") -> Optional[Dict[str, Any]]:
+        """
+        Busca notícia pelo ID do MongoDB
+
+        Args:
+            mongodb_id: ID do documento
+            fields: Conjunto de campos (full, summary, ids, article)
 
-    def find_by_id(self, mongodb_id: str) -> Optional[Dict[str, Any]]:
-        """Busca notícia pelo ID do MongoDB"""
+        Returns:
+            Notícia encontrada (ou arquivada, com 'archived': True) ou None
+        """
+        projection = self._projection(fields)
         try:
             result = self._db.db[self.COLLECTION].find_one(
-                {'_id': ObjectId(mongodb_id)}
+                {'_id': ObjectId(mongodb_id)}, projection
             )
-            if result:
-                result['_id'] = str(result['_id'])
-            return result
+            if result is None:
+                # Notícias antigas podem ter sido movidas pela retenção
+                return self._archive.find_by_id(mongodb_id, projection)
+            result['_id'] = str(result['_id'])
+            return self._bodies.attach(result)
         except Exception as e:
             log.error(f"Erro ao buscar por ID: {e}")
             return None
 
+    def find_existing_urls(self, urls: List[str]) -> Set[str]:
+        """Filtra as URLs que já estão na coleção (consulta coberta por url_unique)"""
+        if not urls:
+            return set()
+        cursor = self._db.db[self.COLLECTION].find(
+            {'url': {'$in': list(urls)}}, {'_id': 0, 'url': 1})
+        return {document['url'] for document in cursor}
+
     def update_by_url(self, url: str, news_data: Dict[str, Any]) -> bool:
         """Atualiza notícia existente pela URL"""
         news_data['updated_at'] = datetime.now(timezone.utc)
@@ -62,27 +151,210 @@ class MongoNewsRepository(NewsRepositoryInterface):
         return modified > 0
 
     def upsert(self, url: str, news_data: Dict[str, Any]) -> str:
-        """Insere ou atualiza uma notícia"""
-        existing = self.find_by_url(url)
-
-        if existing:
-            self.update_by_url(url, news_data)
-            log.info(f"Notícia atualizada: {existing['_id']}")
-            return existing['_id']
-        else:
-            result_id = self.save(news_data)
-            log.info(f"Notícia criada: {result_id}")
-            return result_id
-
-    def list_recent(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Insere ou atualiza uma notícia em uma única operação atômica
+
+        Usa find_one_and_update com upsert: o _id é gerado no $setOnInsert,
+        então o documento anterior (None em inserções) basta para saber o ID
+        e se houve criação. Com o índice único em 'url', duas tasks
+        concorrentes para a mesma URL não geram documentos duplicados.
+
+        Args:
+            url: URL da notícia (chave única)
+            news_data: Campos da notícia
+
+        Returns:
+            ID do documento criado ou atualizado
+        """
+        news_data = dict(news_data)
+        body = self._bodies.split(news_data)
+        if body:
+            # Corpo antes dos metadados: nenhum documento aponta para corpo ausente
+            self._bodies.save(body)
+
+        new_id = ObjectId()
+        update = self._upsert_update(news_data, datetime.now(timezone.utc))
+        update['$setOnInsert']['_id'] = new_id
+
+        previous = self._db.db[self.COLLECTION].find_one_and_update(
+            {'url': url},
+            update,
+            projection={'_id': 1, 'status': 1, 'wordpress_published': 1},
+            upsert=True,
+            return_document=ReturnDocument.BEFORE
+        )
+
+        processed = news_data.get('status') == 'success'
+        if previous:
+            # Reprocessamento bem-sucedido de uma notícia que não contava como pendente
+            if (processed and previous.get('status') != 'success'
+                    and not previous.get('wordpress_published')):
+                self._inc_publish_stats(pending=1)
+            log.info(f"Notícia atualizada: {previous['_id']}")
+            return str(previous['_id'])
+
+        self._inc_publish_stats(total=1, pending=int(processed))
+        log.info(f"Notícia criada: {new_id}")
+        return str(new_id)
+
+    def upsert_many(self, news_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Insere ou atualiza várias notícias com um único bulk_write
+
+        Args:
+            news_list: Lista de notícias (a chave única é o campo 'url')
+
+        Returns:
+            Dicionário com contagens de inseridas/atualizadas e erros
+        """
+        summary = {"inserted": 0, "updated": 0, "errors": []}
+        if not news_list:
+            return summary
+
+        news_list = [dict(news_data) for news_data in news_list]
+        self._bodies.save_many([
+            body for body in map(self._bodies.split, news_list) if body
+        ])
+
+        now = datetime.now(timezone.utc)
+        operations = [
+            UpdateOne(
+                {'url': news_data['url']},
+                self._upsert_update(news_data, now),
+                upsert=True
+            )
+            for news_data in news_list
+        ]
+
+        try:
+            result = self._db.db[self.COLLECTION].bulk_write(
+                operations, ordered=False)
+            summary["inserted"] = result.upserted_count
+            summary["updated"] = result.matched_count
+            upserted_indexes = list(result.upserted_ids)
+        except BulkWriteError as e:
+            details = e.details
+            summary["inserted"] = details.get('nUpserted', 0)
+            summary["updated"] = details.get('nMatched', 0)
+            upserted_indexes = [u['index'] for u in details.get('upserted', [])]
+            summary["errors"] = [
+                {
+                    "url": news_list[error['index']]['url'],
+                    "error": error.get('errmsg', 'erro desconhecido')
+                }
+                for error in details.get('writeErrors', [])
+            ]
+            log.error(
+                f"Erros no bulk upsert: {len(summary['errors'])} de {len(news_list)}")
+
+        self._inc_publish_stats(
+            total=len(upserted_indexes),
+            pending=sum(
+                1 for index in upserted_indexes
+                if news_list[index].get('status') == 'success'
+            )
+        )
+        log.info(
+            f"Bulk upsert: {summary['inserted']} criadas, {summary['updated']} atualizadas")
+        return summary
+
+    def list_recent(self, limit: int = 50, fields: str = "full") -> List[Dict[str, Any]]:
         """Lista as notícias mais recentes"""
-        return self._db.find_many(self.COLLECTION, {}, limit=limit)
+        results = list(
+            self._db.db[self.COLLECTION].find({}, self._projection(fields))
+            .sort('created_at', -1).limit(limit)
+        )
+        for r in results:
+            r['_id'] = str(r['_id'])
+        return results
+
+    def list_news(
+        self,
+        limit: int = 50,
+        after: Optional[Tuple[datetime, str]] = None,
+        source: Optional[str] = None,
+        llm_status: Optional[str] = None,
+        published: Optional[bool] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        fields: str = "summary"
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Lista notícias com paginação por chave (keyset) em (created_at, _id)
+
+        Em vez de skip/offset, cada página continua a partir da última chave
+        da página anterior: o custo de uma página profunda é o mesmo da
+        primeira, pois a consulta percorre o índice a partir da chave.
+
+        Args:
+            limit: Itens por página
+            after: Chave (created_at, _id) do último item da página anterior
+            source: Filtra por fonte
+            llm_status: Filtra pelo status do processamento LLM
+            published: Filtra por publicadas (True) ou não publicadas (False)
+            created_from: Data mínima de criação (inclusive)
+            created_to: Data máxima de criação (exclusive)
+            fields: Conjunto de campos (full, summary, ids)
+
+        Returns:
+            Tupla (notícias da página, se há mais páginas)
+        """
+        projection = self._projection(fields)
+        if projection is not None:
+            # created_at é necessário para montar a chave da próxima página
+            projection = {**projection, 'created_at': 1}
+
+        query = self._news_filter(
+            source, llm_status, published, created_from, created_to, after)
+
+        results = list(
+            self._db.db[self.COLLECTION].find(query, projection)
+            .sort(self.KEYSET_SORT).limit(limit + 1)
+        )
+        has_more = len(results) > limit
+        results = results[:limit]
+        for r in results:
+            r['_id'] = str(r['_id'])
+        return results, has_more
+
+    def search_news(
+        self,
+        query: str,
+        limit: int = 20,
+        after: Optional[Tuple[float, str]] = None,
+        source: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Busca textual (índice de texto em português), ordenada por relevância
+
+        Args:
+            query: Termos de busca (aceita "frases" e -exclusões)
+            limit: Itens por página
+            after: Chave (score, _id) do último item da página anterior
+            source: Filtra por fonte
+            created_from: Data mínima de criação (inclusive)
+            created_to: Data máxima de criação (exclusive)
+
+        Returns:
+            Tupla (notícias com 'score', se há mais páginas)
+        """
+        results = list(self._db.db[self.COLLECTION].aggregate(
+            self._search_pipeline(query, limit, after, source, created_from, created_to)
+        ))
+        has_more = len(results) > limit
+        results = results[:limit]
+        for r in results:
+            r['_id'] = str(r['_id'])
+        return results, has_more
 
     def mark_as_published(
         self,
         mongodb_id: str,
         post_id: int,
-        post_url: str
+        post_url: str,
+        timings: Optional[Dict[str, float]] = None
     ) -> bool:
         """
         Marca uma notícia como publicada no WordPress
@@ -91,28 +363,68 @@ class MongoNewsRepository(NewsRepositoryInterface):
             mongodb_id: ID do documento
             post_id: ID do post no WordPress
             post_url: URL do post publicado
+            timings: Durações por etapa a gravar (ex: persist, publish)
 
         Returns:
             True se atualizado com sucesso
         """
         try:
-            result = self._db.db[self.COLLECTION].update_one(
+            # O documento anterior indica quais contadores mudaram
+            previous = self._db.db[self.COLLECTION].find_one_and_update(
                 {'_id': ObjectId(mongodb_id)},
-                {
-                    '$set': {
-                        'wordpress_published': True,
-                        'wordpress_post_id': post_id,
-                        'wordpress_url': post_url,
-                        'wordpress_published_at': datetime.now(timezone.utc),
-                        'publish_error': None
-                    }
-                }
+                self._published_update(post_id, post_url, timings),
+                projection=self.PUBLISH_STATE_PROJECTION,
+                return_document=ReturnDocument.BEFORE
             )
-            return result.modified_count > 0
+            if previous is None:
+                return False
+
+            self._inc_publish_stats(**self._published_deltas(previous))
+            return True
         except Exception as e:
             log.error(f"Erro ao marcar como publicado: {e}")
             return False
 
+    def claim_publish(self, mongodb_id: str, owner: str, ttl: int) -> bool:
+        """
+        Reserva a publicação da notícia para owner (atômico)
+
+        Todo caminho de publicação reserva antes de chamar o WordPress: só
+        um deles obtém a reserva de uma notícia ainda não publicada. A
+        reserva é reentrante (o mesmo owner a renova, ex.: retry da task)
+        e expira após ttl segundos se o dono parar sem liberá-la.
+
+        Args:
+            mongodb_id: ID do documento
+            owner: Dono da reserva (ID da task ou da requisição)
+            ttl: Validade da reserva em segundos
+
+        Returns:
+            True se a reserva é de owner
+        """
+        now = datetime.now(timezone.utc)
+        try:
+            result = self._db.db[self.COLLECTION].update_one(
+                self._claim_filter(mongodb_id, owner, now),
+                self._claim_update(owner, now, ttl)
+            )
+            return result.matched_count == 1
+        except Exception as e:
+            log.error(f"Erro ao reservar publicação de {mongodb_id}: {e}")
+            return False
+
+    def release_publish_claim(self, mongodb_id: str, owner: str) -> bool:
+        """Libera a reserva de publicação se ela ainda for de owner"""
+        try:
+            result = self._db.db[self.COLLECTION].update_one(
+                {'_id': ObjectId(mongodb_id), 'publish_claim.owner': owner},
+                {'$unset': {'publish_claim': ''}}
+            )
+            return result.modified_count == 1
+        except Exception as e:
+            log.error(f"Erro ao liberar publicação de {mongodb_id}: {e}")
+            return False
+
     def mark_publish_error(self, mongodb_id: str, error: str) -> bool:
         """
         Registra erro de publicação
@@ -125,45 +437,37 @@ class MongoNewsRepository(NewsRepositoryInterface):
             True se atualizado com sucesso
         """
         try:
-            result = self._db.db[self.COLLECTION].update_one(
+            previous = self._db.db[self.COLLECTION].find_one_and_update(
                 {'_id': ObjectId(mongodb_id)},
-                {
-                    '$set': {
-                        'publish_error': error,
-                        'publish_error_at': datetime.now(timezone.utc)
-                    },
-                    '$inc': {
-                        'publish_attempts': 1
-                    }
-                }
+                self._publish_error_update(error),
+                projection=self.PUBLISH_STATE_PROJECTION,
+                return_document=ReturnDocument.BEFORE
             )
-            return result.modified_count > 0
+            if previous is None:
+                return False
+
+            self._inc_publish_stats(**self._publish_error_deltas(previous))
+            return True
         except Exception as e:
             log.error(f"Erro ao registrar erro de publicação: {e}")
             return False
 
-    def find_pending_publish(self, limit: int = 50) -> List[Dict[str, Any]]:
+    def find_pending_publish(self, limit: int = 50, fields: str = "full") -> List[Dict[str, Any]]:
         """
         Busca notícias que ainda não foram publicadas no WordPress
 
         Args:
             limit: Número máximo de resultados
+            fields: Conjunto de campos (full, summary, ids)
 
         Returns:
             Lista de notícias pendentes
         """
+        projection = self._projection(fields)
         try:
             results = list(
                 self._db.db[self.COLLECTION].find(
-                    {
-                        'wordpress_published': {'$ne': True},
-                        'status': 'success',  # Apenas notícias processadas com sucesso
-                        '$or': [
-                            {'publish_attempts': {'$exists': False}},
-                            # Máximo 3 tentativas
-                            {'publish_attempts': {'$lt': 3}}
-                        ]
-                    }
+                    self._pending_filter(), projection
                 ).sort('created_at', -1).limit(limit)
             )
             for r in results:
@@ -173,20 +477,22 @@ class MongoNewsRepository(NewsRepositoryInterface):
             log.error(f"Erro ao buscar pendentes: {e}")
             return []
 
-    def find_published(self, limit: int = 50) -> List[Dict[str, Any]]:
+    def find_published(self, limit: int = 50, fields: str = "full") -> List[Dict[str, Any]]:
         """
         Busca notícias já publicadas no WordPress
 
         Args:
             limit: Número máximo de resultados
+            fields: Conjunto de campos (full, summary, ids)
 
         Returns:
             Lista de notícias publicadas
         """
+        projection = self._projection(fields)
         try:
             results = list(
                 self._db.db[self.COLLECTION].find(
-                    {'wordpress_published': True}
+                    {'wordpress_published': True}, projection
                 ).sort('wordpress_published_at', -1).limit(limit)
             )
             for r in results:
@@ -196,38 +502,586 @@ class MongoNewsRepository(NewsRepositoryInterface):
             log.error(f"Erro ao buscar publicadas: {e}")
             return []
 
-    def get_publish_stats(self) -> Dict[str, int]:
+    def get_publish_stats(self, exact: bool = False) -> Dict[str, int]:
         """
         Retorna estatísticas de publicação
 
+        Por padrão lê o documento de contadores (uma leitura por _id), mantido
+        com $inc a cada gravação. Se o documento ainda não existir, ele é
+        reconstruído a partir da coleção.
+
+        Args:
+            exact: Se True, recalcula a partir da coleção (varredura completa)
+
         Returns:
             Dicionário com contagens
         """
         try:
-            total = self._db.db[self.COLLECTION].count_documents({})
-            published = self._db.db[self.COLLECTION].count_documents(
-                {'wordpress_published': True}
-            )
-            pending = self._db.db[self.COLLECTION].count_documents(
-                {
-                    'wordpress_published': {'$ne': True},
-                    'status': 'success'
-                }
+            if exact:
+                return self.compute_publish_stats()
+
+            counters = self._db.db[self.COUNTERS_COLLECTION].find_one(
+                {'_id': self.PUBLISH_STATS_ID}
             )
-            errors = self._db.db[self.COLLECTION].count_documents(
-                {'publish_error': {'$ne': None}}
+            if counters is None:
+                return self.reconcile_publish_stats()
+
+            return {key: counters.get(key, 0) for key in self.PUBLISH_STATS_FIELDS}
+        except Exception as e:
+            log.error(f"Erro ao obter stats: {e}")
+            return {"error": str(e)}
+
+    def compute_publish_stats(self) -> Dict[str, int]:
+        """
+        Calcula as estatísticas de publicação em uma única agregação ($facet)
+
+        Returns:
+            Dicionário com contagens
+        """
+        row = next(
+            self._db.db[self.COLLECTION].aggregate(self._publish_stats_pipeline()), {})
+        return self._publish_stats_from_row(row)
+
+    def reconcile_publish_stats(self) -> Dict[str, int]:
+        """
+        Reconstrói o documento de contadores a partir da coleção
+
+        Corrige desvios (gravações fora do repositório, falhas entre a
+        escrita da notícia e o $inc dos contadores).
+
+        Returns:
+            Contagens recalculadas
+        """
+        stats = self.compute_publish_stats()
+        self._db.db[self.COUNTERS_COLLECTION].replace_one(
+            {'_id': self.PUBLISH_STATS_ID},
+            {**stats, 'reconciled_at': datetime.now(timezone.utc)},
+            upsert=True
+        )
+        log.info(f"Contadores de publicação reconciliados: {stats}")
+        return stats
+
+    def _inc_publish_stats(self, **deltas: int) -> None:
+        """Aplica variações ao documento de contadores (ignora zeros)"""
+        deltas = {key: value for key, value in deltas.items() if value}
+        if not deltas:
+            return
+        try:
+            self._db.db[self.COUNTERS_COLLECTION].update_one(
+                {'_id': self.PUBLISH_STATS_ID},
+                {'$inc': deltas},
+                upsert=True
             )
+        except Exception as e:
+            # A notícia já foi gravada; o desvio é corrigido na reconciliação
+            log.error(f"Erro ao atualizar contadores de publicação: {e}")
 
-            return {
-                "total": total,
-                "published": published,
-                "pending": pending,
-                "with_errors": errors
+    @classmethod
+    def _pipeline_stats_pipeline(
+        cls,
+        since: datetime,
+        source: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Monta a agregação de percentis por etapa"""
+        match: Dict[str, Any] = {'fetched_at': {'$gte': since}}
+        if source:
+            match['source'] = source
+
+        group: Dict[str, Any] = {'_id': '$source', 'count': {'$sum': 1}}
+        for stage in PIPELINE_STAGES:
+            group[stage] = {
+                '$percentile': {
+                    'input': f'$timings.{stage}',
+                    'p': list(cls.PERCENTILES),
+                    'method': 'approximate'
+                }
             }
+        return [{'$match': match}, {'$group': group}]
+
+    def get_pipeline_stats(
+        self,
+        since: datetime,
+        source: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Agrega as durações por etapa em percentis (p50, p90, p99) por fonte
+
+        Usa o operador $percentile (MongoDB 7.0+); em servidores anteriores
+        agrupa as durações com $push e calcula os percentis no cliente.
+
+        Args:
+            since: Considera notícias extraídas a partir desta data
+            source: Filtra por fonte (opcional)
+
+        Returns:
+            Dicionário {fonte: {"count": n, "stages": {etapa: percentis}}}
+        """
+        try:
+            try:
+                rows = list(self._db.db[self.COLLECTION].aggregate(
+                    self._pipeline_stats_pipeline(since, source)
+                ))
+            except OperationFailure as e:
+                log.warning(f"$percentile indisponível ({e}); calculando percentis no cliente")
+                rows = self._client_percentiles(self._db.db[self.COLLECTION].aggregate(
+                    self._pipeline_stats_fallback_pipeline(since, source)
+                ))
+            return self._pipeline_stats_from_rows(rows)
         except Exception as e:
-            log.error(f"Erro ao obter stats: {e}")
+            log.error(f"Erro ao agregar timings: {e}")
             return {"error": str(e)}
 
+    @classmethod
+    def _pipeline_stats_fallback_pipeline(
+        cls,
+        since: datetime,
+        source: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Agregação sem $percentile (MongoDB < 7.0): junta as durações com $push"""
+        match = cls._pipeline_stats_pipeline(since, source)[0]
+        group: Dict[str, Any] = {'_id': '$source', 'count': {'$sum': 1}}
+        for stage in PIPELINE_STAGES:
+            group[stage] = {'$push': f'$timings.{stage}'}
+        return [match, {'$group': group}]
+
+    @classmethod
+    def _client_percentiles(cls, rows) -> List[Dict[str, Any]]:
+        """
+        Reduz as durações de cada etapa aos percentis (nearest-rank),
+        no mesmo formato devolvido pelo $percentile
+        """
+        result = []
+        for row in rows:
+            for stage in PIPELINE_STAGES:
+                values = sorted(v for v in row.get(stage) or [] if v is not None)
+                row[stage] = [
+                    values[max(0, math.ceil(p * len(values)) - 1)]
+                    for p in cls.PERCENTILES
+                ] if values else []
+            result.append(row)
+        return result
+
+    @classmethod
+    def _pipeline_stats_from_rows(cls, rows) -> Dict[str, Any]:
+        """Converte as linhas da agregação em {fonte: {count, stages}}"""
+        stats = {}
+        for row in rows:
+            stages = {}
+            for stage in PIPELINE_STAGES:
+                values = row.get(stage) or []
+                if not values or values[0] is None:
+                    continue
+                stages[stage] = {
+                    f"p{int(p * 100)}": round(value, 2)
+                    for p, value in zip(cls.PERCENTILES, values)
+                }
+            stats[row['_id'] or 'unknown'] = {
+                "count": row['count'],
+                "stages": stages
+            }
+        return stats
+
+    @classmethod
+    def _publish_stats_pipeline(cls) -> List[Dict[str, Any]]:
+        """Agregação $facet com todas as contagens de publicação"""
+        facets = {
+            'total': [{'$count': 'n'}],
+            'published': [
+                {'$match': {'wordpress_published': True}}, {'$count': 'n'}],
+            'pending': [
+                {'$match': cls._unpublished_filter()}, {'$count': 'n'}],
+            'with_errors': [
+                {'$match': {'publish_error': {'$ne': None}}}, {'$count': 'n'}],
+        }
+        return [{'$facet': facets}]
+
+    @classmethod
+    def _publish_stats_from_row(cls, row: Dict[str, Any]) -> Dict[str, int]:
+        """Extrai as contagens do resultado do $facet"""
+        return {
+            key: (row.get(key) or [{'n': 0}])[0]['n']
+            for key in cls.PUBLISH_STATS_FIELDS
+        }
+
+    @staticmethod
+    def _published_update(
+        post_id: int,
+        post_url: str,
+        timings: Optional[Dict[str, float]] = None
+    ) -> Dict[str, Any]:
+        """Update que marca a notícia como publicada"""
+        fields = {
+            'wordpress_published': True,
+            'wordpress_post_id': post_id,
+            'wordpress_url': post_url,
+            'wordpress_published_at': datetime.now(timezone.utc),
+            'publish_error': None
+        }
+        # Só as etapas posteriores à gravação do documento
+        for stage in ('persist', 'publish'):
+            if timings and stage in timings:
+                fields[f'timings.{stage}'] = timings[stage]
+        return {'$set': fields, '$unset': {'publish_claim': ''}}
+
+    @staticmethod
+    def publish_claim(owner: str, ttl: int, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Reserva de publicação gravada no documento (campo publish_claim)"""
+        now = now or datetime.now(timezone.utc)
+        return {'owner': owner, 'until': now + timedelta(seconds=ttl)}
+
+    @staticmethod
+    def _claim_filter(mongodb_id: str, owner: str, now: datetime) -> Dict[str, Any]:
+        """Notícia não publicada sem reserva, com reserva expirada ou já de owner"""
+        return {
+            '_id': ObjectId(mongodb_id),
+            'wordpress_published': {'$ne': True},
+            '$or': [
+                {'publish_claim': None},
+                {'publish_claim.until': {'$lte': now}},
+                {'publish_claim.owner': owner}
+            ]
+        }
+
+    @classmethod
+    def _claim_update(cls, owner: str, now: datetime, ttl: int) -> Dict[str, Any]:
+        return {'$set': {'publish_claim': cls.publish_claim(owner, ttl, now)}}
+
+    @staticmethod
+    def _published_deltas(previous: Dict[str, Any]) -> Dict[str, int]:
+        """Variações dos contadores ao publicar (a partir do estado anterior)"""
+        if previous.get('wordpress_published'):
+            return {}
+        return {
+            'published': 1,
+            'pending': -int(previous.get('status') == 'success'),
+            'with_errors': -int(previous.get('publish_error') is not None)
+        }
+
+    @staticmethod
+    def _publish_error_update(error: str) -> Dict[str, Any]:
+        """Update que registra um erro de publicação"""
+        return {
+            '$set': {
+                'publish_error': error,
+                'publish_error_at': datetime.now(timezone.utc)
+            },
+            '$inc': {
+                'publish_attempts': 1
+            }
+        }
+
+    @staticmethod
+    def _publish_error_deltas(previous: Dict[str, Any]) -> Dict[str, int]:
+        """Variações dos contadores ao registrar erro de publicação"""
+        return {'with_errors': int(previous.get('publish_error') is None)}
+
+    @staticmethod
+    def _news_filter(
+        source: Optional[str] = None,
+        llm_status: Optional[str] = None,
+        published: Optional[bool] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, str]] = None
+    ) -> Dict[str, Any]:
+        """Monta o filtro da listagem paginada"""
+        query: Dict[str, Any] = {}
+        if source:
+            query['source'] = source
+        if llm_status:
+            query['llm_status'] = llm_status
+        if published is True:
+            query['wordpress_published'] = True
+        elif published is False:
+            query['wordpress_published'] = {'$ne': True}
+
+        created_at: Dict[str, Any] = {}
+        if created_from:
+            created_at['$gte'] = created_from
+        if created_to:
+            created_at['$lt'] = created_to
+        if created_at:
+            query['created_at'] = created_at
+
+        if after:
+            # Itens estritamente "depois" da chave na ordem (created_at, _id) decrescente
+            after_created_at, after_id = after
+            after_id = ObjectId(after_id)
+            query['$and'] = [{'$or': [
+                {'created_at': {'$lt': after_created_at}},
+                {'created_at': after_created_at, '_id': {'$lt': after_id}}
+            ]}]
+        return query
+
+    @classmethod
+    def _search_pipeline(
+        cls,
+        query: str,
+        limit: int,
+        after: Optional[Tuple[float, str]] = None,
+        source: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """Monta a agregação da busca textual com paginação por (score, _id)"""
+        match = {
+            '$text': {'$search': query, '$language': 'portuguese'},
+            **cls._news_filter(
+                source=source, created_from=created_from, created_to=created_to)
+        }
+        pipeline: List[Dict[str, Any]] = [
+            {'$match': match},
+            {'$addFields': {'score': {'$meta': 'textScore'}}},
+        ]
+        if after:
+            after_score, after_id = after
+            after_id = ObjectId(after_id)
+            pipeline.append({'$match': {'$or': [
+                {'score': {'$lt': after_score}},
+                {'score': after_score, '_id': {'$lt': after_id}}
+            ]}})
+        pipeline += [
+            {'$sort': {'score': -1, '_id': -1}},
+            {'$limit': limit + 1},
+            {'$project': cls.SEARCH_PROJECTION},
+        ]
+        return pipeline
+
+    @classmethod
+    def _projection(cls, fields: str) -> Optional[Dict[str, int]]:
+        """
+        Resolve um conjunto de campos nomeado na projeção do MongoDB
+
+        Raises:
+            ValueError: Se o conjunto não existir
+        """
+        if fields not in cls.PROJECTIONS:
+            raise ValueError(
+                f"Conjunto de campos '{fields}' inválido. "
+                f"Opções: {', '.join(cls.PROJECTIONS)}")
+        return cls.PROJECTIONS[fields]
+
+    @staticmethod
+    def _upsert_update(news_data: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+        """
+        Monta o update de upsert: campos da notícia em $set e estado de
+        publicação inicial em $setOnInsert (preservado em atualizações)
+        """
+        fields = {k: v for k, v in news_data.items() if k != '_id'}
+        fields['updated_at'] = now
+        update = {
+            '$set': fields,
+            '$setOnInsert': {
+                'created_at': now,
+                'wordpress_published': False,
+                'wordpress_post_id': None,
+                'wordpress_url': None,
+                'publish_error': None
+            }
+        }
+        if news_data.get('_id') is not None:
+            # ID gerado pelo cliente (gravação adiada): só vale na criação
+            update['$setOnInsert']['_id'] = news_data['_id']
+        if fields.get(NewsBodyStore.SPLIT_FLAG):
+            # Remove cópias inline de gravações anteriores ao modo split
+            update['$unset'] = {field: '' for field in NewsBodyStore.BODY_FIELDS}
+        return update
+
+    @staticmethod
+    def _unpublished_filter() -> Dict[str, Any]:
+        """Filtro de notícias processadas e ainda não publicadas"""
+        return {
+            'status': 'success',  # Apenas notícias processadas com sucesso
+            'wordpress_published': {'$ne': True}
+        }
+
+    @classmethod
+    def _pending_filter(cls) -> Dict[str, Any]:
+        """Filtro de notícias pendentes de publicação (com tentativas restantes)"""
+        return {
+            **cls._unpublished_filter(),
+            '$or': [
+                {'publish_attempts': {'$exists': False}},
+                # Máximo 3 tentativas
+                {'publish_attempts': {'$lt': 3}}
+            ]
+        }
+
+    def find_archivable(self, published_before: datetime, limit: int) -> List[Dict[str, Any]]:
+        """
+        Busca notícias publicadas antes da data, completas, para arquivamento
+
+        Args:
+            published_before: Data limite de publicação no WordPress
+            limit: Tamanho do lote
+
+        Returns:
+            Notícias com o corpo anexado (_id como ObjectId)
+        """
+        documents = list(
+            self._db.db[self.COLLECTION].find({
+                'wordpress_published': True,
+                'wordpress_published_at': {'$lt': published_before}
+            }).sort('wordpress_published_at', 1).limit(limit)
+        )
+        return [self._bodies.attach(doc) for doc in documents]
+
+    def delete_archived(self, documents: List[Dict[str, Any]]) -> int:
+        """
+        Remove notícias já arquivadas (e seus corpos) da coleção principal
+
+        Args:
+            documents: Notícias publicadas retornadas por find_archivable
+
+        Returns:
+            Quantidade de notícias removidas
+        """
+        if not documents:
+            return 0
+        collection = self._db.db[self.COLLECTION]
+        result = collection.delete_many({
+            '_id': {'$in': [doc['_id'] for doc in documents]},
+            # Só remove se ainda estiver publicada (estado conferido no arquivamento)
+            'wordpress_published': True
+        })
+        # Corpos só das notícias de fato removidas: as que deixaram de estar
+        # publicadas (ou foram regravadas) continuam usando o seu
+        urls = [doc['url'] for doc in documents]
+        live = set(collection.distinct('url', {'url': {'$in': urls}}))
+        self._bodies.delete_many([url for url in urls if url not in live])
+        self._inc_publish_stats(
+            total=-result.deleted_count, published=-result.deleted_count)
+        return result.deleted_count
+
+    def delete_orphan_bodies(self, batch_size: int = 500) -> int:
+        """
+        Remove corpos de news_bodies cuja notícia não existe mais
+
+        O índice TTL das falhas de publicação remove documentos direto no
+        servidor, sem passar pelo repositório; os corpos dessas notícias
+        (modo split) ficam órfãos até esta varredura.
+
+        Args:
+            batch_size: Corpos conferidos por consulta
+
+        Returns:
+            Quantidade de corpos removidos
+        """
+        bodies = self._db.db[NewsBodyStore.COLLECTION]
+        collection = self._db.db[self.COLLECTION]
+        removed, last_url = 0, None
+        while True:
+            query = {'_id': {'$gt': last_url}} if last_url is not None else {}
+            urls = [body['_id'] for body in bodies.find(query, {'_id': 1})
+                    .sort('_id', 1).limit(batch_size)]
+            if not urls:
+                return removed
+            live = set(collection.distinct('url', {'url': {'$in': urls}}))
+            removed += self._bodies.delete_many([url for url in urls if url not in live])
+            last_url = urls[-1]
+
+    def split_inline_bodies(self, batch_size: int = 500) -> int:
+        """
+        Move o corpo (content, images) de documentos existentes para news_bodies
+
+        Percorre a coleção em lotes por _id; pode ser interrompida e
+        executada novamente (documentos já migrados são ignorados).
+
+        Args:
+            batch_size: Documentos por lote
+
+        Returns:
+            Quantidade de documentos migrados
+        """
+        collection = self._db.db[self.COLLECTION]
+        query = {
+            'content': {'$exists': True},
+            NewsBodyStore.SPLIT_FLAG: {'$ne': True}
+        }
+        projection = {'url': 1, **{field: 1 for field in NewsBodyStore.BODY_FIELDS}}
+        migrated = 0
+        last_id = None
+
+        while True:
+            page_query = dict(query)
+            if last_id is not None:
+                page_query['_id'] = {'$gt': last_id}
+            batch = list(
+                collection.find(page_query, projection).sort('_id', 1).limit(batch_size))
+            if not batch:
+                break
+
+            self._bodies.save_many([
+                self._bodies.encode(doc['url'], {
+                    field: doc.get(field) for field in NewsBodyStore.BODY_FIELDS})
+                for doc in batch
+            ])
+            collection.bulk_write([
+                UpdateOne(
+                    {'_id': doc['_id']},
+                    {
+                        '$set': {NewsBodyStore.SPLIT_FLAG: True},
+                        '$unset': {field: '' for field in NewsBodyStore.BODY_FIELDS}
+                    }
+                )
+                for doc in batch
+            ], ordered=False)
+
+            migrated += len(batch)
+            last_id = batch[-1]['_id']
+            log.info(f"Corpos migrados para {NewsBodyStore.COLLECTION}: {migrated}")
+
+        return migrated
+
+    def explain_queries(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Executa explain() em cada formato de consulta do repositório
+
+        Usado pela verificação de índices para detectar COLLSCAN. A contagem
+        exata das estatísticas (compute_publish_stats) fica de fora: é uma
+        varredura intencional, usada apenas na reconciliação.
+
+        Returns:
+            Dicionário {nome da consulta: saída do explain}
+        """
+        collection = self._db.db[self.COLLECTION]
+        since = datetime.now(timezone.utc)
+
+        return {
+            'find_by_url': collection.find(
+                {'url': 'https://explain.invalid/'}).limit(1).explain(),
+            'find_by_id': collection.find(
+                {'_id': ObjectId()}).limit(1).explain(),
+            'list_recent': collection.find({})
+            .sort('created_at', -1).limit(50).explain(),
+            'list_news': collection.find(self._news_filter(
+                after=(since, str(ObjectId())))).sort(self.KEYSET_SORT)
+            .limit(51).explain(),
+            'list_news.source': collection.find(self._news_filter(
+                source='g1', after=(since, str(ObjectId()))))
+            .sort(self.KEYSET_SORT).limit(51).explain(),
+            'list_news.published': collection.find(self._news_filter(
+                published=True, after=(since, str(ObjectId()))))
+            .sort(self.KEYSET_SORT).limit(51).explain(),
+            'find_pending_publish': collection.find(self._pending_filter())
+            .sort('created_at', -1).limit(50).explain(),
+            'publish_dispatcher.poll': collection.find(
+                {**self._pending_filter(), 'updated_at': {'$gte': since}})
+            .sort([('updated_at', 1), ('_id', 1)]).limit(100).explain(),
+            'find_published': collection.find({'wordpress_published': True})
+            .sort('wordpress_published_at', -1).limit(50).explain(),
+            'search_news': self._db.db.command(
+                'aggregate', self.COLLECTION,
+                pipeline=self._search_pipeline('explain', 20),
+                explain=True
+            ),
+            'get_pipeline_stats': self._db.db.command(
+                'aggregate', self.COLLECTION,
+                pipeline=self._pipeline_stats_pipeline(since),
+                explain=True
+            ),
+        }
+
     def close(self):
         """Fecha a conexão com o banco"""
         self._db.close()
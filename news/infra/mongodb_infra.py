@@ -4,6 +4,8 @@ from pymongo.errors import ConnectionFailure
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
 
+from core.metrics import mongo_event_listeners
+
 try:
     from core.logging import log
 except ImportError:
@@ -16,9 +18,17 @@ class MongoDBInfra:
     DEFAULT_URI = os.environ.get("MONGODB_URI", "mongodb://localhost:27017/")
     DEFAULT_DB = os.environ.get("MONGODB_DB", "news_feed_db")
 
-    def __init__(self, uri: str = None, db_name: str = None):
+    def __init__(
+        self,
+        uri: str = None,
+        db_name: str = None,
+        max_pool_size: int = 100,
+        min_pool_size: int = 0
+    ):
         self.uri = uri or self.DEFAULT_URI
         self.db_name = db_name or self.DEFAULT_DB
+        self.max_pool_size = max_pool_size
+        self.min_pool_size = min_pool_size
         self.client = None
         self.db = None
         self._connect()
@@ -26,7 +36,13 @@ class MongoDBInfra:
     def _connect(self):
         """Estabelece conexão com o MongoDB"""
         try:
-            self.client = MongoClient(self.uri, serverSelectionTimeoutMS=5000)
+            self.client = MongoClient(
+                self.uri,
+                serverSelectionTimeoutMS=5000,
+                maxPoolSize=self.max_pool_size,
+                minPoolSize=self.min_pool_size,
+                event_listeners=mongo_event_listeners()
+            )
             # Testa a conexão
             self.client.admin.command('ping')
             self.db = self.client[self.db_name]
@@ -0,0 +1,323 @@
+from typing import Optional, List, Dict, Any, Tuple
+from datetime import datetime, timezone
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument
+from pymongo.errors import OperationFailure
+from domain.interfaces import AsyncNewsRepositoryInterface
+from infra.mongo_news_repository import MongoNewsRepository
+from infra.news_body_store import NewsBodyStore
+
+try:
+    from core.logging import log
+except ImportError:
+    from loguru import logger as log
+
+
+# Filtros, projeções e agregações são os mesmos do repositório síncrono
+_queries = MongoNewsRepository
+
+
+class MotorNewsRepository(AsyncNewsRepositoryInterface):
+    """
+    Repositório de notícias assíncrono (Motor) para a API
+
+    Compartilha filtros, projeções e regras de contadores com o
+    MongoNewsRepository; só o acesso ao banco é não bloqueante.
+    """
+
+    def __init__(self, client: AsyncIOMotorClient, db_name: str):
+        """
+        Inicializa o repositório
+
+        Args:
+            client: Cliente Motor (injetado, compartilhado pelo processo)
+            db_name: Nome do banco de dados
+        """
+        self._client = client
+        self._db = client[db_name]
+
+    @property
+    def _collection(self):
+        return self._db[_queries.COLLECTION]
+
+    @property
+    def _counters(self):
+        return self._db[_queries.COUNTERS_COLLECTION]
+
+    async def find_by_id(self, mongodb_id: str, fields: str = "full") -> Optional[Dict[str, Any]]:
+        """
+        Busca notícia pelo ID do MongoDB
+
+        Args:
+            mongodb_id: ID do documento
+            fields: Conjunto de campos (full, summary, ids, article)
+
+        Returns:
+            Notícia encontrada ou None
+        """
+        projection = _queries._projection(fields)
+        try:
+            result = await self._collection.find_one(
+                {'_id': ObjectId(mongodb_id)}, projection
+            )
+            if result:
+                result['_id'] = str(result['_id'])
+            if NewsBodyStore.needs_body(result):
+                body = await self._db[NewsBodyStore.COLLECTION].find_one(
+                    {'_id': result['url']})
+                result.update(NewsBodyStore.decode(body) if body else {
+                    field: None for field in NewsBodyStore.BODY_FIELDS})
+            return result
+        except Exception as e:
+            log.error(f"Erro ao buscar por ID: {e}")
+            return None
+
+    async def list_news(
+        self,
+        limit: int = 50,
+        after: Optional[Tuple[datetime, str]] = None,
+        source: Optional[str] = None,
+        llm_status: Optional[str] = None,
+        published: Optional[bool] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        fields: str = "summary"
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Lista notícias com paginação por chave (keyset) em (created_at, _id)
+
+        Returns:
+            Tupla (notícias da página, se há mais páginas)
+        """
+        projection = _queries._projection(fields)
+        if projection is not None:
+            # created_at é necessário para montar a chave da próxima página
+            projection = {**projection, 'created_at': 1}
+
+        query = _queries._news_filter(
+            source, llm_status, published, created_from, created_to, after)
+
+        cursor = self._collection.find(query, projection) \
+            .sort(_queries.KEYSET_SORT).limit(limit + 1)
+        results = await cursor.to_list(length=limit + 1)
+
+        has_more = len(results) > limit
+        results = results[:limit]
+        for r in results:
+            r['_id'] = str(r['_id'])
+        return results, has_more
+
+    async def search_news(
+        self,
+        query: str,
+        limit: int = 20,
+        after: Optional[Tuple[float, str]] = None,
+        source: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Busca textual (índice de texto em português), ordenada por relevância
+
+        Returns:
+            Tupla (notícias com 'score', se há mais páginas)
+        """
+        results = await self._collection.aggregate(
+            _queries._search_pipeline(
+                query, limit, after, source, created_from, created_to)
+        ).to_list(length=limit + 1)
+
+        has_more = len(results) > limit
+        results = results[:limit]
+        for r in results:
+            r['_id'] = str(r['_id'])
+        return results, has_more
+
+    async def find_pending_publish(self, limit: int = 50, fields: str = "full") -> List[Dict[str, Any]]:
+        """
+        Busca notícias que ainda não foram publicadas no WordPress
+
+        Args:
+            limit: Número máximo de resultados
+            fields: Conjunto de campos (full, summary, ids)
+
+        Returns:
+            Lista de notícias pendentes
+        """
+        projection = _queries._projection(fields)
+        try:
+            cursor = self._collection.find(
+                _queries._pending_filter(), projection
+            ).sort('created_at', -1).limit(limit)
+            results = await cursor.to_list(length=limit)
+            for r in results:
+                r['_id'] = str(r['_id'])
+            return results
+        except Exception as e:
+            log.error(f"Erro ao buscar pendentes: {e}")
+            return []
+
+    async def mark_as_published(
+        self,
+        mongodb_id: str,
+        post_id: int,
+        post_url: str,
+        timings: Optional[Dict[str, float]] = None
+    ) -> bool:
+        """
+        Marca uma notícia como publicada no WordPress
+
+        Returns:
+            True se atualizado com sucesso
+        """
+        try:
+            previous = await self._collection.find_one_and_update(
+                {'_id': ObjectId(mongodb_id)},
+                _queries._published_update(post_id, post_url, timings),
+                projection=_queries.PUBLISH_STATE_PROJECTION,
+                return_document=ReturnDocument.BEFORE
+            )
+            if previous is None:
+                return False
+
+            await self._inc_publish_stats(**_queries._published_deltas(previous))
+            return True
+        except Exception as e:
+            log.error(f"Erro ao marcar como publicado: {e}")
+            return False
+
+    async def claim_publish(self, mongodb_id: str, owner: str, ttl: int) -> bool:
+        """Reserva a publicação da notícia para owner (ver MongoNewsRepository.claim_publish)"""
+        now = datetime.now(timezone.utc)
+        try:
+            result = await self._collection.update_one(
+                _queries._claim_filter(mongodb_id, owner, now),
+                _queries._claim_update(owner, now, ttl)
+            )
+            return result.matched_count == 1
+        except Exception as e:
+            log.error(f"Erro ao reservar publicação de {mongodb_id}: {e}")
+            return False
+
+    async def release_publish_claim(self, mongodb_id: str, owner: str) -> bool:
+        """Libera a reserva de publicação se ela ainda for de owner"""
+        try:
+            result = await self._collection.update_one(
+                {'_id': ObjectId(mongodb_id), 'publish_claim.owner': owner},
+                {'$unset': {'publish_claim': ''}}
+            )
+            return result.modified_count == 1
+        except Exception as e:
+            log.error(f"Erro ao liberar publicação de {mongodb_id}: {e}")
+            return False
+
+    async def mark_publish_error(self, mongodb_id: str, error: str) -> bool:
+        """
+        Registra erro de publicação
+
+        Returns:
+            True se atualizado com sucesso
+        """
+        try:
+            previous = await self._collection.find_one_and_update(
+                {'_id': ObjectId(mongodb_id)},
+                _queries._publish_error_update(error),
+                projection=_queries.PUBLISH_STATE_PROJECTION,
+                return_document=ReturnDocument.BEFORE
+            )
+            if previous is None:
+                return False
+
+            await self._inc_publish_stats(**_queries._publish_error_deltas(previous))
+            return True
+        except Exception as e:
+            log.error(f"Erro ao registrar erro de publicação: {e}")
+            return False
+
+    async def get_publish_stats(self, exact: bool = False) -> Dict[str, int]:
+        """
+        Retorna estatísticas de publicação (documento de contadores)
+
+        Args:
+            exact: Se True, recalcula a partir da coleção (varredura completa)
+
+        Returns:
+            Dicionário com contagens
+        """
+        try:
+            if exact:
+                return await self.compute_publish_stats()
+
+            counters = await self._counters.find_one(
+                {'_id': _queries.PUBLISH_STATS_ID}
+            )
+            if counters is None:
+                return await self.reconcile_publish_stats()
+
+            return {key: counters.get(key, 0) for key in _queries.PUBLISH_STATS_FIELDS}
+        except Exception as e:
+            log.error(f"Erro ao obter stats: {e}")
+            return {"error": str(e)}
+
+    async def compute_publish_stats(self) -> Dict[str, int]:
+        """Calcula as estatísticas de publicação em uma única agregação ($facet)"""
+        rows = await self._collection.aggregate(
+            _queries._publish_stats_pipeline()).to_list(length=1)
+        return _queries._publish_stats_from_row(rows[0] if rows else {})
+
+    async def reconcile_publish_stats(self) -> Dict[str, int]:
+        """Reconstrói o documento de contadores a partir da coleção"""
+        stats = await self.compute_publish_stats()
+        await self._counters.replace_one(
+            {'_id': _queries.PUBLISH_STATS_ID},
+            {**stats, 'reconciled_at': datetime.now(timezone.utc)},
+            upsert=True
+        )
+        log.info(f"Contadores de publicação reconciliados: {stats}")
+        return stats
+
+    async def get_pipeline_stats(
+        self,
+        since: datetime,
+        source: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Agrega as durações por etapa em percentis (p50, p90, p99) por fonte
+
+        Usa o operador $percentile (MongoDB 7.0+), com percentis calculados
+        no cliente em servidores anteriores.
+        """
+        try:
+            try:
+                rows = await self._collection.aggregate(
+                    _queries._pipeline_stats_pipeline(since, source)
+                ).to_list(length=None)
+            except OperationFailure as e:
+                log.warning(f"$percentile indisponível ({e}); calculando percentis no cliente")
+                rows = _queries._client_percentiles(await self._collection.aggregate(
+                    _queries._pipeline_stats_fallback_pipeline(since, source)
+                ).to_list(length=None))
+            return _queries._pipeline_stats_from_rows(rows)
+        except Exception as e:
+            log.error(f"Erro ao agregar timings: {e}")
+            return {"error": str(e)}
+
+    async def _inc_publish_stats(self, **deltas: int) -> None:
+        """Aplica variações ao documento de contadores (ignora zeros)"""
+        deltas = {key: value for key, value in deltas.items() if value}
+        if not deltas:
+            return
+        try:
+            await self._counters.update_one(
+                {'_id': _queries.PUBLISH_STATS_ID},
+                {'$inc': deltas},
+                upsert=True
+            )
+        except Exception as e:
+            # A notícia já foi gravada; o desvio é corrigido na reconciliação
+            log.error(f"Erro ao atualizar contadores de publicação: {e}")
+
+    def close(self):
+        """Fecha o cliente Motor"""
+        self._client.close()
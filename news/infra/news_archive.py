@@ -0,0 +1,157 @@
+import gzip
+import os
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any
+from bson import ObjectId, json_util
+from bson.json_util import JSONOptions, JSONMode
+from pymongo import ReplaceOne
+
+from core.config import settings
+from infra.mongodb_infra import MongoDBInfra
+
+try:
+    from core.logging import log
+except ImportError:
+    from loguru import logger as log
+
+
+_JSON_OPTIONS = JSONOptions(json_mode=JSONMode.RELAXED, tz_aware=False)
+
+
+class NewsArchive:
+    """
+    Armazenamento frio das notícias retiradas da coleção principal
+
+    Destinos:
+    - collection: documento completo em 'news_archive'
+    - ndjson: documento completo em arquivos NDJSON gzip (um por dia) e um
+      registro mínimo em 'news_archive' apontando para o arquivo
+
+    Em ambos os casos, 'news_archive' é a referência para leitura por ID.
+    """
+
+    COLLECTION = "news_archive"
+    # Campos mantidos no registro mínimo do destino ndjson
+    STUB_FIELDS = ('url', 'title', 'source', 'created_at',
+                   'wordpress_post_id', 'wordpress_url', 'wordpress_published_at')
+
+    def __init__(
+        self,
+        db: MongoDBInfra,
+        target: Optional[str] = None,
+        directory: Optional[str] = None
+    ):
+        """
+        Inicializa o arquivo
+
+        Args:
+            db: Instância de MongoDBInfra
+            target: 'collection' ou 'ndjson'
+            directory: Diretório dos arquivos NDJSON
+        """
+        self._db = db
+        self.target = target or settings.RETENTION_ARCHIVE_TARGET
+        self.directory = directory or settings.RETENTION_ARCHIVE_DIR
+
+    @property
+    def _collection(self):
+        return self._db.db[self.COLLECTION]
+
+    def write(self, documents: List[Dict[str, Any]]) -> None:
+        """
+        Arquiva um lote de notícias completas (idempotente por _id)
+
+        Args:
+            documents: Notícias com o corpo já anexado
+        """
+        if not documents:
+            return
+
+        now = datetime.now(timezone.utc)
+        if self.target == "ndjson":
+            path = self._write_ndjson(documents, now)
+            records = [
+                {
+                    '_id': doc['_id'],
+                    **{field: doc.get(field) for field in self.STUB_FIELDS},
+                    'archive_file': path,
+                    'archived_at': now
+                }
+                for doc in documents
+            ]
+        else:
+            records = [{**doc, 'archived_at': now} for doc in documents]
+
+        self._collection.bulk_write(
+            [ReplaceOne({'_id': record['_id']}, record, upsert=True) for record in records],
+            ordered=False
+        )
+
+    def _write_ndjson(self, documents: List[Dict[str, Any]], now: datetime) -> str:
+        """Acrescenta o lote ao arquivo NDJSON gzip do dia"""
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"news-{now:%Y-%m-%d}.ndjson.gz")
+        # Cada append gera um novo membro gzip; a leitura concatena os membros
+        with gzip.open(path, 'at', encoding='utf-8') as handle:
+            for doc in documents:
+                handle.write(json_util.dumps(doc, json_options=_JSON_OPTIONS))
+                handle.write('\n')
+        return path
+
+    def find_by_id(
+        self,
+        mongodb_id: str,
+        projection: Optional[Dict[str, int]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Lê uma notícia arquivada
+
+        Args:
+            mongodb_id: ID original do documento
+            projection: Campos a retornar (mesma projeção da coleção ativa)
+
+        Returns:
+            Notícia (com 'archived': True) ou None
+        """
+        record = self._collection.find_one({'_id': ObjectId(mongodb_id)})
+        if record is None:
+            return None
+
+        if record.get('archive_file'):
+            document = self._read_ndjson(record['archive_file'], record['_id'])
+            if document is None:
+                log.warning(
+                    f"Notícia {mongodb_id} não encontrada em {record['archive_file']}")
+                document = record
+        else:
+            document = record
+
+        document = self._project(document, projection)
+        document['_id'] = str(document['_id'])
+        document['archived'] = True
+        return document
+
+    @staticmethod
+    def _project(document: Dict[str, Any], projection: Optional[Dict[str, int]]) -> Dict[str, Any]:
+        """Aplica uma projeção de inclusão (o documento pode vir do NDJSON)"""
+        if not projection:
+            return document
+        return {
+            field: value for field, value in document.items()
+            if field == '_id' or projection.get(field)
+        }
+
+    @staticmethod
+    def _read_ndjson(path: str, mongodb_id: ObjectId) -> Optional[Dict[str, Any]]:
+        """Procura o documento no arquivo NDJSON (leitura sequencial)"""
+        if not os.path.exists(path):
+            return None
+        marker = str(mongodb_id)
+        with gzip.open(path, 'rt', encoding='utf-8') as handle:
+            for line in handle:
+                if marker not in line:
+                    continue
+                document = json_util.loads(line, json_options=_JSON_OPTIONS)
+                if document.get('_id') == mongodb_id:
+                    return document
+        return None
@@ -0,0 +1,143 @@
+import json
+from typing import Optional, List, Dict, Any
+from bson import Binary
+from pymongo import ReplaceOne
+
+from core.config import settings
+from infra.mongodb_infra import MongoDBInfra
+
+try:
+    from core.logging import log
+except ImportError:
+    from loguru import logger as log
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class NewsBodyStore:
+    """
+    Armazena o corpo das notícias (content, images) fora do documento principal
+
+    No modo 'split', os documentos da coleção de notícias guardam apenas
+    metadados e estado de publicação; o corpo fica em 'news_bodies', com
+    _id igual à URL, opcionalmente comprimido com zstd. A leitura funciona
+    em qualquer modo, para documentos já migrados.
+    """
+
+    COLLECTION = "news_bodies"
+    BODY_FIELDS = ("content", "images")
+    # Marca, no documento de metadados, que o corpo está em news_bodies
+    SPLIT_FLAG = "body_split"
+
+    def __init__(
+        self,
+        db: MongoDBInfra,
+        storage: Optional[str] = None,
+        compression: Optional[str] = None
+    ):
+        """
+        Inicializa o armazenamento de corpos
+
+        Args:
+            db: Instância de MongoDBInfra
+            storage: 'inline' (corpo no documento) ou 'split'
+            compression: 'none' ou 'zstd' (requer o pacote zstandard)
+        """
+        self._db = db
+        self.storage = storage or settings.NEWS_BODY_STORAGE
+        self.compression = compression or settings.NEWS_BODY_COMPRESSION
+
+        if self.compression == "zstd" and zstandard is None:
+            log.warning(
+                "NEWS_BODY_COMPRESSION=zstd requer o pacote 'zstandard'; "
+                "gravando corpos sem compressão")
+            self.compression = "none"
+
+    @property
+    def enabled(self) -> bool:
+        """Se as gravações devem separar o corpo dos metadados"""
+        return self.storage == "split"
+
+    @property
+    def _collection(self):
+        return self._db.db[self.COLLECTION]
+
+    def split(self, news_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Separa o corpo de um documento de notícia (altera news_data)
+
+        Args:
+            news_data: Documento completo da notícia
+
+        Returns:
+            Documento de corpo a gravar, ou None se o modo não for 'split'
+        """
+        if not self.enabled:
+            return None
+        body = {field: news_data.pop(field, None) for field in self.BODY_FIELDS}
+        news_data[self.SPLIT_FLAG] = True
+        return self.encode(news_data['url'], body)
+
+    def encode(self, url: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Monta o documento de corpo (comprimido se configurado)"""
+        if self.compression == "zstd":
+            raw = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            return {
+                '_id': url,
+                'codec': 'zstd',
+                'data': Binary(zstandard.ZstdCompressor().compress(raw))
+            }
+        return {'_id': url, 'codec': 'none', **body}
+
+    @classmethod
+    def decode(cls, document: Dict[str, Any]) -> Dict[str, Any]:
+        """Lê um documento de corpo, descomprimindo se necessário"""
+        if document.get('codec') == 'zstd':
+            if zstandard is None:
+                raise RuntimeError(
+                    "Corpo comprimido com zstd: instale o pacote 'zstandard'")
+            raw = zstandard.ZstdDecompressor().decompress(bytes(document['data']))
+            return json.loads(raw.decode('utf-8'))
+        return {field: document.get(field) for field in cls.BODY_FIELDS}
+
+    @classmethod
+    def needs_body(cls, news: Optional[Dict[str, Any]]) -> bool:
+        """Se o documento de metadados tem o corpo em news_bodies"""
+        return bool(news and news.get(cls.SPLIT_FLAG) and 'content' not in news)
+
+    def save(self, body: Dict[str, Any]) -> None:
+        """Grava (ou substitui) um corpo"""
+        self._collection.replace_one({'_id': body['_id']}, body, upsert=True)
+
+    def save_many(self, bodies: List[Dict[str, Any]]) -> None:
+        """Grava vários corpos em um único bulk_write"""
+        if bodies:
+            self._collection.bulk_write(
+                [ReplaceOne({'_id': body['_id']}, body, upsert=True) for body in bodies],
+                ordered=False
+            )
+
+    def delete_many(self, urls: List[str]) -> int:
+        """Remove os corpos das URLs informadas"""
+        if not urls:
+            return 0
+        return self._collection.delete_many({'_id': {'$in': urls}}).deleted_count
+
+    def attach(self, news: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Completa o documento de metadados com o corpo (se estiver separado)
+
+        Args:
+            news: Documento lido da coleção de notícias
+
+        Returns:
+            O mesmo documento, com content e images
+        """
+        if self.needs_body(news):
+            body = self._collection.find_one({'_id': news['url']})
+            news.update(self.decode(body) if body else {
+                field: None for field in self.BODY_FIELDS})
+        return news
@@ -0,0 +1,193 @@
+import threading
+import time
+from typing import Dict, Tuple, Optional
+
+from core import metrics
+from domain.entities import LLMResult
+from domain.interfaces import LLMServiceInterface, RateBudgetExceeded
+
+try:
+    from core.logging import log
+except ImportError:
+    from loguru import logger as log
+
+
+class RateBudget:
+    """
+    Orçamento de chamadas por minuto compartilhado entre os workers
+
+    Contador em janela fixa de 60s no Redis. As faixas 'normal' e 'low'
+    usam no máximo per_minute - reserved_high; a faixa 'high' pode usar o
+    orçamento inteiro, então a reserva fica livre para notícias urgentes
+    mesmo durante um backfill. Sem Redis, o contador é local ao processo.
+
+    Com um AdaptiveRateController, per_minute acompanha o limite ajustado
+    pelo controle AIMD e as chamadas observadas alimentam o controle.
+    """
+
+    # Incrementa apenas se houver orçamento na janela (atômico)
+    _ACQUIRE_SCRIPT = """
+        local current = tonumber(redis.call('get', KEYS[1]) or '0')
+        if current >= tonumber(ARGV[1]) then
+            return 0
+        end
+        if redis.call('incr', KEYS[1]) == 1 then
+            redis.call('expire', KEYS[1], 120)
+        end
+        return 1
+    """
+    WINDOW_SECONDS = 60
+
+    def __init__(
+        self,
+        redis_client,
+        name: str,
+        per_minute: int,
+        reserved_high: int = 0,
+        controller=None
+    ):
+        """
+        Args:
+            redis_client: Cliente redis-py (None usa contador local)
+            name: Nome do orçamento (ex.: 'llm', 'wordpress')
+            per_minute: Chamadas por minuto (0 desativa o limite)
+            reserved_high: Parte reservada para a faixa 'high'
+            controller: AdaptiveRateController que ajusta per_minute (opcional)
+        """
+        self._redis = redis_client
+        self.name = name
+        self._per_minute = max(0, per_minute)
+        self.reserved_high = max(0, reserved_high)
+        self.controller = controller
+        self._local: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def per_minute(self) -> int:
+        """Limite atual: ajustado pelo controle ou o valor configurado"""
+        if self.controller is not None and self._per_minute:
+            return self.controller.limit()
+        return self._per_minute
+
+    def limit_for(self, priority: str) -> int:
+        """
+        Chamadas por minuto disponíveis para a faixa
+
+        Se o limite ajustado cair abaixo da reserva, as faixas comuns
+        mantêm uma chamada por minuto para não parar por completo.
+        """
+        per_minute = self.per_minute
+        if priority == "high":
+            return per_minute
+        return max(min(1, per_minute), per_minute - self.reserved_high)
+
+    def observe(
+        self,
+        latency: Optional[float] = None,
+        error: bool = False,
+        throttled: bool = False
+    ) -> None:
+        """Registra uma chamada no controle adaptativo (se houver)"""
+        if self.controller is not None:
+            self.controller.record(latency, error=error, throttled=throttled)
+
+    def try_acquire(self, priority: str = "normal") -> bool:
+        """
+        Consome uma chamada do orçamento da janela atual
+
+        Args:
+            priority: Faixa da task ('high', 'normal' ou 'low')
+
+        Returns:
+            True se havia orçamento para a faixa
+        """
+        if self._per_minute == 0:
+            return True
+
+        window = int(time.time() // self.WINDOW_SECONDS)
+        limit = self.limit_for(priority)
+        if self._redis is not None:
+            try:
+                key = f"rate:{self.name}:{window}"
+                return bool(self._redis.eval(self._ACQUIRE_SCRIPT, 1, key, limit))
+            except Exception as e:
+                log.warning(f"Redis indisponível para o orçamento '{self.name}', usando contador local: {e}")
+
+        with self._lock:
+            current_window, used = self._local.get(self.name, (window, 0))
+            if current_window != window:
+                used = 0
+            if used >= limit:
+                return False
+            self._local[self.name] = (window, used + 1)
+            return True
+
+    def acquire(self, priority: str = "normal", timeout: float = 60.0) -> bool:
+        """
+        Aguarda orçamento para a faixa até o timeout
+
+        Args:
+            priority: Faixa da task
+            timeout: Espera máxima em segundos
+
+        Returns:
+            True se obteve orçamento
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.try_acquire(priority):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            # Tenta de novo na próxima janela (ou antes, se o timeout acabar)
+            time.sleep(min(remaining, self.seconds_to_next_window(), 5.0))
+
+    def seconds_to_next_window(self) -> float:
+        """Segundos até o orçamento ser renovado"""
+        return self.WINDOW_SECONDS - time.time() % self.WINDOW_SECONDS
+
+
+class BudgetedLLMService(LLMServiceInterface):
+    """
+    LLMServiceInterface que consome o orçamento da faixa antes de cada chamada
+
+    Só conta chamadas reais: reaproveitamentos de resumo não gastam orçamento.
+    A latência e o status de cada chamada alimentam o controle adaptativo.
+    """
+
+    def __init__(
+        self,
+        llm_service: LLMServiceInterface,
+        budget: RateBudget,
+        priority: str = "normal",
+        max_wait: float = 120.0
+    ):
+        """
+        Args:
+            llm_service: Serviço de LLM envolvido
+            budget: Orçamento compartilhado de chamadas ao LLM
+            priority: Faixa da task ('high', 'normal' ou 'low')
+            max_wait: Espera máxima (s) por orçamento antes de falhar
+        """
+        self._llm_service = llm_service
+        self._budget = budget
+        self._priority = priority
+        self._max_wait = max_wait
+
+    def process_content(self, content: str, title: str, subtitle: str) -> LLMResult:
+        if not self._budget.acquire(self._priority, self._max_wait):
+            raise RateBudgetExceeded(
+                f"Orçamento '{self._budget.name}' esgotado para a faixa {self._priority}")
+
+        started = time.perf_counter()
+        result = self._llm_service.process_content(
+            content=content, title=title, subtitle=subtitle)
+        # Sobrecarga: timeout, indisponível ou HTTP 5xx; 429 é throttling
+        self._budget.observe(
+            time.perf_counter() - started,
+            error=result.is_fallback() or result.status.startswith("error:5"),
+            throttled=result.status == "error:429"
+        )
+        metrics.observe_llm(result.status)
+        return result
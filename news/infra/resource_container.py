@@ -0,0 +1,342 @@
+import os
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict
+
+from core.config import settings
+from infra.mongodb_infra import MongoDBInfra
+from infra.mongo_news_repository import MongoNewsRepository
+
+try:
+    from core.logging import log
+except ImportError:
+    from loguru import logger as log
+
+
+class ResourceContainer:
+    """
+    Container de recursos compartilhados do processo
+
+    Mantém um único MongoClient (com pool), uma sessão HTTP com pool de
+    conexões e scrapers já configurados por schema. É inicializado no
+    lifespan do FastAPI e no worker_process_init do Celery, e fechado no
+    encerramento. Os getters inicializam sob demanda (CLI, pool solo).
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._pid: Optional[int] = None
+        self._mongo: Optional[MongoDBInfra] = None
+        self._news_repository: Optional[MongoNewsRepository] = None
+        self._http_session: Optional[requests.Session] = None
+        self._scrapers: Dict[str, object] = {}
+        self._llm_service = None
+        self._wordpress_publisher = None
+        self._async_news_repository = None
+        self._write_behind_repository = None
+        self._write_failure_handler = None
+        self._redis = None
+        self._enqueue_lock = None
+        self._rate_budgets: Dict[str, object] = {}
+        self._rate_controllers: Dict[str, object] = {}
+        self._checkpoint_store = None
+        self._dead_letters = None
+
+    def init(self) -> "ResourceContainer":
+        """Cria os recursos compartilhados deste processo"""
+        with self._lock:
+            self._reset_if_forked()
+            if self._mongo is None:
+                self._mongo = MongoDBInfra(
+                    max_pool_size=settings.MONGODB_MAX_POOL_SIZE,
+                    min_pool_size=settings.MONGODB_MIN_POOL_SIZE
+                )
+                self._news_repository = MongoNewsRepository(self._mongo)
+                if settings.MONGODB_ENSURE_INDEXES:
+                    from infra.mongo_index_manager import NewsIndexManager
+                    NewsIndexManager(self._mongo).ensure_indexes()
+            if self._http_session is None:
+                self._http_session = self._create_http_session()
+            self._pid = os.getpid()
+            log.info(f"Recursos compartilhados inicializados (pid {self._pid})")
+        return self
+
+    def _reset_if_forked(self):
+        """Descarta recursos herdados de um fork (MongoClient não é fork-safe)"""
+        if self._pid is not None and self._pid != os.getpid():
+            self._mongo = None
+            self._news_repository = None
+            self._http_session = None
+            self._scrapers = {}
+            self._llm_service = None
+            self._wordpress_publisher = None
+            self._async_news_repository = None
+            self._write_behind_repository = None
+            self._redis = None
+            self._enqueue_lock = None
+            self._rate_budgets = {}
+            self._rate_controllers = {}
+            self._checkpoint_store = None
+            self._dead_letters = None
+            self._pid = None
+
+    def _ensure_initialized(self):
+        """Inicializa sob demanda quando o processo não passou pelo init"""
+        if self._pid != os.getpid() or self._mongo is None:
+            self.init()
+
+    @staticmethod
+    def _create_http_session() -> requests.Session:
+        """Cria a sessão HTTP com pool de conexões configurável"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=settings.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=settings.HTTP_POOL_MAXSIZE
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def mongo(self) -> MongoDBInfra:
+        """Retorna a conexão MongoDB compartilhada"""
+        with self._lock:
+            self._ensure_initialized()
+            return self._mongo
+
+    def news_repository(self) -> MongoNewsRepository:
+        """Retorna o repositório de notícias sobre o cliente compartilhado"""
+        with self._lock:
+            self._ensure_initialized()
+            return self._news_repository
+
+    def set_write_failure_handler(self, handler) -> None:
+        """Define quem recebe as falhas da gravação adiada (ex.: o worker Celery)"""
+        self._write_failure_handler = handler
+
+    def write_behind_repository(self):
+        """
+        Retorna o repositório com gravação adiada (modo backfill)
+
+        Um buffer por processo, gravado no encerramento do container.
+        """
+        with self._lock:
+            self._ensure_initialized()
+            if self._write_behind_repository is None:
+                from infra.write_behind_repository import WriteBehindNewsRepository
+                self._write_behind_repository = WriteBehindNewsRepository(
+                    self._news_repository,
+                    on_failure=self._write_failure_handler
+                )
+            return self._write_behind_repository
+
+    def redis(self):
+        """Retorna o cliente Redis compartilhado (None se o pacote não existir)"""
+        with self._lock:
+            self._ensure_initialized()
+            if self._redis is None:
+                try:
+                    import redis
+                except ImportError:
+                    log.warning("Pacote redis não instalado")
+                    return None
+                self._redis = redis.Redis.from_url(
+                    settings.REDIS_URL, socket_timeout=2, socket_connect_timeout=2)
+            return self._redis
+
+    def enqueue_lock(self):
+        """Retorna as travas de deduplicação (Redis, ou locais sem Redis)"""
+        with self._lock:
+            self._ensure_initialized()
+            if self._enqueue_lock is None:
+                from infra.dedup_lock import EnqueueLock
+                self._enqueue_lock = EnqueueLock(self.redis())
+            return self._enqueue_lock
+
+    @staticmethod
+    def _rate_limits(name: str) -> tuple:
+        """(por minuto, reserva high, mínimo, máximo, latência alvo) do serviço"""
+        limits = {
+            "llm": (settings.LLM_RATE_PER_MINUTE, settings.LLM_RATE_RESERVED_HIGH,
+                    settings.LLM_RATE_MIN, settings.LLM_RATE_MAX,
+                    settings.LLM_LATENCY_TARGET),
+            "wordpress": (settings.WORDPRESS_RATE_PER_MINUTE,
+                          settings.WORDPRESS_RATE_RESERVED_HIGH,
+                          settings.WORDPRESS_RATE_MIN, settings.WORDPRESS_RATE_MAX,
+                          settings.WORDPRESS_LATENCY_TARGET),
+        }
+        return limits[name]
+
+    def rate_budget(self, name: str):
+        """Retorna o orçamento de chamadas por minuto ('llm' ou 'wordpress')"""
+        with self._lock:
+            self._ensure_initialized()
+            if name not in self._rate_budgets:
+                from infra.rate_budget import RateBudget
+                per_minute, reserved_high, *_ = self._rate_limits(name)
+                self._rate_budgets[name] = RateBudget(
+                    self.redis(), name, per_minute, reserved_high,
+                    controller=self.rate_controller(name))
+            return self._rate_budgets[name]
+
+    def rate_controller(self, name: str):
+        """
+        Retorna o controle AIMD do orçamento ('llm' ou 'wordpress')
+
+        None se o controle adaptativo estiver desativado ou o orçamento for 0.
+        """
+        with self._lock:
+            self._ensure_initialized()
+            per_minute, _, min_rate, max_rate, latency_target = self._rate_limits(name)
+            if not settings.ADAPTIVE_RATE_ENABLED or per_minute == 0:
+                return None
+            if name not in self._rate_controllers:
+                from infra.adaptive_rate import AdaptiveRateController
+                self._rate_controllers[name] = AdaptiveRateController(
+                    self.redis(), name,
+                    initial=per_minute,
+                    min_rate=min_rate,
+                    max_rate=max_rate,
+                    latency_target=latency_target,
+                    increase=settings.ADAPTIVE_RATE_INCREASE,
+                    decrease=settings.ADAPTIVE_RATE_DECREASE
+                )
+            return self._rate_controllers[name]
+
+    def checkpoint_store(self):
+        """Retorna os checkpoints por etapa das tasks (None se desativados)"""
+        if not settings.CHECKPOINTS_ENABLED:
+            return None
+        with self._lock:
+            self._ensure_initialized()
+            if self._checkpoint_store is None:
+                from infra.mongo_checkpoint_store import MongoCheckpointStore
+                self._checkpoint_store = MongoCheckpointStore(
+                    self._mongo, ttl_hours=settings.CHECKPOINT_TTL_HOURS)
+                if settings.MONGODB_ENSURE_INDEXES:
+                    self._checkpoint_store.ensure_indexes()
+            return self._checkpoint_store
+
+    def dead_letters(self):
+        """Retorna o registro de URLs com falha definitiva (None se desativado)"""
+        if not settings.DEAD_LETTER_ENABLED:
+            return None
+        with self._lock:
+            self._ensure_initialized()
+            if self._dead_letters is None:
+                from infra.dead_letter_store import DeadLetterStore
+                self._dead_letters = DeadLetterStore(
+                    self._mongo,
+                    quarantine_hours=settings.DEAD_LETTER_QUARANTINE_HOURS,
+                    max_attempts=settings.DEAD_LETTER_MAX_ATTEMPTS,
+                    ttl_days=settings.DEAD_LETTER_TTL_DAYS
+                )
+                if settings.MONGODB_ENSURE_INDEXES:
+                    self._dead_letters.ensure_indexes()
+            return self._dead_letters
+
+    def batch_tracker(self):
+        """Retorna o acompanhamento de lotes sobre o cliente compartilhado"""
+        with self._lock:
+            self._ensure_initialized()
+            from infra.batch_tracker import BatchTracker
+            return BatchTracker(self._mongo)
+
+    def async_news_repository(self):
+        """
+        Retorna o repositório assíncrono (Motor) usado pelos endpoints da API
+
+        O cliente Motor é criado no primeiro uso, já dentro do event loop.
+        """
+        with self._lock:
+            self._ensure_initialized()
+            if self._async_news_repository is None:
+                from motor.motor_asyncio import AsyncIOMotorClient
+                from core.metrics import mongo_event_listeners
+                from infra.motor_news_repository import MotorNewsRepository
+                client = AsyncIOMotorClient(
+                    MongoDBInfra.DEFAULT_URI,
+                    serverSelectionTimeoutMS=5000,
+                    maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+                    minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+                    event_listeners=mongo_event_listeners()
+                )
+                self._async_news_repository = MotorNewsRepository(
+                    client, MongoDBInfra.DEFAULT_DB)
+            return self._async_news_repository
+
+    def http_session(self) -> requests.Session:
+        """Retorna a sessão HTTP compartilhada"""
+        with self._lock:
+            self._ensure_initialized()
+            return self._http_session
+
+    def scraper(self, schema_name: str = "g1"):
+        """Retorna o scraper do schema (YAML carregado uma única vez)"""
+        with self._lock:
+            self._ensure_initialized()
+            if schema_name not in self._scrapers:
+                from scraper.g1_scraper import G1Scraper
+                self._scrapers[schema_name] = G1Scraper(
+                    schema_name=schema_name,
+                    session=self._http_session
+                )
+            return self._scrapers[schema_name]
+
+    def llm_service(self):
+        """Retorna o adapter do LLM usando a sessão HTTP compartilhada"""
+        with self._lock:
+            self._ensure_initialized()
+            if self._llm_service is None:
+                from services.llm_service_adapter import LLMServiceAdapter
+                self._llm_service = LLMServiceAdapter(
+                    use_cache=False, session=self._http_session)
+            return self._llm_service
+
+    def wordpress_publisher(self):
+        """Retorna o publicador do WordPress usando a sessão HTTP compartilhada"""
+        with self._lock:
+            self._ensure_initialized()
+            if self._wordpress_publisher is None:
+                from services.wordpress_publisher import WordPressPublisherService
+                self._wordpress_publisher = WordPressPublisherService(
+                    session=self._http_session)
+            return self._wordpress_publisher
+
+    def close(self):
+        """Fecha clientes e sessões do processo"""
+        with self._lock:
+            if self._pid != os.getpid():
+                # Recursos herdados de outro processo não são fechados aqui
+                self._reset_if_forked()
+                return
+            if self._write_behind_repository is not None:
+                # Grava o buffer antes de fechar o cliente
+                self._write_behind_repository.close()
+            if self._mongo is not None:
+                self._mongo.close()
+            if self._http_session is not None:
+                self._http_session.close()
+            if self._async_news_repository is not None:
+                self._async_news_repository.close()
+            if self._redis is not None:
+                self._redis.close()
+            self._mongo = None
+            self._news_repository = None
+            self._http_session = None
+            self._scrapers = {}
+            self._llm_service = None
+            self._wordpress_publisher = None
+            self._async_news_repository = None
+            self._write_behind_repository = None
+            self._redis = None
+            self._enqueue_lock = None
+            self._rate_budgets = {}
+            self._rate_controllers = {}
+            self._checkpoint_store = None
+            self._dead_letters = None
+            self._pid = None
+            log.info("Recursos compartilhados encerrados")
+
+
+container = ResourceContainer()
@@ -0,0 +1,158 @@
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from pymongo.errors import OperationFailure
+
+from core.config import settings
+from infra.mongodb_infra import MongoDBInfra
+from infra.mongo_news_repository import MongoNewsRepository
+from infra.news_archive import NewsArchive
+
+try:
+    from core.logging import log
+except ImportError:
+    from loguru import logger as log
+
+
+@dataclass
+class RetentionResult:
+    """Resultado de uma execução da retenção"""
+    archived: int = 0
+    batches: int = 0
+    ttl_days: int = 0
+    orphan_bodies: int = 0
+    elapsed_seconds: float = 0.0
+
+
+class RetentionManager:
+    """
+    Retenção em camadas da coleção de notícias
+
+    1. Notícias publicadas há mais de N dias vão para o arquivo (coleção
+       'news_archive' ou NDJSON gzip) e saem da coleção principal.
+    2. Notícias com erro de publicação e nunca publicadas são removidas
+       pelo próprio MongoDB, via índice TTL parcial sobre 'publish_error_at'.
+       Os corpos dessas notícias em 'news_bodies' (modo split) são
+       varridos ao final de cada execução.
+
+    O arquivamento roda em lotes, com pausa entre eles e um limite de
+    lotes por execução, para não competir com o tráfego normal.
+    """
+
+    TTL_INDEX_NAME = "failed_publish_ttl"
+
+    def __init__(
+        self,
+        db: MongoDBInfra,
+        repository: MongoNewsRepository,
+        archive: Optional[NewsArchive] = None,
+        archive_after_days: Optional[int] = None,
+        failed_ttl_days: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        batch_pause: Optional[float] = None,
+        max_batches: Optional[int] = None
+    ):
+        """
+        Inicializa a retenção (valores omitidos vêm das settings)
+
+        Args:
+            db: Instância de MongoDBInfra
+            repository: Repositório de notícias
+            archive: Destino do arquivamento
+            archive_after_days: Dias após a publicação para arquivar (0 desativa)
+            failed_ttl_days: Dias até remover falhas nunca publicadas (0 desativa)
+            batch_size: Notícias por lote
+            batch_pause: Pausa (s) entre lotes
+            max_batches: Máximo de lotes por execução
+        """
+        self._db = db
+        self._repository = repository
+        self._archive = archive or NewsArchive(db)
+        self._archive_after_days = self._pick(
+            archive_after_days, settings.RETENTION_ARCHIVE_AFTER_DAYS)
+        self._failed_ttl_days = self._pick(
+            failed_ttl_days, settings.RETENTION_FAILED_TTL_DAYS)
+        self._batch_size = max(1, self._pick(batch_size, settings.RETENTION_BATCH_SIZE))
+        self._batch_pause = self._pick(batch_pause, settings.RETENTION_BATCH_PAUSE)
+        self._max_batches = max(1, self._pick(max_batches, settings.RETENTION_MAX_BATCHES))
+
+    @staticmethod
+    def _pick(value, default):
+        return default if value is None else value
+
+    def apply(self) -> RetentionResult:
+        """
+        Executa a retenção: índice TTL e um ciclo de arquivamento
+
+        Returns:
+            RetentionResult com as contagens da execução
+        """
+        started = time.monotonic()
+        result = RetentionResult(ttl_days=self._failed_ttl_days)
+
+        self.ensure_ttl_index()
+
+        if self._archive_after_days > 0:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=self._archive_after_days)
+            while result.batches < self._max_batches:
+                documents = self._repository.find_archivable(cutoff, self._batch_size)
+                if not documents:
+                    break
+
+                # Grava no arquivo antes de remover: uma falha no meio não perde dados
+                self._archive.write(documents)
+                result.archived += self._repository.delete_archived(documents)
+                result.batches += 1
+
+                if len(documents) < self._batch_size:
+                    break
+                time.sleep(self._batch_pause)
+
+        if self._failed_ttl_days > 0:
+            # O TTL remove documentos sem passar pelo repositório
+            result.orphan_bodies = self._repository.delete_orphan_bodies(self._batch_size)
+
+        result.elapsed_seconds = round(time.monotonic() - started, 3)
+        log.info(
+            f"Retenção: {result.archived} notícias arquivadas em "
+            f"{result.batches} lotes, {result.orphan_bodies} corpos órfãos "
+            f"removidos ({result.elapsed_seconds}s)")
+        return result
+
+    def ensure_ttl_index(self) -> None:
+        """
+        Cria (ou ajusta) o índice TTL das falhas de publicação
+
+        O prazo vem das settings; se mudar, o índice é alterado via collMod.
+        Com o prazo em 0, o índice é removido.
+        """
+        collection = self._db.db[MongoNewsRepository.COLLECTION]
+        existing = collection.index_information().get(self.TTL_INDEX_NAME)
+
+        if self._failed_ttl_days <= 0:
+            if existing:
+                collection.drop_index(self.TTL_INDEX_NAME)
+                log.info("Índice TTL de falhas de publicação removido")
+            return
+
+        seconds = self._failed_ttl_days * 86400
+        if existing:
+            if existing.get('expireAfterSeconds') != seconds:
+                self._db.db.command(
+                    'collMod', MongoNewsRepository.COLLECTION,
+                    index={'name': self.TTL_INDEX_NAME, 'expireAfterSeconds': seconds})
+                log.info(f"Índice TTL de falhas ajustado para {self._failed_ttl_days} dias")
+            return
+
+        try:
+            collection.create_index(
+                [('publish_error_at', 1)],
+                name=self.TTL_INDEX_NAME,
+                expireAfterSeconds=seconds,
+                partialFilterExpression={'wordpress_published': False}
+            )
+            log.info(f"Índice TTL de falhas criado ({self._failed_ttl_days} dias)")
+        except OperationFailure as e:
+            log.error(f"Falha ao criar índice TTL: {e}")
@@ -0,0 +1,214 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Optional, List, Dict, Any, Callable, Tuple
+
+from bson import ObjectId
+
+from core.config import settings
+from infra.mongo_news_repository import MongoNewsRepository
+
+try:
+    from core.logging import log
+except ImportError:
+    from loguru import logger as log
+
+
+class WriteBehindError(Exception):
+    """Falha ao gravar uma notícia que estava no buffer"""
+
+    def __init__(self, message: str, url: Optional[str] = None):
+        super().__init__(message)
+        self.url = url
+
+
+# (notícia, future da gravação)
+_Entry = Tuple[Dict[str, Any], Future]
+
+
+class WriteBehindNewsRepository:
+    """
+    Repositório com gravação adiada (write-behind) para ingestão em volume
+
+    Envolve o MongoNewsRepository: upsert() apenas coloca a notícia no
+    buffer do processo e retorna o ID imediatamente; uma thread grava o
+    buffer com upsert_many (um bulk_write) quando atinge max_batch
+    notícias ou max_delay segundos. Os demais métodos são delegados ao
+    repositório envolvido.
+
+    O ID retornado é o informado em '_id' (notícia já conhecida) ou um
+    ObjectId novo, gravado no $setOnInsert. Falhas de gravação são
+    entregues ao on_failure com a notícia original (que carrega o task_id).
+    """
+
+    def __init__(
+        self,
+        repository: MongoNewsRepository,
+        max_batch: Optional[int] = None,
+        max_delay: Optional[float] = None,
+        on_failure: Optional[Callable[[Dict[str, Any], Exception], None]] = None
+    ):
+        """
+        Inicializa o buffer
+
+        Args:
+            repository: Repositório que recebe os bulk writes
+            max_batch: Notícias por bulk write (padrão: settings)
+            max_delay: Tempo máximo (s) de uma notícia no buffer (padrão: settings)
+            on_failure: Chamado para cada notícia que falhou na gravação
+        """
+        self._repository = repository
+        self._max_batch = max(1, max_batch or settings.WRITE_BEHIND_MAX_BATCH)
+        self._max_delay = max_delay or settings.WRITE_BEHIND_MAX_DELAY
+        self._on_failure = on_failure
+        self._buffer: List[_Entry] = []
+        # Notícias ainda não gravadas, por URL (leitura das próprias gravações)
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._condition = threading.Condition()
+        self._oldest: Optional[float] = None
+        self._closed = False
+        self._flusher = threading.Thread(
+            target=self._run, name="write-behind", daemon=True)
+        self._flusher.start()
+
+    def __getattr__(self, name: str):
+        return getattr(self._repository, name)
+
+    def upsert(self, url: str, news_data: Dict[str, Any]) -> str:
+        """
+        Coloca a notícia no buffer e retorna o ID sem esperar a gravação
+
+        Args:
+            url: URL da notícia (chave única)
+            news_data: Campos da notícia
+
+        Returns:
+            ID do documento
+        """
+        return self.upsert_async(url, news_data)[0]
+
+    def upsert_async(self, url: str, news_data: Dict[str, Any]) -> Tuple[str, Future]:
+        """
+        Coloca a notícia no buffer
+
+        Args:
+            url: URL da notícia (chave única)
+            news_data: Campos da notícia
+
+        Returns:
+            Tupla (ID do documento, Future concluída após a gravação)
+        """
+        news_data = {**news_data, 'url': url}
+        news_data['_id'] = self._object_id(news_data.get('_id'))
+        future: Future = Future()
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Buffer de gravação encerrado")
+            if url in self._pending:
+                # Mesma URL duas vezes no buffer: vale a última versão
+                news_data['_id'] = self._pending[url]['_id']
+            self._buffer.append((news_data, future))
+            self._pending[url] = news_data
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            if len(self._buffer) >= self._max_batch:
+                self._condition.notify()
+
+        return str(news_data['_id']), future
+
+    def find_by_url(self, url: str) -> Optional[Dict[str, Any]]:
+        """Busca pela URL considerando as notícias ainda no buffer"""
+        with self._condition:
+            pending = self._pending.get(url)
+        if pending is not None:
+            return {**pending, '_id': str(pending['_id'])}
+        return self._repository.find_by_url(url)
+
+    def flush(self) -> None:
+        """Grava imediatamente o conteúdo atual do buffer"""
+        with self._condition:
+            entries, self._buffer = self._buffer, []
+            self._oldest = None
+        self._write(entries)
+
+    def close(self, timeout: float = 30.0) -> None:
+        """Encerra a thread de gravação e grava o que restou no buffer"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._flusher.join(timeout)
+        self.flush()
+        log.info("Buffer de gravação adiada encerrado")
+
+    def _run(self) -> None:
+        """Laço da thread de gravação: grava por tamanho ou por tempo"""
+        while True:
+            with self._condition:
+                while not self._closed and not self._due():
+                    timeout = None
+                    if self._oldest is not None:
+                        timeout = max(0.0, self._oldest + self._max_delay - time.monotonic())
+                    self._condition.wait(timeout)
+                if self._closed:
+                    return
+                entries = self._buffer[:self._max_batch]
+                self._buffer = self._buffer[self._max_batch:]
+                self._oldest = time.monotonic() if self._buffer else None
+            self._write(entries)
+
+    def _due(self) -> bool:
+        """Indica se o buffer deve ser gravado agora"""
+        if not self._buffer:
+            return False
+        return (len(self._buffer) >= self._max_batch
+                or time.monotonic() - self._oldest >= self._max_delay)
+
+    def _write(self, entries: List[_Entry]) -> None:
+        """Grava um lote e conclui as futures (com erro nas que falharam)"""
+        if not entries:
+            return
+
+        # Uma operação por URL (a versão mais recente) no mesmo bulk write
+        news_list = list({news_data['url']: news_data for news_data, _ in entries}.values())
+        try:
+            summary = self._repository.upsert_many(news_list)
+            errors = {error['url']: error['error'] for error in summary['errors']}
+        except Exception as e:
+            log.exception(f"Falha no bulk write de {len(entries)} notícias: {e}")
+            errors = {news_data['url']: str(e) for news_data in news_list}
+
+        with self._condition:
+            for news_data, _ in entries:
+                if self._pending.get(news_data['url']) is news_data:
+                    del self._pending[news_data['url']]
+
+        for news_data, future in entries:
+            message = errors.get(news_data['url'])
+            if message is None:
+                future.set_result(str(news_data['_id']))
+                continue
+
+            error = WriteBehindError(
+                f"Falha na gravação adiada de {news_data['url']}: {message}",
+                news_data['url'])
+            future.set_exception(error)
+            if self._on_failure is not None:
+                try:
+                    self._on_failure(news_data, error)
+                except Exception as e:
+                    log.error(f"Erro ao reportar falha de gravação: {e}")
+
+        log.info(
+            f"Write-behind: {len(news_list) - len(errors)} gravadas, {len(errors)} falhas")
+
+    @staticmethod
+    def _object_id(value: Any) -> ObjectId:
+        """Converte o _id informado (ou gera um novo)"""
+        if isinstance(value, ObjectId):
+            return value
+        if value and ObjectId.is_valid(value):
+            return ObjectId(value)
+        return ObjectId()
@@ -1,5 +1,6 @@
 import sys
 import os
+import argparse
 import uvicorn
 import subprocess
 
@@ -23,16 +24,38 @@ def run_api():
     )
 
 
-def run_worker():
-    """Executa o worker Celery"""
+def run_worker(argv: list):
+    """Executa o worker Celery com um perfil de carga"""
+    from workers.profiles import PROFILES, get_profile
 
-    log.info("Iniciando Celery Worker...")
-    celery_app.worker_main([
-        'worker',
-        '--loglevel=info',
-        '--pool=solo',  # Windows compatibility
-        '-Q', 'celery,news'
-    ])
+    parser = argparse.ArgumentParser(
+        prog="run.py worker",
+        description="Inicia um worker Celery com o perfil (filas, pool, concorrência) da etapa")
+    parser.add_argument("--profile", default="all", choices=list(PROFILES),
+                        help="Perfil do worker")
+    parser.add_argument("--pool", choices=["prefork", "threads", "gevent", "solo"],
+                        help="Substitui o pool do perfil")
+    parser.add_argument("--concurrency", type=int,
+                        help="Substitui a concorrência do perfil")
+    parser.add_argument("--prefetch", type=int,
+                        help="Substitui o prefetch multiplier do perfil")
+    parser.add_argument("--queues", help="Substitui as filas (separadas por vírgula)")
+    parser.add_argument("--autoscale", metavar="MAX,MIN",
+                        help="Autoscaler do Celery (apenas pool prefork)")
+    parser.add_argument("--loglevel", default="info")
+    args = parser.parse_args(argv)
+
+    profile = get_profile(
+        args.profile,
+        pool=args.pool,
+        concurrency=args.concurrency,
+        prefetch_multiplier=args.prefetch,
+        queues=args.queues.split(",") if args.queues else None
+    )
+    worker_argv = profile.argv(autoscale=args.autoscale, loglevel=args.loglevel)
+
+    log.info(f"Iniciando Celery Worker (perfil {profile.name}): {' '.join(worker_argv[1:])}")
+    celery_app.worker_main(worker_argv)
 
 
 def run_flower():
@@ -53,14 +76,180 @@ def run_flower():
         sys.exit(1)
 
 
+def run_beat():
+    """Executa o Celery beat (tarefas periódicas de beat_schedule.yaml)"""
+    from workers.celery_app import celery_app
+
+    schedule = celery_app.conf.beat_schedule
+    log.info(f"Iniciando Celery beat com {len(schedule)} tarefas periódicas:")
+    for name, entry in schedule.items():
+        log.info(f"  {name}: {entry['task']} ({entry['schedule']!r})")
+
+    celery_app.start(['beat', '--loglevel=info'])
+
+
+def _read_urls(path: str) -> list:
+    """Lê URLs (uma por linha) de um arquivo ou do stdin"""
+    handle = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    with handle:
+        return [line.strip() for line in handle
+                if line.strip() and not line.startswith("#")]
+
+
+def run_backfill(argv: list):
+    """Executa um backfill de URLs pelo pipeline em lote"""
+
+    parser = argparse.ArgumentParser(
+        prog="run.py backfill",
+        description="Processa um arquivo de URLs pelo pipeline em lote")
+    parser.add_argument(
+        "file", help="Arquivo com uma URL por linha ('-' para stdin)")
+    parser.add_argument("--schema", default="g1", help="Schema YAML")
+    parser.add_argument("--enqueue", action="store_true",
+                        help="Envia para a fila 'backfill' em vez de executar localmente")
+    parser.add_argument("--chunk-size", type=int, default=1000,
+                        help="URLs por task quando usado com --enqueue")
+    parser.add_argument("--fetch", type=int, help="Downloads simultâneos")
+    parser.add_argument("--parse", type=int, help="Processos de parsing")
+    parser.add_argument("--llm", type=int, help="Chamadas simultâneas ao LLM")
+    parser.add_argument("--write-size", type=int,
+                        help="Documentos por bulk write")
+    args = parser.parse_args(argv)
+
+    urls = _read_urls(args.file)
+    log.info(f"Backfill com {len(urls)} URLs (schema: {args.schema})")
+
+    if args.enqueue:
+        from workers.tasks import process_news_backfill
+
+        for start in range(0, len(urls), args.chunk_size):
+            chunk = urls[start:start + args.chunk_size]
+            task = process_news_backfill.delay(chunk, args.schema)
+            log.info(f"Task de backfill criada: {task.id} ({len(chunk)} URLs)")
+        return
+
+    from domain.factories import UseCaseFactory
+    from domain.usecases import ProcessNewsBatchInput
+
+    use_case = UseCaseFactory.create_process_news_batch_usecase(
+        schema_name=args.schema,
+        fetch_concurrency=args.fetch,
+        parse_workers=args.parse,
+        llm_concurrency=args.llm,
+        write_batch_size=args.write_size
+    )
+    output = use_case.execute(ProcessNewsBatchInput(
+        urls=urls,
+        schema_name=args.schema,
+        task_id="cli-backfill"
+    ))
+
+    for error in output.errors:
+        log.warning(f"[{error['stage']}] {error['url']}: {error['error']}")
+    log.info(
+        f"Backfill concluído em {output.elapsed_seconds}s: "
+        f"{output.succeeded} sucesso, {output.failed} falhas "
+        f"({output.inserted} novas, {output.updated} atualizadas)")
+
+    if output.status == "error":
+        sys.exit(1)
+
+
+def run_indexes():
+    """Cria os índices declarados da coleção de notícias"""
+    from infra.mongo_index_manager import NewsIndexManager
+    from infra.resource_container import container
+
+    NewsIndexManager(container.mongo()).ensure_indexes()
+    container.close()
+
+
+def run_check_indexes():
+    """Verifica se alguma consulta do repositório faz COLLSCAN"""
+    from infra.mongo_index_manager import NewsIndexManager
+    from infra.resource_container import container
+
+    manager = NewsIndexManager(container.mongo())
+    report = manager.verify_query_plans(container.news_repository())
+    container.close()
+
+    failures = [name for name, plan in report.items() if plan["collscan"]]
+    for name, plan in report.items():
+        status = "COLLSCAN" if plan["collscan"] else "ok"
+        log.info(f"[{status}] {name}: {' > '.join(plan['stages'])}")
+
+    if failures:
+        log.error(f"Consultas sem índice: {failures}")
+        sys.exit(1)
+    log.info("Todas as consultas usam índices")
+
+
+def run_migrate_bodies(argv: list):
+    """Move o corpo das notícias existentes para a coleção news_bodies"""
+    from core.config import settings
+    from infra.resource_container import container
+
+    parser = argparse.ArgumentParser(
+        prog="run.py migrate-bodies",
+        description="Separa content/images dos documentos de notícias existentes")
+    parser.add_argument("--batch-size", type=int, default=500,
+                        help="Documentos por lote")
+    args = parser.parse_args(argv)
+
+    if settings.NEWS_BODY_STORAGE != "split":
+        log.warning(
+            "NEWS_BODY_STORAGE não é 'split': novas gravações continuarão "
+            "guardando o corpo no documento principal")
+
+    migrated = container.news_repository().split_inline_bodies(args.batch_size)
+    container.close()
+    log.info(f"Migração concluída: {migrated} notícias")
+
+
+def run_dispatcher():
+    """Executa o dispatcher de publicação (change stream / polling)"""
+    import signal
+    from infra.resource_container import container
+    from workers.publish_dispatcher import PublishDispatcher
+    from workers.tasks import enqueue_publish
+
+    dispatcher = PublishDispatcher(
+        container.mongo(),
+        enqueue=enqueue_publish
+    )
+    signal.signal(signal.SIGTERM, lambda *_: dispatcher.stop())
+
+    log.info("Iniciando dispatcher de publicação...")
+    try:
+        dispatcher.run()
+    except KeyboardInterrupt:
+        dispatcher.stop()
+    finally:
+        container.close()
+
+
 def show_help():
     """Mostra ajuda"""
     print("""
 News Structured Feed - Comandos disponíveis:
 
     python run.py api      - Inicia a API FastAPI (porta 8000)
-    python run.py worker   - Inicia o Celery Worker
+    python run.py worker [--profile urgent|scrape|llm|publish|all] [--autoscale 8,2]
+                           - Inicia o Celery Worker com o perfil da etapa
+                             (--pool, --concurrency, --prefetch, --queues ajustam o perfil)
     python run.py flower   - Inicia o Flower (monitor Celery, porta 5555)
+    python run.py beat     - Inicia o Celery beat (descoberta de notícias, varredura
+                             de publicações pendentes e manutenção; beat_schedule.yaml)
+    python run.py backfill <arquivo> [--schema g1] [--enqueue]
+                           - Processa um arquivo de URLs pelo pipeline em lote
+    python run.py dispatcher
+                           - Publica automaticamente notícias processadas
+                             (change stream do MongoDB, com fallback para polling)
+    python run.py migrate-bodies [--batch-size 500]
+                           - Move content/images existentes para news_bodies
+    python run.py indexes  - Cria os índices do MongoDB
+    python run.py check-indexes
+                           - Falha se alguma consulta do repositório fizer COLLSCAN
     
 Pré-requisitos:
     - Redis rodando em localhost:6379
@@ -83,9 +272,21 @@ if __name__ == "__main__":
     if command == "api":
         run_api()
     elif command == "worker":
-        run_worker()
+        run_worker(sys.argv[2:])
     elif command == "flower":
         run_flower()
+    elif command == "beat":
+        run_beat()
+    elif command == "backfill":
+        run_backfill(sys.argv[2:])
+    elif command == "dispatcher":
+        run_dispatcher()
+    elif command == "migrate-bodies":
+        run_migrate_bodies(sys.argv[2:])
+    elif command == "indexes":
+        run_indexes()
+    elif command == "check-indexes":
+        run_check_indexes()
     else:
         print(f"Comando desconhecido: {command}")
         show_help()
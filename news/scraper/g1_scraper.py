@@ -11,6 +11,7 @@ except ImportError:
     from loguru import logger as log
 
 from core.config import settings
+from domain.entities import ScrapeError, StageTimings
 from domain.interfaces import ScraperInterface, NewsArticle
 
 
@@ -39,9 +40,11 @@ class G1Scraper(ScraperInterface):
 
     DEFAULT_DOMAINS = ['g1.globo.com', 'www.g1.globo.com']
 
-    def __init__(self, schema_name: str = "g1"):
-        self.session = requests.Session()
-        self.session.headers.update(self.HEADERS)
+    def __init__(self, schema_name: str = "g1", session: Optional[requests.Session] = None):
+        # Sessão compartilhada (pool de conexões) quando fornecida pelo container;
+        # os headers de navegador vão em cada requisição, sem alterar a sessão
+        # usada também pelo LLM e pelo WordPress
+        self.session = session or requests.Session()
         self.schema_name = schema_name
         self.schema = self._load_schema(schema_name)
         self._init_from_schema()
@@ -86,6 +89,11 @@ class G1Scraper(ScraperInterface):
         if self.schema and 'validations' in self.schema:
             self.validations = self.schema['validations']
 
+        # Descoberta de URLs novas (feeds RSS/Atom)
+        self.discovery = {}
+        if self.schema and 'discovery' in self.schema:
+            self.discovery = self.schema['discovery'] or {}
+
     @property
     def source_name(self) -> str:
         """Retorna o nome da fonte"""
@@ -107,16 +115,60 @@ class G1Scraper(ScraperInterface):
         except Exception:
             return False
 
-    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
-        """Baixa e parseia a página HTML"""
+    def discover_urls(self, limit: int = 50) -> List[str]:
+        """
+        Lista as URLs mais recentes dos feeds da seção 'discovery' do schema
+
+        Args:
+            limit: Máximo de URLs (somando os feeds)
+
+        Returns:
+            URLs de notícias suportadas, sem repetição, na ordem dos feeds
+        """
+        limit = min(limit, self.discovery.get('max_items', limit))
+        urls: List[str] = []
+        for feed_url in self.discovery.get('feeds', []):
+            feed = self.fetch_html(feed_url)
+            if feed is None:
+                continue
+            soup = BeautifulSoup(feed, 'xml')
+            # RSS: <item><link>url</link>; Atom: <entry><link href="url"/>
+            for link in soup.select('item > link, entry > link'):
+                url = (link.get('href') or link.get_text()).strip()
+                if url and url not in urls and self.can_handle(url):
+                    urls.append(url)
+                if len(urls) >= limit:
+                    return urls
+        return urls
+
+    def fetch_html(self, url: str, timings: Optional[StageTimings] = None) -> Optional[bytes]:
+        """Baixa o HTML bruto da página (etapa de I/O)"""
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            return BeautifulSoup(response.content, 'lxml')
-        except requests.RequestException as e:
+            return self._download(url, timings or StageTimings())
+        except ScrapeError as e:
             log.error(f"Erro ao acessar página: {e}")
             return None
 
+    def _download(self, url: str, timings: StageTimings) -> bytes:
+        """Baixa a página, classificando as falhas (ScrapeError)"""
+        try:
+            with timings.span("fetch"):
+                response = self.session.get(url, headers=self.HEADERS, timeout=30)
+        except requests.RequestException as e:
+            raise ScrapeError("transient", f"Erro ao acessar {url}: {e}") from e
+        if response.status_code >= 400:
+            raise ScrapeError.from_status(response.status_code, url)
+        return response.content
+
+    def fetch_page(self, url: str, timings: Optional[StageTimings] = None) -> Optional[BeautifulSoup]:
+        """Baixa e parseia a página HTML"""
+        timings = timings or StageTimings()
+        html = self.fetch_html(url, timings)
+        if html is None:
+            return None
+        with timings.span("parse"):
+            return BeautifulSoup(html, 'lxml')
+
     def _get_selectors(self, selector_type: str) -> List[str]:
         """Retorna os seletores para um tipo específico do schema ou fallback"""
         return self.selectors.get(selector_type, self.DEFAULT_SELECTORS.get(selector_type, []))
@@ -268,28 +320,66 @@ class G1Scraper(ScraperInterface):
 
         return True
 
-    def scrape(self, url: str) -> Optional[NewsArticle]:
-        """Extrai todos os dados de uma notícia usando configurações do schema"""
-        log.info(f"Acessando: {url} (schema: {self.schema_name})")
-        soup = self.fetch_page(url)
-
-        if not soup:
-            return None
-
-        title = self.extract_title(soup)
-        subtitle = self.extract_subtitle(soup)
-        content = self.extract_content(soup)
-        author = self.extract_author(soup)
-        pub_date = self.extract_pub_date(soup)
-        images = self.extract_images(soup)
+    def scrape(self, url: str, timings: Optional[StageTimings] = None) -> Optional[NewsArticle]:
+        """
+        Extrai todos os dados de uma notícia usando configurações do schema
 
-        # Limpa os textos usando regex patterns do schema
-        content = self.clean_text(content)
+        Raises:
+            ScrapeError: Página inacessível ou fora das validações do schema
+        """
+        log.info(f"Acessando: {url} (schema: {self.schema_name})")
+        timings = timings or StageTimings()
+        html = self._download(url, timings)
+        with timings.span("parse"):
+            soup = BeautifulSoup(html, 'lxml')
+
+        return self._extract_article(url, soup, timings, strict=True)
+
+    def parse_html(
+        self,
+        url: str,
+        html: bytes,
+        timings: Optional[StageTimings] = None
+    ) -> Optional[NewsArticle]:
+        """Extrai a notícia de um HTML já baixado (etapa de CPU)"""
+        timings = timings or StageTimings()
+        with timings.span("parse"):
+            soup = BeautifulSoup(html, 'lxml')
+        return self._extract_article(url, soup, timings)
+
+    def _extract_article(
+        self,
+        url: str,
+        soup: BeautifulSoup,
+        timings: StageTimings,
+        strict: bool = False
+    ) -> NewsArticle:
+        """
+        Aplica seletores, limpeza e validação do schema ao HTML parseado
 
-        # Valida conforme regras do schema
-        if not self._validate_content(title, content):
-            log.warning(
-                f"Conteúdo não passou na validação do schema '{self.schema_name}'")
+        Com strict, uma notícia fora das validações gera ScrapeError
+        (invalid_content) em vez de apenas um aviso.
+        """
+        with timings.span("extract"):
+            title = self.extract_title(soup)
+            subtitle = self.extract_subtitle(soup)
+            content = self.extract_content(soup)
+            author = self.extract_author(soup)
+            pub_date = self.extract_pub_date(soup)
+            images = self.extract_images(soup)
+
+        with timings.span("clean"):
+            # Limpa os textos usando regex patterns do schema
+            content = self.clean_text(content)
+
+            # Valida conforme regras do schema
+            if not self._validate_content(title, content):
+                if strict:
+                    raise ScrapeError(
+                        "invalid_content",
+                        f"Conteúdo não passou na validação do schema '{self.schema_name}': {url}")
+                log.warning(
+                    f"Conteúdo não passou na validação do schema '{self.schema_name}'")
 
         return NewsArticle(
             title=title,
@@ -30,7 +30,9 @@ class LLMService:
     DEFAULT_MAX_RETRIES = 1
     MAX_CONTENT_LENGTH = 4000  # Limite para reduzir latência
 
-    def __init__(self, api_url: str = None, model: str = None):
+    def __init__(self, api_url: str = None, model: str = None, session: Optional[requests.Session] = None):
+        # Sessão compartilhada (keep-alive) quando fornecida pelo container
+        self._http = session or requests
         self.api_url = api_url or os.environ.get(
             "LM_API_URL", self.DEFAULT_API_URL)
         self.model = model or os.environ.get("LM_MODEL", self.DEFAULT_MODEL)
@@ -113,7 +115,7 @@ class LLMService:
                     log.warning(f"Retry {attempt + 1} em {wait}s...")
                     time.sleep(wait)
 
-                return requests.post(
+                return self._http.post(
                     self.api_url,
                     headers=headers,
                     json=payload,
@@ -24,6 +24,8 @@ class WordPressPublishResult:
     post_id: Optional[int] = None
     post_url: Optional[str] = None
     error: Optional[str] = None
+    status_code: Optional[int] = None
+    timed_out: bool = False
 
 
 class WordPressPublisherService:
@@ -39,7 +41,8 @@ class WordPressPublisherService:
         self,
         wordpress_url: str = None,
         api_key: str = None,
-        default_status: str = "publish"
+        default_status: str = "publish",
+        session: Optional[requests.Session] = None
     ):
         """
         Inicializa o serviço
@@ -48,7 +51,9 @@ class WordPressPublisherService:
             wordpress_url: URL base do WordPress (ex: http://localhost:8080)
             api_key: Chave de API configurada no plugin
             default_status: Status padrão dos posts (publish, draft, pending)
+            session: Sessão HTTP compartilhada (reaproveita conexões)
         """
+        self._http = session or requests
         self.wordpress_url = wordpress_url or os.environ.get(
             "WORDPRESS_URL", "http://localhost:8080"
         )
@@ -120,7 +125,7 @@ class WordPressPublisherService:
             headers["X-API-Key"] = self.api_key
 
         try:
-            response = requests.post(
+            response = self._http.post(
                 self.webhook_url,
                 json=payload,
                 headers=headers,
@@ -139,7 +144,8 @@ class WordPressPublisherService:
                 log.error("2. Se o plugin 'Content Receiver' está ativado")
                 return WordPressPublishResult(
                     success=False,
-                    error="REST API não está funcionando. Configure os permalinks no WordPress (Configurações > Links Permanentes) e ative o plugin."
+                    error="REST API não está funcionando. Configure os permalinks no WordPress (Configurações > Links Permanentes) e ative o plugin.",
+                    status_code=response.status_code
                 )
 
             if response.status_code == 201:
@@ -149,7 +155,8 @@ class WordPressPublisherService:
                 return WordPressPublishResult(
                     success=True,
                     post_id=result.get("post_id"),
-                    post_url=result.get("post_url")
+                    post_url=result.get("post_url"),
+                    status_code=response.status_code
                 )
 
             # Erro na criação
@@ -159,7 +166,8 @@ class WordPressPublisherService:
 
             return WordPressPublishResult(
                 success=False,
-                error=f"HTTP {response.status_code}: {error_detail}"
+                error=f"HTTP {response.status_code}: {error_detail}",
+                status_code=response.status_code
             )
 
         except requests.exceptions.ConnectionError:
@@ -174,7 +182,8 @@ class WordPressPublisherService:
             log.error(f"Timeout ao conectar ao WordPress após {self.timeout}s")
             return WordPressPublishResult(
                 success=False,
-                error=f"Timeout após {self.timeout}s"
+                error=f"Timeout após {self.timeout}s",
+                timed_out=True
             )
 
         except Exception as e:
@@ -399,7 +408,7 @@ class WordPressPublisherService:
 
         try:
             # 1. Verifica se o WordPress está acessível
-            response = requests.get(
+            response = self._http.get(
                 f"{self.wordpress_url}/wp-json/",
                 timeout=5
             )
@@ -0,0 +1,86 @@
+"""
+Fixtures compartilhadas: MongoDB (mongomock) e Redis (fakeredis) em memória,
+ligados ao container de recursos, e fontes falsas de scraping e LLM
+"""
+import os
+
+import fakeredis
+import mongomock
+import pytest
+
+from core.config import settings
+from infra.mongo_news_repository import MongoNewsRepository
+from infra.mongodb_infra import MongoDBInfra
+from infra.resource_container import container as shared_container
+from tests.fakes import FakeLLM, FakePublisher, FakeScraper
+
+
+def _accept_bulk_sort():
+    """PyMongo >= 4.11 envia 'sort' nos UpdateOne/ReplaceOne em lote; o mongomock não o aceita"""
+    builder = mongomock.collection.BulkOperationBuilder
+    for name in ('add_update', 'add_replace'):
+        method = getattr(builder, name)
+        if 'sort' in method.__code__.co_varnames:
+            continue
+
+        def without_sort(self, *args, sort=None, _method=method, **kwargs):
+            return _method(self, *args, **kwargs)
+
+        setattr(builder, name, without_sort)
+
+
+_accept_bulk_sort()
+
+
+@pytest.fixture
+def mongo(monkeypatch):
+    """MongoDBInfra sobre um mongomock (sem servidor)"""
+    def connect(self):
+        self.client = mongomock.MongoClient()
+        self.db = self.client[self.db_name]
+
+    monkeypatch.setattr(MongoDBInfra, "_connect", connect)
+    return MongoDBInfra(db_name="news_test")
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeRedis()
+
+
+@pytest.fixture
+def repo(mongo):
+    return MongoNewsRepository(mongo)
+
+
+@pytest.fixture
+def container(mongo, repo, redis_client, monkeypatch):
+    """Container compartilhado ligado ao MongoDB e ao Redis em memória"""
+    monkeypatch.setattr(settings, "MONGODB_ENSURE_INDEXES", False)
+    shared_container._reset_if_forked()
+    shared_container._mongo = mongo
+    shared_container._news_repository = repo
+    shared_container._redis = redis_client
+    shared_container._pid = os.getpid()
+    yield shared_container
+    # Força o próximo teste a ligar os seus próprios recursos
+    shared_container._pid = -1
+    shared_container._reset_if_forked()
+
+
+@pytest.fixture
+def scraper():
+    return FakeScraper()
+
+
+@pytest.fixture
+def llm():
+    return FakeLLM()
+
+
+@pytest.fixture
+def publisher(container):
+    """Publicador falso instalado no container"""
+    fake = FakePublisher()
+    container._wordpress_publisher = fake
+    return fake
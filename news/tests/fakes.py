@@ -0,0 +1,144 @@
+"""Implementações em memória das interfaces de scraping e LLM"""
+from typing import Dict, List, Optional
+
+from domain.entities import LLMResult, NewsArticle, StageTimings
+from domain.interfaces import LLMServiceInterface, ScraperInterface
+from domain.usecases import ProcessNewsUseCase
+
+
+def make_article(url: str = "https://g1.globo.com/noticia/a.ghtml", **fields) -> NewsArticle:
+    """Notícia extraída com valores padrão"""
+    values = {
+        'title': "Título",
+        'subtitle': "Subtítulo",
+        'content': "Conteúdo da notícia",
+        'author': "Redação",
+        'pub_date': "2026-01-01",
+        'url': url,
+        'images': [],
+        'source': "g1",
+    }
+    values.update(fields)
+    return NewsArticle(**values)
+
+
+def make_document(url: str = "https://g1.globo.com/noticia/a.ghtml", **fields) -> Dict:
+    """Documento de notícia processada, como o use case o grava"""
+    news = ProcessNewsUseCase.build_document(
+        make_article(url), LLMResult("Resumo", "success"), "g1", "task-1", "g1")
+    news.update(fields)
+    return news
+
+
+class FakeScraper(ScraperInterface):
+    """Scraper em memória: devolve artigos por URL e conta as extrações"""
+
+    def __init__(self, articles: Optional[Dict[str, NewsArticle]] = None, error=None):
+        self.articles = articles or {}
+        self.error = error
+        self.calls: List[str] = []
+
+    def scrape(self, url, timings: Optional[StageTimings] = None):
+        self.calls.append(url)
+        if self.error is not None:
+            raise self.error
+        return self.articles.get(url) or make_article(url)
+
+    def fetch_html(self, url, timings=None):
+        self.calls.append(url)
+        return url.encode()
+
+    def parse_html(self, url, html, timings=None):
+        return self.articles.get(url) or make_article(url)
+
+    def can_handle(self, url):
+        return "g1.globo.com" in url
+
+    @property
+    def source_name(self):
+        return "g1"
+
+
+class FakeLLM(LLMServiceInterface):
+    """LLM em memória: resume com um texto fixo e conta as chamadas"""
+
+    def __init__(self, resumo: str = "Resumo", status: str = "success"):
+        self.resumo = resumo
+        self.status = status
+        self.calls: List[str] = []
+
+    def process_content(self, content, title, subtitle):
+        self.calls.append(title)
+        return LLMResult(resumo=self.resumo, status=self.status)
+
+
+class _AsyncCursor:
+    """Cursor do mongomock com a API assíncrona do Motor (to_list)"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def __getattr__(self, name):
+        method = getattr(self._cursor, name)
+
+        def chained(*args, **kwargs):
+            self._cursor = method(*args, **kwargs)
+            return self
+        return chained
+
+    async def to_list(self, length=None):
+        documents = list(self._cursor)
+        return documents if length is None else documents[:length]
+
+
+class _AsyncCollection:
+    """Coleção do mongomock com métodos awaitable, como a do Motor"""
+
+    CURSOR_METHODS = ('find', 'aggregate')
+
+    def __init__(self, collection):
+        self._collection = collection
+
+    def __getattr__(self, name):
+        method = getattr(self._collection, name)
+        if name in self.CURSOR_METHODS:
+            return lambda *args, **kwargs: _AsyncCursor(method(*args, **kwargs))
+
+        async def awaitable(*args, **kwargs):
+            return method(*args, **kwargs)
+        return awaitable
+
+
+class _AsyncDatabase:
+    def __init__(self, database):
+        self._database = database
+
+    def __getitem__(self, name):
+        return _AsyncCollection(self._database[name])
+
+
+class AsyncMongoClient:
+    """Cliente no formato do AsyncIOMotorClient sobre um cliente mongomock"""
+
+    def __init__(self, client):
+        self._client = client
+
+    def __getitem__(self, name):
+        return _AsyncDatabase(self._client[name])
+
+    def close(self):
+        pass
+
+
+class FakePublisher:
+    """Publicador do WordPress em memória: registra cada post criado"""
+
+    def __init__(self, result=None):
+        from services.wordpress_publisher import WordPressPublishResult
+        self.result = result or WordPressPublishResult(
+            success=True, post_id=1, post_url="https://site/?p=1", status_code=201)
+        self.published: List[Dict] = []
+
+    def publish_from_processed_news(self, processed_data, category_name=None):
+        self.published.append(processed_data)
+        return self.result
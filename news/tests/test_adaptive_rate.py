@@ -0,0 +1,84 @@
+"""Controle AIMD dos limites de chamadas ao LLM e ao WordPress"""
+import pytest
+
+from infra.adaptive_rate import AdaptiveRateController
+from infra.rate_budget import RateBudget
+
+
+@pytest.fixture(params=[None, "redis"])
+def controller(request, redis_client):
+    client = redis_client if request.param else None
+    return AdaptiveRateController(
+        client, "llm", initial=20, min_rate=2, max_rate=22, latency_target=5.0, increase=2)
+
+
+def _calls(controller, count, latency=1.0, **flags):
+    for _ in range(count):
+        controller.record(latency, **flags)
+
+
+def test_throttling_halves_the_limit(controller):
+    _calls(controller, 9)
+    _calls(controller, 1, throttled=True)
+
+    state = controller.adjust(queue_depth=100)
+
+    assert (state['previous_limit'], state['limit'], state['reason']) == (20, 10, "throttled")
+    assert controller.limit() == 10
+
+
+def test_errors_above_the_ratio_decrease_the_limit(controller):
+    _calls(controller, 8)
+    _calls(controller, 2, latency=None, error=True)
+
+    state = controller.adjust()
+
+    assert (state['limit'], state['reason'], state['errors']) == (10, "errors", 2)
+
+
+def test_slow_responses_decrease_the_limit(controller):
+    _calls(controller, 5, latency=8.0)
+
+    state = controller.adjust()
+
+    assert (state['limit'], state['reason'], state['avg_latency']) == (10, "latency", 8.0)
+
+
+def test_healthy_service_with_backlog_grows_up_to_the_maximum(controller):
+    _calls(controller, 5)
+    assert controller.adjust(queue_depth=10)['limit'] == 22
+
+    _calls(controller, 5)
+    state = controller.adjust(queue_depth=10)
+
+    assert (state['limit'], state['reason']) == (22, "backlog")
+
+
+def test_without_demand_the_limit_holds(controller):
+    _calls(controller, 5)
+    assert controller.adjust(queue_depth=0)['reason'] == "steady"
+    # Os contadores são zerados a cada ciclo
+    assert controller.adjust(queue_depth=10)['reason'] == "steady"
+
+
+def test_limit_never_drops_below_the_minimum(controller):
+    for _ in range(10):
+        _calls(controller, 1, throttled=True)
+        controller.adjust()
+
+    assert controller.status()['limit'] == 2
+
+
+def test_budget_follows_the_adjusted_limit(redis_client):
+    controller = AdaptiveRateController(
+        redis_client, "wordpress", initial=4, min_rate=1, max_rate=10, latency_target=5.0)
+    budget = RateBudget(redis_client, "wordpress", per_minute=4, reserved_high=1,
+                        controller=controller)
+
+    _calls(controller, 1, throttled=True)
+    controller.adjust()
+
+    assert budget.per_minute == 2
+    assert budget.limit_for("normal") == 1
+    assert budget.try_acquire("normal") and not budget.try_acquire("normal")
+    assert budget.try_acquire("high")
@@ -0,0 +1,80 @@
+from types import SimpleNamespace
+
+import pytest
+
+from infra.batch_tracker import BatchTracker
+from infra.mongo_news_repository import MongoNewsRepository
+from infra.news_archive import NewsArchive
+from tests.fakes import make_document
+
+
+@pytest.fixture
+def tracker(mongo):
+    tracker = BatchTracker(mongo)
+    tracker.create("batch-1", "process", 3, ["t1", "t2", "t3"])
+    return tracker
+
+
+def test_counts_follow_the_child_task_events(tracker):
+    for event in ("started", "started", "succeeded", "started", "retried"):
+        tracker.record("batch-1", event)
+
+    batch = tracker.get("batch-1")
+
+    assert batch['counts'] == {
+        "pending": 1, "started": 1, "succeeded": 1, "failed": 0,
+        "quarantined": 0, "retried": 1
+    }
+    assert batch['progress'] == round(1 / 3, 4)
+    assert batch['finished_at'] is None
+
+
+def test_batch_finishes_when_every_child_ends(tracker):
+    for event in ("started", "succeeded", "started", "failed", "started", "quarantined"):
+        tracker.record("batch-1", event)
+
+    batch = tracker.get("batch-1")
+
+    assert batch['counts']['quarantined'] == 1
+    assert batch['counts']['failed'] == 1
+    assert batch['progress'] == 1.0
+    assert batch['finished_at'] is not None and batch['eta_seconds'] is None
+
+
+def test_unknown_batches_and_events_are_ignored(tracker):
+    tracker.record("other", "started")
+    tracker.record("batch-1", "exploded")
+
+    assert tracker.get("other") is None
+    assert tracker.get("batch-1")['counts']['started'] == 0
+
+
+@pytest.mark.parametrize("result, field", [
+    ({"status": "success"}, "succeeded"),
+    ({"status": "processing_error"}, "failed"),
+    ({"status": "quarantined"}, "quarantined"),
+])
+def test_success_signal_maps_the_task_status(container, result, field):
+    from workers.celery_app import batch_task_succeeded
+
+    tracker = container.batch_tracker()
+    tracker.create("batch-1", "process", 1)
+    sender = SimpleNamespace(request=SimpleNamespace(group="batch-1"))
+
+    batch_task_succeeded(sender=sender, result=result)
+
+    assert tracker.get("batch-1")['counts'][field] == 1
+
+
+def test_archived_reads_apply_the_field_projection(mongo):
+    archive = NewsArchive(mongo, target="collection")
+    repo = MongoNewsRepository(mongo, archive=archive)
+    mongodb_id = repo.upsert("https://g1.globo.com/a", make_document("https://g1.globo.com/a"))
+    archive.write([mongo.db['news'].find_one({})])
+    mongo.db['news'].delete_many({})
+
+    news = repo.find_by_id(mongodb_id, fields="summary")
+
+    assert news['archived'] is True
+    assert 'content' not in news and 'summary' not in news
+    assert news['_id'] == mongodb_id and news['title'] == "Título"
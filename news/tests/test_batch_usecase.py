@@ -0,0 +1,62 @@
+from domain.usecases import ProcessNewsBatchInput, ProcessNewsBatchUseCase
+from tests.fakes import FakeScraper
+
+
+URLS = [f"https://g1.globo.com/noticia/{n}.ghtml" for n in range(5)]
+
+
+class FailingFetchScraper(FakeScraper):
+    """Falha no download das URLs informadas"""
+
+    def __init__(self, failing):
+        super().__init__()
+        self.failing = set(failing)
+
+    def fetch_html(self, url, timings=None):
+        if url in self.failing:
+            raise ConnectionError("timeout")
+        return super().fetch_html(url, timings)
+
+
+def build(scraper, llm, repo, **limits):
+    limits.setdefault("parse_workers", 0)
+    return ProcessNewsBatchUseCase(scraper, llm, repo, **limits)
+
+
+def test_pipeline_persists_every_url_once(repo, scraper, llm):
+    use_case = build(scraper, llm, repo, fetch_concurrency=3, write_batch_size=2)
+
+    output = use_case.execute(ProcessNewsBatchInput(urls=URLS + URLS[:2]))
+
+    assert output.status == "success"
+    assert output.total == 5
+    assert output.succeeded == output.inserted == 5
+    assert sorted(scraper.calls) == sorted(URLS)
+    assert len(llm.calls) == 5
+    assert {news['url'] for news in repo.list_recent(limit=10)} == set(URLS)
+
+
+def test_failures_are_reported_per_url_and_stage(repo, llm):
+    scraper = FailingFetchScraper([URLS[0]])
+    use_case = build(scraper, llm, repo)
+
+    output = use_case.execute(ProcessNewsBatchInput(urls=URLS[:2] + ["https://example.com/x"]))
+
+    assert output.status == "partial"
+    assert output.succeeded == 1
+    assert output.failed == 2
+    assert {(error['url'], error['stage']) for error in output.errors} == {
+        (URLS[0], "fetch"),
+        ("https://example.com/x", "validate"),
+    }
+
+
+def test_reprocessing_updates_instead_of_inserting(repo, scraper, llm):
+    use_case = build(scraper, llm, repo)
+    use_case.execute(ProcessNewsBatchInput(urls=URLS))
+
+    output = use_case.execute(ProcessNewsBatchInput(urls=URLS))
+
+    assert output.inserted == 0
+    assert output.updated == 5
+    assert repo.get_publish_stats()['total'] == 5
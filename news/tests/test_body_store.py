@@ -0,0 +1,65 @@
+import pytest
+
+from infra.mongo_news_repository import MongoNewsRepository
+from infra.news_body_store import NewsBodyStore, zstandard
+from tests.fakes import make_document
+
+
+URL = "https://g1.globo.com/noticia/a.ghtml"
+
+
+@pytest.fixture
+def split_repo(mongo):
+    return MongoNewsRepository(mongo, body_store=NewsBodyStore(mongo, storage="split"))
+
+
+def test_split_mode_keeps_the_body_out_of_the_news_document(mongo, split_repo):
+    mongodb_id = split_repo.upsert(URL, make_document(images=["https://img/1.jpg"]))
+
+    raw = mongo.db['news'].find_one({'url': URL})
+    assert 'content' not in raw and raw['body_split'] is True
+    assert mongo.db['news_bodies'].find_one({'_id': URL})['content'] == "Conteúdo da notícia"
+
+    news = split_repo.find_by_id(mongodb_id)
+    assert news['content'] == "Conteúdo da notícia"
+    assert news['images'] == ["https://img/1.jpg"]
+
+
+def test_bulk_writes_also_split_the_body(mongo, split_repo):
+    split_repo.upsert_many([make_document(URL)])
+
+    assert mongo.db['news_bodies'].count_documents({}) == 1
+    assert split_repo.find_by_url(URL)['content'] == "Conteúdo da notícia"
+
+
+def test_inline_documents_are_read_unchanged_in_any_mode(repo, split_repo):
+    mongodb_id = repo.upsert(URL, make_document())
+
+    assert split_repo.find_by_id(mongodb_id)['content'] == "Conteúdo da notícia"
+
+
+def test_missing_body_is_read_as_empty(mongo, split_repo):
+    mongodb_id = split_repo.upsert(URL, make_document())
+    mongo.db['news_bodies'].delete_many({})
+
+    news = split_repo.find_by_id(mongodb_id)
+
+    assert news['content'] is None and news['images'] is None
+
+
+@pytest.mark.skipif(zstandard is None, reason="requer o pacote zstandard")
+def test_zstd_round_trip(mongo):
+    store = NewsBodyStore(mongo, storage="split", compression="zstd")
+    body = store.encode(URL, {'content': "texto " * 100, 'images': []})
+
+    assert body['codec'] == "zstd"
+    assert NewsBodyStore.decode(body) == {'content': "texto " * 100, 'images': []}
+
+
+def test_zstd_without_the_package_falls_back_to_no_compression(mongo, monkeypatch):
+    monkeypatch.setattr("infra.news_body_store.zstandard", None)
+
+    store = NewsBodyStore(mongo, storage="split", compression="zstd")
+
+    assert store.compression == "none"
+    assert store.encode(URL, {'content': "x", 'images': []})['codec'] == "none"
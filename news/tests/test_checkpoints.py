@@ -0,0 +1,161 @@
+"""Checkpoints por etapa: o retry retoma de onde parou, sem misturar URLs"""
+import importlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+from domain.usecases import ProcessNewsInput, ProcessNewsUseCase
+from infra.mongo_checkpoint_store import MongoCheckpointStore
+from infra.motor_news_repository import MotorNewsRepository
+from workers import tasks
+from tests.fakes import AsyncMongoClient, FakeLLM, FakeScraper, make_article, make_document
+
+
+URL = "https://g1.globo.com/noticia/a.ghtml"
+OTHER_URL = "https://g1.globo.com/noticia/b.ghtml"
+
+
+class FailingLLM(FakeLLM):
+    """LLM que falha nas primeiras chamadas"""
+
+    def __init__(self, failures: int = 1):
+        super().__init__()
+        self.failures = failures
+
+    def process_content(self, content, title, subtitle):
+        if self.failures:
+            self.failures -= 1
+            self.calls.append(title)
+            raise TimeoutError("LLM fora do ar")
+        return super().process_content(content, title, subtitle)
+
+
+@pytest.fixture
+def checkpoints(mongo):
+    return MongoCheckpointStore(mongo)
+
+
+def _use_case(scraper, llm, repo, checkpoints):
+    return ProcessNewsUseCase(scraper, llm, repo, checkpoints=checkpoints)
+
+
+def test_retry_after_llm_failure_does_not_scrape_again(scraper, repo, checkpoints):
+    llm = FailingLLM()
+    use_case = _use_case(scraper, llm, repo, checkpoints)
+    input_data = ProcessNewsInput(url=URL, task_id="task-1")
+
+    failed = use_case.execute(input_data)
+    assert failed.status == "error" and failed.stage == "scraped"
+
+    output = use_case.execute(input_data)
+
+    assert output.status == "success"
+    assert scraper.calls == [URL]
+    assert len(llm.calls) == 2
+    assert checkpoints.load("task-1")['stage'] == "persisted"
+
+
+def test_retry_after_persist_failure_reuses_scrape_and_summary(
+        scraper, llm, repo, checkpoints, monkeypatch):
+    use_case = _use_case(scraper, llm, repo, checkpoints)
+    upsert = repo.upsert
+    calls = []
+
+    def flaky_upsert(url, news_data):
+        calls.append(url)
+        if len(calls) == 1:
+            raise ConnectionError("mongo fora do ar")
+        return upsert(url, news_data)
+
+    monkeypatch.setattr(repo, "upsert", flaky_upsert)
+    input_data = ProcessNewsInput(url=URL, task_id="task-1")
+
+    assert use_case.execute(input_data).stage == "summarised"
+    output = use_case.execute(input_data)
+
+    assert output.status == "success"
+    assert scraper.calls == [URL] and len(llm.calls) == 1
+    # Com a notícia gravada, o checkpoint guarda só a referência
+    assert 'article' not in checkpoints.load("task-1")
+
+
+def test_persisted_checkpoint_returns_the_saved_news(scraper, llm, repo, checkpoints):
+    use_case = _use_case(scraper, llm, repo, checkpoints)
+    first = use_case.execute(ProcessNewsInput(url=URL, task_id="task-1"))
+
+    output = use_case.execute(ProcessNewsInput(url=URL, task_id="task-1", force=True))
+
+    assert output.freshness == "checkpoint"
+    assert output.mongodb_id == first.mongodb_id
+    assert scraper.calls == [URL]
+
+
+def test_checkpoint_of_another_url_is_ignored(repo, checkpoints):
+    scraper = FakeScraper({
+        URL: make_article(URL, title="Notícia A"),
+        OTHER_URL: make_article(OTHER_URL, title="Notícia B", content="Outro texto"),
+    })
+    llm = FailingLLM()
+    use_case = _use_case(scraper, llm, repo, checkpoints)
+
+    # A primeira URL para após a extração, deixando um checkpoint 'scraped'
+    assert use_case.execute(ProcessNewsInput(url=URL, task_id="fixo")).stage == "scraped"
+
+    # Outra URL com o mesmo task_id não pode herdar o artigo extraído
+    output = use_case.execute(ProcessNewsInput(url=OTHER_URL, task_id="fixo"))
+
+    assert output.status == "success"
+    assert output.url == OTHER_URL and output.title == "Notícia B"
+    assert scraper.calls == [URL, OTHER_URL]
+    assert repo.find_by_url(OTHER_URL)['content'] == "Outro texto"
+    assert repo.find_by_url(URL) is None
+    assert checkpoints.load("fixo")['input_url'] == OTHER_URL
+
+
+def test_sync_requests_do_not_share_checkpoints(container, mongo, scraper, llm, monkeypatch):
+    monkeypatch.setattr(
+        "domain.factories.UseCaseFactory.create_process_news_usecase",
+        lambda schema_name="g1", **kwargs: ProcessNewsUseCase(
+            scraper, llm, container.news_repository(),
+            checkpoints=MongoCheckpointStore(mongo)))
+    client = TestClient(importlib.import_module("api.app").app)
+
+    first = client.post("/process/sync", json={"url": URL})
+    second = client.post("/process/sync", json={"url": OTHER_URL})
+
+    assert first.status_code == 200 and second.status_code == 200
+    assert first.json()['mongodb_id'] != second.json()['mongodb_id']
+    assert second.json()['article']['url'] == OTHER_URL
+    assert mongo.db[MongoCheckpointStore.COLLECTION].count_documents({}) == 0
+
+
+def test_publish_endpoint_runs_without_checkpoints(
+        container, mongo, scraper, llm, publisher, monkeypatch):
+    container._async_news_repository = MotorNewsRepository(
+        AsyncMongoClient(mongo.client), mongo.db_name)
+    monkeypatch.setattr(
+        "domain.factories.UseCaseFactory.create_process_news_usecase",
+        lambda schema_name="g1", **kwargs: ProcessNewsUseCase(
+            scraper, llm, container.news_repository(),
+            checkpoints=MongoCheckpointStore(mongo)))
+    client = TestClient(importlib.import_module("api.app").app)
+
+    response = client.post("/publish", json={"url": URL})
+
+    # O dono da requisição vale só para a reserva de publicação
+    assert response.status_code == 200
+    assert len(publisher.published) == 1
+    assert mongo.db[MongoCheckpointStore.COLLECTION].count_documents({}) == 0
+    assert container.news_repository().find_by_url(URL)['task_id'] is None
+
+
+def test_publish_retry_after_the_post_does_not_post_again(container, repo, publisher):
+    mongodb_id = repo.upsert(URL, make_document())
+    container.checkpoint_store().save("task-1", "published", {
+        'mongodb_id': mongodb_id, 'post_id': 42, 'post_url': "https://wp/42"})
+
+    result = tasks.publish_to_wordpress.apply((mongodb_id,), task_id="task-1").get()
+
+    assert result['status'] == "published" and result['resumed'] is True
+    assert publisher.published == []
+    assert repo.find_by_id(mongodb_id)['wordpress_post_id'] == 42
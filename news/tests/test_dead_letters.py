@@ -0,0 +1,112 @@
+"""Dead letters e quarentena de URLs com falha definitiva"""
+import importlib
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from domain.entities import ScrapeError
+from domain.usecases import ProcessNewsUseCase
+from infra.dead_letter_store import DeadLetterStore
+from workers import tasks
+
+
+URL = "https://g1.globo.com/noticia/a.ghtml"
+
+
+@pytest.fixture
+def store(mongo):
+    return DeadLetterStore(mongo, quarantine_hours=1, max_attempts=3)
+
+
+@pytest.fixture
+def use_case(container, scraper, llm, monkeypatch):
+    monkeypatch.setattr(
+        "domain.factories.UseCaseFactory.create_process_news_usecase",
+        lambda schema_name="g1", **kwargs: ProcessNewsUseCase(scraper, llm, container.news_repository()))
+
+
+def test_permanent_failure_quarantines_at_once(store):
+    entry = store.record(URL, "g1", "not_found", "HTTP 404", task_id="task-1")
+
+    assert entry['attempts'] == 1 and entry['failures'] == {"not_found": 1}
+    assert store.quarantined(URL + "?utm_source=tw")['_id'] == entry['_id']
+
+
+def test_transient_failures_quarantine_after_max_attempts(store):
+    store.record(URL, "g1", "exhausted", "timeout")
+    store.record(URL, "g1", "exhausted", "timeout")
+    assert store.quarantined(URL) is None
+
+    entry = store.record(URL, "g1", "exhausted", "timeout")
+
+    assert entry['attempts'] == 3 and entry['quarantined_until']
+    assert store.find_quarantined([URL, "https://g1.globo.com/b"]) == {URL}
+
+
+def test_quarantine_ends_with_time_or_release(store, mongo):
+    entry = store.record(URL, "g1", "blocked", "paywall")
+    mongo.db[DeadLetterStore.COLLECTION].update_one(
+        {'_id': entry['_id']},
+        {'$set': {'quarantined_until': datetime.now(timezone.utc) - timedelta(seconds=1)}})
+    assert store.quarantined(URL) is None
+
+    assert store.release(entry['_id'])['url'] == URL
+    assert store.get(entry['_id']) is None
+
+
+def test_list_counts_and_purge(store):
+    store.record(URL, "g1", "not_found", "404")
+    store.record("https://g1.globo.com/b", "g1", "exhausted", "timeout")
+
+    assert store.counts() == {"not_found": 1, "exhausted": 1}
+    assert [entry['url'] for entry in store.list(quarantined_only=True)] == [URL]
+    assert store.purge(failure="not_found") == 1
+    assert store.counts() == {"exhausted": 1}
+
+
+def test_permanent_scrape_failure_stops_new_submissions(container, scraper, use_case):
+    scraper.error = ScrapeError("not_found", "HTTP 404", status_code=404)
+
+    failed = tasks.process_news_url.apply((URL, "g1"), task_id="task-1").get()
+    assert failed['status'] == "error" and failed['failure'] == "not_found"
+
+    skipped = tasks.process_news_url.apply((URL, "g1"), task_id="task-2").get()
+
+    assert skipped['status'] == "quarantined" and skipped['failure'] == "not_found"
+    assert scraper.calls == [URL]
+
+    # force ignora a quarentena
+    tasks.process_news_url.apply((URL, "g1", True), task_id="task-3").get()
+    assert scraper.calls == [URL, URL]
+
+
+def test_exhausted_retries_are_recorded(container, scraper, use_case):
+    scraper.error = ScrapeError("transient", "timeout")
+
+    result = tasks.process_news_url.apply((URL, "g1"), task_id="task-1", retries=3).get()
+
+    assert result['failure'] == "transient"
+    assert container.dead_letters().get(DeadLetterStore.entry_id(URL))['attempts'] == 1
+
+
+@pytest.fixture
+def client(container):
+    return TestClient(importlib.import_module("api.app").app)
+
+
+def test_api_refuses_quarantined_urls_and_requeues_them(container, client, monkeypatch):
+    entry = container.dead_letters().record(URL, "g1", "not_found", "HTTP 404")
+    sent = []
+    monkeypatch.setattr(
+        tasks.process_news_url, "apply_async",
+        lambda args=None, kwargs=None, task_id=None, **options: sent.append(args))
+
+    refused = client.post("/process", json={"url": URL})
+    assert refused.status_code == 409
+    assert refused.json()['detail']['dead_letter_id'] == entry['_id']
+
+    requeued = client.post(f"/dead-letters/{entry['_id']}/requeue")
+    assert requeued.status_code == 200 and requeued.json()['status'] == "queued"
+    assert sent == [(URL, "g1")]
+    assert container.dead_letters().quarantined(URL) is None
@@ -0,0 +1,160 @@
+"""Deduplicação de enfileiramento por URL (travas com o ID da task dona)"""
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from infra.dedup_lock import EnqueueLock, normalize_url
+from workers import tasks
+from workers.celery_app import celery_app, dedup_lock_finished, dedup_lock_running
+
+
+URL = "https://g1.globo.com/noticia/a.ghtml"
+
+
+class BrokenRedis:
+    """Cliente Redis fora do ar"""
+
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise ConnectionError("redis fora do ar")
+        return fail
+
+
+@pytest.fixture
+def sent(container, monkeypatch):
+    """Mensagens enviadas ao broker por enqueue_unique (sem broker)"""
+    messages = []
+
+    def apply_async(args=None, kwargs=None, task_id=None, queue=None, **options):
+        messages.append({'args': args, 'kwargs': kwargs, 'task_id': task_id, 'queue': queue})
+
+    monkeypatch.setattr(tasks.process_news_url, "apply_async", apply_async)
+    return messages
+
+
+@pytest.fixture
+def lock(container):
+    return container.enqueue_lock()
+
+
+def test_normalize_url_drops_noise():
+    assert normalize_url("HTTPS://G1.Globo.com:443/a/?utm_source=x&b=2&a=1#topo") == \
+        "https://g1.globo.com/a?a=1&b=2"
+    assert normalize_url("http://g1.globo.com:8080/") == "http://g1.globo.com:8080/"
+
+
+@pytest.mark.parametrize("client", [None, "redis"])
+def test_lock_has_a_single_owner(redis_client, client):
+    lock = EnqueueLock(redis_client if client else None)
+
+    assert lock.acquire("k", "task-a", 60) is None
+    assert lock.acquire("k", "task-b", 60) == "task-a"
+    assert not lock.release("k", "task-b")
+    assert lock.extend("k", "task-a", 60)
+    assert lock.release("k", "task-a")
+    assert lock.acquire("k", "task-b", 60) is None
+
+
+def test_redis_failure_falls_back_to_the_local_lock():
+    lock = EnqueueLock(BrokenRedis())
+
+    assert lock.acquire("k", "task-a", 60) is None
+    assert lock.acquire("k", "task-b", 60) == "task-a"
+    assert lock.swap("k", "task-a", lock.pinned("task-a"), 60)
+    assert lock.extend("k", lock.pinned("task-a"), 60)
+    assert lock.release("k", lock.pinned("task-a"))
+    assert lock.owner_of("k") is None
+
+
+def test_local_lock_stays_local_after_redis_recovers(redis_client):
+    lock = EnqueueLock(BrokenRedis())
+    lock.acquire("k", "task-a", 60)
+    lock._redis = redis_client
+
+    assert lock.extend("k", "task-a", 60)
+    assert lock.release("k", "task-a")
+
+
+def test_same_url_is_enqueued_once(sent):
+    first, duplicate = tasks.enqueue_unique(tasks.process_news_url, URL)
+    again, duplicated = tasks.enqueue_unique(tasks.process_news_url, URL + "?utm_source=tw")
+
+    assert not duplicate and duplicated
+    assert again == first
+    assert len(sent) == 1 and sent[0]['queue'] == "news"
+
+
+def test_enqueue_from_a_worker_thread_reaches_the_configured_app(container, monkeypatch):
+    # A API enfileira de threads do threadpool: o proxy da task precisa
+    # resolver para celery_app, não para o app padrão do Celery
+    messages = []
+    monkeypatch.setattr(celery_app, "send_task", lambda name, args=None, kwargs=None, **options:
+                        messages.append((name, args, options.get('task_id'), options.get('queue'))))
+    enqueued = []
+    thread = threading.Thread(
+        target=lambda: enqueued.append(tasks.enqueue_unique(tasks.process_news_url, URL)))
+
+    thread.start()
+    thread.join(timeout=10)
+
+    [(task_id, duplicate)] = enqueued
+    assert not duplicate
+    assert messages == [(tasks.process_news_url.name, (URL, "g1"), task_id, "news")]
+
+
+def test_url_lock_ignores_the_lane(lock):
+    assert lock.url_key("t", URL, "g1") == lock.url_key("t", URL + "/", "g1")
+    assert lock.url_key("t", URL, "g1") != lock.url_key("t", URL, "outro")
+
+
+def test_high_lane_takes_over_queued_work(sent, container, lock):
+    queued, _ = tasks.enqueue_unique(tasks.process_news_url, URL, priority="low")
+    promoted, duplicate = tasks.enqueue_unique(tasks.process_news_url, URL, priority="high")
+
+    assert not duplicate and promoted != queued
+    assert [message['queue'] for message in sent] == ["news_low", "news_high"]
+
+    # A task antiga sai da fila e é ignorada sem processar a URL
+    result = tasks.process_news_url.apply((URL, "g1"), task_id=queued).get()
+    assert result == {
+        "status": "superseded", "task_id": queued, "url": URL, "superseded_by": promoted}
+
+    # Um novo pedido na faixa alta não substitui a task da faixa alta
+    again, duplicated = tasks.enqueue_unique(tasks.process_news_url, URL, priority="high")
+    assert duplicated and again == promoted
+
+
+def test_running_task_is_not_taken_over(sent, lock):
+    task_id, _ = tasks.enqueue_unique(tasks.process_news_url, URL)
+    sender = SimpleNamespace(name=tasks.process_news_url.name)
+
+    dedup_lock_running(sender=sender, task_id=task_id, args=(URL, "g1"))
+    owner, duplicate = tasks.enqueue_unique(tasks.process_news_url, URL, priority="high")
+
+    assert duplicate and owner == task_id
+    assert len(sent) == 1
+
+    dedup_lock_finished(sender=sender, task_id=task_id, args=(URL, "g1"), state="SUCCESS")
+    assert lock.owner_of(lock.url_key(sender.name, URL, "g1")) is None
+
+
+def test_retry_keeps_the_lock(sent, lock):
+    task_id, _ = tasks.enqueue_unique(tasks.process_news_url, URL)
+    sender = SimpleNamespace(name=tasks.process_news_url.name)
+
+    dedup_lock_running(sender=sender, task_id=task_id, args=(URL, "g1"))
+    dedup_lock_finished(sender=sender, task_id=task_id, args=(URL, "g1"), state="RETRY")
+
+    assert tasks.enqueue_unique(tasks.process_news_url, URL) == (task_id, True)
+
+
+def test_failed_send_releases_the_lock(container, lock, monkeypatch):
+    def broker_down(**options):
+        raise ConnectionError("broker fora do ar")
+
+    monkeypatch.setattr(tasks.process_news_url, "apply_async", broker_down)
+
+    with pytest.raises(ConnectionError):
+        tasks.enqueue_unique(tasks.process_news_url, URL, priority="high")
+    assert lock.owner_of(lock.url_key(tasks.process_news_url.name, URL, "g1")) is None
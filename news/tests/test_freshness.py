@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta, timezone
+
+from domain.entities import FreshnessPolicy
+from domain.usecases import ProcessNewsInput, ProcessNewsUseCase
+from tests.fakes import FakeLLM, make_article
+
+
+URL = "https://g1.globo.com/noticia/a.ghtml"
+
+
+def test_policy_from_schema():
+    policy = FreshnessPolicy.from_schema(
+        {'freshness': {'max_age_minutes': 30, 'reuse_unchanged_summary': False}})
+
+    assert policy.max_age_seconds == 1800
+    assert policy.reuse_unchanged_summary is False
+    assert FreshnessPolicy.from_schema(None).max_age_seconds == 0
+
+
+def test_is_fresh_accepts_naive_utc_datetimes():
+    now = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+    policy = FreshnessPolicy(max_age_seconds=600)
+
+    assert policy.is_fresh(datetime(2026, 1, 1, 11, 55), now=now)
+    assert not policy.is_fresh(now - timedelta(minutes=11), now=now)
+    assert not FreshnessPolicy().is_fresh(now, now=now)
+
+
+def test_fresh_document_skips_scraping_and_llm(repo, scraper, llm):
+    use_case = ProcessNewsUseCase(scraper, llm, repo, FreshnessPolicy(max_age_seconds=3600))
+    first = use_case.execute(ProcessNewsInput(url=URL))
+
+    second = use_case.execute(ProcessNewsInput(url=URL))
+
+    assert second.freshness == "fresh"
+    assert second.mongodb_id == first.mongodb_id
+    assert len(scraper.calls) == 1
+    assert len(llm.calls) == 1
+
+
+def test_force_reprocesses_a_fresh_document(repo, scraper, llm):
+    use_case = ProcessNewsUseCase(scraper, llm, repo, FreshnessPolicy(max_age_seconds=3600))
+    use_case.execute(ProcessNewsInput(url=URL))
+
+    output = use_case.execute(ProcessNewsInput(url=URL, force=True))
+
+    assert output.freshness is None
+    assert len(scraper.calls) == 2
+
+
+def test_unchanged_content_reuses_saved_summary(repo, scraper, llm):
+    use_case = ProcessNewsUseCase(scraper, llm, repo, FreshnessPolicy())
+    use_case.execute(ProcessNewsInput(url=URL))
+
+    output = use_case.execute(ProcessNewsInput(url=URL))
+
+    assert output.freshness == "unchanged"
+    assert len(scraper.calls) == 2
+    assert len(llm.calls) == 1
+
+
+def test_changed_content_is_summarised_again(repo, scraper, llm):
+    use_case = ProcessNewsUseCase(scraper, llm, repo, FreshnessPolicy())
+    use_case.execute(ProcessNewsInput(url=URL))
+    scraper.articles[URL] = make_article(URL, content="Conteúdo atualizado")
+
+    output = use_case.execute(ProcessNewsInput(url=URL))
+
+    assert output.freshness is None
+    assert len(llm.calls) == 2
+
+
+def test_fallback_summary_is_not_reused_as_fresh(repo, scraper):
+    use_case = ProcessNewsUseCase(
+        scraper, FakeLLM(resumo="", status="timeout"), repo, FreshnessPolicy(max_age_seconds=3600))
+    use_case.execute(ProcessNewsInput(url=URL))
+    llm = FakeLLM()
+    use_case = ProcessNewsUseCase(scraper, llm, repo, FreshnessPolicy(max_age_seconds=3600))
+
+    output = use_case.execute(ProcessNewsInput(url=URL))
+
+    assert output.freshness is None
+    assert output.llm_status == "success"
+    assert len(llm.calls) == 1
+    assert repo.find_by_url(URL)['llm_status'] == "success"
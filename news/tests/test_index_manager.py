@@ -0,0 +1,53 @@
+from pymongo.errors import OperationFailure
+
+from infra.mongo_index_manager import NewsIndexManager
+
+
+class ExplainingRepository:
+    """Repositório com explain() pré-definidos por consulta"""
+
+    def __init__(self, explains):
+        self._explains = explains
+
+    def explain_queries(self):
+        return self._explains
+
+
+def test_ensure_indexes_creates_every_declared_index(mongo):
+    names = [index.document['name'] for index in NewsIndexManager.INDEXES]
+
+    created = NewsIndexManager(mongo).ensure_indexes()
+
+    assert created == names
+    assert mongo.db['news'].index_information()['url_unique']['unique'] is True
+
+
+def test_one_failing_index_does_not_block_the_others(mongo, monkeypatch):
+    collection = mongo.db['news']
+    create_indexes = collection.create_indexes
+
+    def failing_unique(indexes):
+        if indexes[0].document['name'] == 'url_unique':
+            raise OperationFailure("E11000 duplicate key")
+        return create_indexes(indexes)
+
+    monkeypatch.setattr(type(collection), "create_indexes", lambda self, indexes: failing_unique(indexes))
+
+    created = NewsIndexManager(mongo).ensure_indexes()
+
+    assert 'url_unique' not in created
+    assert len(created) == len(NewsIndexManager.INDEXES) - 1
+
+
+def test_verify_query_plans_flags_collection_scans(mongo):
+    repository = ExplainingRepository({
+        'find_by_url': {'queryPlanner': {'winningPlan': {
+            'stage': 'FETCH', 'inputStage': {'stage': 'IXSCAN', 'indexName': 'url_unique'}}}},
+        'list_recent': {'stages': [{'$cursor': {'queryPlanner': {'winningPlan': {
+            'stage': 'SORT', 'inputStage': {'stage': 'COLLSCAN'}}}}}]},
+    })
+
+    report = NewsIndexManager(mongo).verify_query_plans(repository)
+
+    assert report['find_by_url'] == {'stages': ['FETCH', 'IXSCAN'], 'collscan': False}
+    assert report['list_recent'] == {'stages': ['SORT', 'COLLSCAN'], 'collscan': True}
@@ -0,0 +1,74 @@
+"""Métricas Prometheus de tasks, LLM e filas"""
+import importlib
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from core import metrics
+from core.config import settings
+
+prometheus_client = pytest.importorskip("prometheus_client")
+
+TASK = "workers.tasks.test_metrics"
+
+
+def _sample(name, **labels):
+    return prometheus_client.REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_finished_tasks_are_counted_by_outcome():
+    before = {outcome: _sample("news_tasks_total", task=TASK, outcome=outcome)
+              for outcome in ("success", "error", "retry")}
+
+    metrics.task_started("t1", TASK, "w1", "news", enqueued_at=None)
+    assert _sample("news_worker_active_tasks", worker="w1") == 1
+    metrics.task_finished("t1", TASK, "w1", "SUCCESS", {"status": "success"})
+    metrics.task_finished("t2", TASK, "w1", "SUCCESS", {"status": "processing_error"})
+    metrics.task_finished("t3", TASK, "w1", "RETRY")
+
+    assert _sample("news_worker_active_tasks", worker="w1") == 0
+    for outcome in ("success", "error", "retry"):
+        assert _sample("news_tasks_total", task=TASK, outcome=outcome) == before[outcome] + 1
+    assert _sample("news_task_duration_seconds_count", task=TASK) >= 1
+
+
+def test_queue_wait_uses_the_enqueue_header():
+    metrics.task_started("t4", TASK, "w1", "news_high", enqueued_at=time.time() - 3)
+    metrics.task_finished("t4", TASK, "w1", "SUCCESS")
+
+    assert _sample("news_task_queue_wait_seconds_sum", task=TASK, queue="news_high") >= 3
+
+
+def test_llm_errors_are_grouped():
+    before = _sample("news_llm_calls_total", status="error")
+
+    metrics.observe_llm("error:503")
+    metrics.observe_llm("error:429")
+
+    assert _sample("news_llm_calls_total", status="error") == before + 2
+
+
+def test_render_collects_queue_stats_on_demand():
+    payload, content_type = metrics.render(
+        queue_stats=lambda: {"news": (7, 12.5), "publish": (None, None)})
+    text = payload.decode()
+
+    assert content_type.startswith("text/plain")
+    assert 'news_queue_depth{queue="news"} 7.0' in text
+    assert 'news_queue_oldest_age_seconds{queue="news"} 12.5' in text
+    assert 'news_queue_depth{queue="publish"}' not in text
+
+
+def test_metrics_endpoint(container, monkeypatch):
+    module = importlib.import_module("api.app")
+    monkeypatch.setattr(settings, "METRICS_ENABLED", True)
+    monkeypatch.setattr(module, "queue_stats", lambda queues: {queue: (0, None) for queue in queues})
+    client = TestClient(module.app)
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert 'news_queue_depth{queue="news_high"} 0.0' in response.text
+
+    monkeypatch.setattr(settings, "METRICS_ENABLED", False)
+    assert client.get("/metrics").status_code == 503
@@ -0,0 +1,76 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import mongomock
+import pytest
+from pymongo.errors import OperationFailure
+
+from infra.motor_news_repository import MotorNewsRepository
+from tests.fakes import AsyncMongoClient, make_document
+
+
+URL = "https://g1.globo.com/noticia/a.ghtml"
+
+
+@pytest.fixture
+def async_repo(mongo):
+    return MotorNewsRepository(AsyncMongoClient(mongo.client), mongo.db_name)
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_reads_what_the_sync_repository_wrote(repo, async_repo):
+    mongodb_id = repo.upsert(URL, make_document())
+
+    news = run(async_repo.find_by_id(mongodb_id, fields="summary"))
+
+    assert news['_id'] == mongodb_id
+    assert news['title'] == "Título"
+    assert 'content' not in news
+
+
+def test_missing_document_returns_none(async_repo):
+    assert run(async_repo.find_by_id("0" * 24)) is None
+
+
+def test_mark_as_published_keeps_counters_shared(repo, async_repo):
+    mongodb_id = repo.upsert(URL, make_document())
+
+    run(async_repo.mark_as_published(mongodb_id, 10, "https://site/10"))
+
+    assert repo.find_by_id(mongodb_id)['wordpress_post_id'] == 10
+    assert repo.get_publish_stats()['published'] == 1
+    assert run(async_repo.get_publish_stats())['published'] == 1
+
+
+def test_list_news_pages_like_the_sync_repository(repo, async_repo):
+    for n in range(3):
+        repo.upsert(f"https://g1.globo.com/noticia/{n}.ghtml",
+                    make_document(f"https://g1.globo.com/noticia/{n}.ghtml"))
+
+    page, has_more = run(async_repo.list_news(limit=2))
+
+    assert has_more is True
+    assert [news['_id'] for news in page] == [news['_id'] for news in repo.list_news(limit=2)[0]]
+
+
+def test_pipeline_stats_fall_back_without_percentile_operator(mongo, async_repo, monkeypatch):
+    now = datetime.now(timezone.utc)
+    mongo.db["news"].insert_many([
+        {'source': "g1", 'fetched_at': now, 'timings': {'llm': float(ms)}}
+        for ms in (30, 10, 20)
+    ])
+    aggregate = mongomock.collection.Collection.aggregate
+
+    def without_percentile(self, pipeline, *args, **kwargs):
+        if '$percentile' in str(pipeline):
+            raise OperationFailure("unknown group operator '$percentile'", code=15952)
+        return aggregate(self, pipeline, *args, **kwargs)
+
+    monkeypatch.setattr(mongomock.collection.Collection, "aggregate", without_percentile)
+
+    stats = run(async_repo.get_pipeline_stats(since=now - timedelta(hours=1)))
+
+    assert stats["g1"] == {"count": 3, "stages": {'llm': {'p50': 20.0, 'p90': 30.0, 'p99': 30.0}}}
@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+
+from api.pagination import decode_cursor, decode_score_cursor, encode_cursor, encode_score_cursor
+from tests.fakes import make_document
+
+
+def test_cursor_round_trip():
+    item = {'_id': ObjectId(), 'created_at': datetime(2026, 1, 2, 3, 4, 5)}
+
+    assert decode_cursor(encode_cursor(item)) == (item['created_at'], str(item['_id']))
+
+
+def test_score_cursor_round_trip():
+    item = {'_id': ObjectId(), 'score': 1.5}
+
+    assert decode_score_cursor(encode_score_cursor(item)) == (1.5, str(item['_id']))
+
+
+@pytest.mark.parametrize("cursor", ["", "não-é-base64", "eyJ4IjoxfQ"])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError, match="Cursor inválido"):
+        decode_cursor(cursor)
+
+
+def test_keyset_pages_cover_every_document_once(repo):
+    start = datetime(2026, 1, 1)
+    collection = repo._db.db['news']
+    for n in range(7):
+        # Dois documentos por instante: o _id desempata a ordem
+        collection.insert_one(make_document(
+            f"https://g1.globo.com/noticia/{n}.ghtml", created_at=start + timedelta(minutes=n // 2)))
+
+    seen, after, pages = [], None, 0
+    while True:
+        page, has_more = repo.list_news(limit=3, after=after)
+        seen.extend(news['_id'] for news in page)
+        pages += 1
+        if not has_more:
+            break
+        after = decode_cursor(encode_cursor(page[-1]))
+
+    assert pages == 3
+    assert len(seen) == len(set(seen)) == 7
+    created = [collection.find_one({'_id': ObjectId(i)})['created_at'] for i in seen]
+    assert created == sorted(created, reverse=True)
@@ -0,0 +1,36 @@
+import pytest
+
+from tests.fakes import make_document
+
+
+URL = "https://g1.globo.com/noticia/a.ghtml"
+
+
+def test_summary_projection_leaves_out_the_body(repo):
+    mongodb_id = repo.upsert(URL, make_document())
+
+    news = repo.find_by_id(mongodb_id, fields="summary")
+
+    assert news['title'] == "Título"
+    assert news['_id'] == mongodb_id
+    assert 'content' not in news and 'summary' not in news
+
+
+def test_ids_projection_returns_only_the_id(repo):
+    repo.upsert(URL, make_document())
+
+    assert [set(news) for news in repo.list_recent(fields="ids")] == [{'_id'}]
+
+
+def test_full_projection_returns_the_whole_document(repo):
+    mongodb_id = repo.upsert(URL, make_document())
+
+    news = repo.find_by_id(mongodb_id)
+
+    assert news['content'] == "Conteúdo da notícia"
+    assert news['summary'] == "Resumo"
+
+
+def test_unknown_field_set_is_rejected(repo):
+    with pytest.raises(ValueError, match="inválido"):
+        repo.find_by_id("0" * 24, fields="everything")
@@ -0,0 +1,181 @@
+"""Reserva de publicação: cada notícia é publicada no WordPress uma única vez"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from bson import ObjectId
+from fastapi.testclient import TestClient
+
+from core.config import settings
+from domain.usecases import ProcessNewsInput, ProcessNewsUseCase
+from infra.motor_news_repository import MotorNewsRepository
+from workers import tasks
+from workers.publish_dispatcher import PublishDispatcher
+from tests.fakes import AsyncMongoClient, make_document
+
+
+URL = "https://g1.globo.com/noticia/a.ghtml"
+
+
+@pytest.fixture
+def news_id(repo):
+    return repo.upsert(URL, make_document())
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Mensagens enviadas ao broker por enqueue_publish (sem broker)"""
+    messages = []
+
+    def apply_async(args=None, kwargs=None, task_id=None, **options):
+        messages.append({'args': args, 'task_id': task_id, **options})
+
+    monkeypatch.setattr(tasks.publish_to_wordpress, "apply_async", apply_async)
+    return messages
+
+
+def test_only_one_owner_gets_the_claim(repo, news_id):
+    assert repo.claim_publish(news_id, "task-a", 60)
+    assert not repo.claim_publish(news_id, "task-b", 60)
+    # Reentrante: o retry da mesma task renova a reserva
+    assert repo.claim_publish(news_id, "task-a", 60)
+
+
+def test_expired_claim_can_be_taken_over(repo, news_id):
+    repo._db.db['news'].update_one({'_id': ObjectId(news_id)}, {'$set': {'publish_claim': {
+        'owner': "task-a", 'until': datetime.now(timezone.utc) - timedelta(seconds=1)}}})
+
+    assert repo.claim_publish(news_id, "task-b", 60)
+
+
+def test_release_only_by_the_owner(repo, news_id):
+    repo.claim_publish(news_id, "task-a", 60)
+
+    assert not repo.release_publish_claim(news_id, "task-b")
+    assert repo.release_publish_claim(news_id, "task-a")
+    assert repo.claim_publish(news_id, "task-b", 60)
+
+
+def test_published_news_cannot_be_claimed(repo, news_id):
+    repo.claim_publish(news_id, "task-a", 60)
+    repo.mark_as_published(news_id, post_id=1, post_url="https://site/?p=1")
+
+    assert 'publish_claim' not in repo.find_by_id(news_id)
+    assert not repo.claim_publish(news_id, "task-b", 60)
+
+
+def test_enqueue_publish_sends_one_task_per_news(container, news_id, sent):
+    tasks.enqueue_publish(news_id)
+
+    assert tasks.enqueue_publish(news_id) is None
+    assert len(sent) == 1
+    assert sent[0]['args'] == (news_id,)
+    assert container.news_repository().find_by_id(news_id)['publish_claim']['owner'] == sent[0]['task_id']
+
+
+def test_task_skips_news_claimed_by_another_path(container, publisher, news_id):
+    container.news_repository().claim_publish(news_id, "api-request", 60)
+
+    result = tasks.publish_to_wordpress.apply((news_id,), task_id="task-1").get()
+
+    assert result['status'] == "claimed"
+    assert publisher.published == []
+
+
+def test_enqueued_task_reuses_its_claim_and_publishes_once(container, publisher, news_id, sent):
+    tasks.enqueue_publish(news_id)
+    task_id = sent[0]['task_id']
+
+    first = tasks.publish_to_wordpress.apply((news_id,), task_id=task_id).get()
+    # Mensagem duplicada (ex.: varredura antes do fim da publicação)
+    second = tasks.publish_to_wordpress.apply((news_id,), task_id="task-dup").get()
+
+    assert first['status'] == "published"
+    assert second['status'] == "already_published"
+    assert len(publisher.published) == 1
+
+
+def test_failed_publish_releases_the_claim(container, publisher, news_id):
+    from services.wordpress_publisher import WordPressPublishResult
+    publisher.result = WordPressPublishResult(success=False, error="HTTP 400", status_code=400)
+
+    result = tasks.publish_to_wordpress.apply((news_id,), task_id="task-1").get()
+
+    news = container.news_repository().find_by_id(news_id)
+    assert result['status'] == "error"
+    assert 'publish_claim' not in news
+    assert news['publish_error'] == "HTTP 400"
+
+
+def test_dispatcher_skips_news_owned_by_process_and_publish(container, scraper, llm, sent):
+    repo = container.news_repository()
+    claim = repo.publish_claim("process-and-publish-task", settings.PUBLISH_CLAIM_TTL)
+    # O upsert grava a notícia já reservada: o dispatcher a vê e não a publica
+    output = ProcessNewsUseCase(scraper, llm, repo).execute(
+        ProcessNewsInput(url=URL, task_id="process-and-publish-task", publish_claim=claim))
+
+    PublishDispatcher(container.mongo(), tasks.enqueue_publish)._dispatch(output.mongodb_id)
+
+    assert sent == []
+    assert repo.claim_publish(output.mongodb_id, "process-and-publish-task", 60)
+
+
+def test_process_and_publish_publishes_once_with_the_dispatcher_racing(
+        container, scraper, llm, publisher, sent, monkeypatch):
+    monkeypatch.setattr(
+        "domain.factories.UseCaseFactory.create_process_news_usecase",
+        lambda schema_name="g1", **kwargs: ProcessNewsUseCase(scraper, llm, container.news_repository()))
+    dispatched = []
+    original_upsert = container.news_repository().upsert
+
+    def upsert_then_dispatch(url, news_data):
+        mongodb_id = original_upsert(url, news_data)
+        dispatched.append(tasks.enqueue_publish(mongodb_id))
+        return mongodb_id
+
+    monkeypatch.setattr(container.news_repository(), "upsert", upsert_then_dispatch)
+
+    result = tasks.process_and_publish.apply((URL,), task_id="task-1").get()
+
+    assert result['status'] == "published"
+    assert dispatched == [None] and sent == []
+    assert len(publisher.published) == 1
+
+
+@pytest.fixture
+def client(container, mongo, scraper, llm, monkeypatch):
+    """API sobre o MongoDB em memória, com o use case das fontes falsas"""
+    from api.app import app
+    container._async_news_repository = MotorNewsRepository(
+        AsyncMongoClient(mongo.client), mongo.db_name)
+    monkeypatch.setattr(
+        "domain.factories.UseCaseFactory.create_process_news_usecase",
+        lambda schema_name="g1", **kwargs: ProcessNewsUseCase(scraper, llm, container.news_repository()))
+    return TestClient(app)
+
+
+def test_publish_endpoint_marks_the_news_and_does_not_repost(container, publisher, client):
+    first = client.post("/publish", json={"url": URL})
+    second = client.post("/publish", json={"url": URL})
+
+    news = container.news_repository().find_by_id(first.json()['mongodb_id'])
+    assert first.status_code == 200
+    assert news['wordpress_published'] is True
+    assert 'publish_claim' not in news
+    assert second.status_code == 409
+    assert len(publisher.published) == 1
+
+
+def test_sync_publish_from_db_respects_the_claim(container, publisher, news_id, client):
+    container.news_repository().claim_publish(news_id, "task-1", 60)
+
+    busy = client.post(f"/publish/from-db/{news_id}", params={"async_mode": False})
+    container.news_repository().release_publish_claim(news_id, "task-1")
+    published = client.post(f"/publish/from-db/{news_id}", params={"async_mode": False})
+    again = client.post(f"/publish/from-db/{news_id}", params={"async_mode": False})
+
+    assert busy.status_code == 409
+    assert published.json()['status'] == "published"
+    assert again.json()['status'] == "already_published"
+    assert len(publisher.published) == 1
+    assert asyncio.run(container.async_news_repository().find_by_id(news_id))['wordpress_published']
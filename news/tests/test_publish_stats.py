@@ -0,0 +1,41 @@
+from tests.fakes import make_document as document
+
+
+URL = "https://g1.globo.com/noticia/a.ghtml"
+URL_B = "https://g1.globo.com/noticia/b.ghtml"
+URL_C = "https://g1.globo.com/noticia/c.ghtml"
+
+
+def test_counters_follow_each_write(repo):
+    first = repo.upsert(URL, document())
+    second = repo.upsert(URL_B, document(URL_B))
+    repo.upsert(URL_C, document(URL_C, status="error"))
+
+    repo.mark_publish_error(second, "HTTP 500")
+    repo.mark_as_published(first, post_id=1, post_url="https://site/1")
+    repo.mark_as_published(second, post_id=2, post_url="https://site/2")
+
+    stats = repo.get_publish_stats()
+    assert stats == repo.get_publish_stats(exact=True)
+    assert (stats['total'], stats['published'], stats['pending'], stats['with_errors']) == (3, 2, 0, 0)
+
+
+def test_publishing_twice_does_not_double_count(repo):
+    mongodb_id = repo.upsert(URL, document())
+
+    repo.mark_as_published(mongodb_id, post_id=1, post_url="https://site/1")
+    repo.mark_as_published(mongodb_id, post_id=1, post_url="https://site/1")
+
+    assert repo.get_publish_stats()['published'] == 1
+
+
+def test_reconcile_fixes_drift(repo):
+    repo.upsert(URL, document())
+    # Gravação fora do repositório: os contadores não a veem
+    repo._db.db['news'].insert_one(document("https://g1.globo.com/noticia/fora.ghtml"))
+
+    assert repo.get_publish_stats()['total'] == 1
+    repo.reconcile_publish_stats()
+
+    assert repo.get_publish_stats()['total'] == 2
+    assert repo.get_publish_stats()['pending'] == 2
@@ -0,0 +1,118 @@
+"""Faixas de prioridade e orçamentos de chamadas por minuto"""
+import pytest
+from celery.exceptions import Retry
+
+from core.config import settings
+from domain.usecases import ProcessNewsUseCase
+from infra.rate_budget import BudgetedLLMService, RateBudget, RateBudgetExceeded
+from workers import tasks
+from workers.celery_app import lane_queue
+from tests.fakes import FakeLLM, make_document
+
+
+URL = "https://g1.globo.com/noticia/a.ghtml"
+
+
+@pytest.mark.parametrize("client", [None, "redis"])
+def test_normal_lanes_leave_the_reserve_to_the_high_lane(redis_client, client):
+    budget = RateBudget(redis_client if client else None, "llm", per_minute=3, reserved_high=1)
+
+    assert budget.try_acquire("low")
+    assert budget.try_acquire("normal")
+    assert not budget.try_acquire("normal")
+    assert budget.try_acquire("high")
+    assert not budget.try_acquire("high")
+
+
+def test_zero_budget_is_unlimited():
+    budget = RateBudget(None, "llm", per_minute=0)
+
+    assert all(budget.try_acquire() for _ in range(100))
+
+
+def test_reserve_larger_than_the_budget_keeps_one_call_for_normal_lanes():
+    assert RateBudget(None, "llm", per_minute=2, reserved_high=5).limit_for("normal") == 1
+
+
+def test_budgeted_llm_fails_without_budget():
+    llm = FakeLLM()
+    budget = RateBudget(None, "llm", per_minute=1)
+    service = BudgetedLLMService(llm, budget, priority="normal", max_wait=0)
+
+    assert service.process_content("texto", "Título", "").resumo == "Resumo"
+    with pytest.raises(RateBudgetExceeded):
+        service.process_content("texto", "Título", "")
+    assert len(llm.calls) == 1
+
+
+def test_lanes_have_their_own_queues():
+    assert lane_queue(tasks.process_news_url.name, "high") == "news_high"
+    assert lane_queue(tasks.publish_to_wordpress.name, "low") == "publish"
+    with pytest.raises(ValueError):
+        lane_queue(tasks.process_news_url.name, "urgent")
+
+
+def test_exhausted_publish_budget_defers_without_spending_retries(
+        container, repo, publisher, monkeypatch):
+    mongodb_id = repo.upsert("https://g1.globo.com/a", make_document())
+    budget = RateBudget(None, "wordpress", per_minute=1)
+    budget.try_acquire("normal")
+    container._rate_budgets["wordpress"] = budget
+    monkeypatch.setattr(settings, "RATE_BUDGET_MAX_WAIT", 0)
+
+    resent = []
+    monkeypatch.setattr(
+        tasks.publish_to_wordpress, "apply_async",
+        lambda args=None, kwargs=None, **options: resent.append((args, options)))
+
+    # Executa como o worker, com o pedido da última tentativa da task
+    # (apply() reexecutaria a task adiada no mesmo processo)
+    task = tasks.publish_to_wordpress
+    task.push_request(id="task-1", args=[mongodb_id], kwargs={}, retries=3)
+    try:
+        with pytest.raises(Retry):
+            task.run(mongodb_id)
+    finally:
+        task.pop_request()
+
+    assert publisher.published == []
+    [(args, options)] = resent
+    assert list(args) == [mongodb_id]
+    assert options['task_id'] == "task-1"
+    assert options['retries'] == 3
+    assert 0 < options['countdown'] <= RateBudget.WINDOW_SECONDS
+    # Adiar não é falha: a reserva continua com a task adiada
+    assert not repo.claim_publish(mongodb_id, "task-2", 60)
+
+
+def test_exhausted_llm_budget_defers_instead_of_failing(
+        container, repo, scraper, llm, monkeypatch):
+    budget = RateBudget(None, "llm", per_minute=1)
+    budget.try_acquire("normal")
+    container._rate_budgets["llm"] = budget
+    monkeypatch.setattr(
+        "domain.factories.UseCaseFactory.create_process_news_usecase",
+        lambda schema_name="g1", **kwargs: ProcessNewsUseCase(
+            scraper, BudgetedLLMService(llm, budget, max_wait=0), repo))
+
+    resent = []
+    monkeypatch.setattr(
+        tasks.process_news_url, "apply_async",
+        lambda args=None, kwargs=None, **options: resent.append((args, options)))
+
+    task = tasks.process_news_url
+    task.push_request(id="task-1", args=[URL], kwargs={}, retries=1)
+    try:
+        with pytest.raises(Retry):
+            task.run(URL)
+    finally:
+        task.pop_request()
+
+    # Sem orçamento não é falha: nada é gravado e a tentativa não é gasta
+    assert llm.calls == []
+    assert repo.find_by_url(URL) is None
+    [(args, options)] = resent
+    assert list(args) == [URL]
+    assert options['task_id'] == "task-1"
+    assert options['retries'] == 1
+    assert 0 < options['countdown'] <= RateBudget.WINDOW_SECONDS
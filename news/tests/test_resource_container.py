@@ -0,0 +1,64 @@
+import os
+
+import requests
+
+from domain.entities import StageTimings
+from infra.mongo_news_repository import MongoNewsRepository
+from scraper.g1_scraper import G1Scraper
+
+
+class RecordingSession(requests.Session):
+    """Sessão que registra os headers de cada requisição sem acessar a rede"""
+
+    def __init__(self):
+        super().__init__()
+        self.sent_headers = []
+
+    def get(self, url, **kwargs):
+        self.sent_headers.append(kwargs.get('headers'))
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"<html></html>"
+        return response
+
+
+def test_getters_share_one_instance_per_process(container):
+    container._http_session = container._create_http_session()
+
+    scraper = container.scraper("g1")
+
+    assert container.scraper("g1") is scraper
+    assert scraper.session is container.http_session()
+    assert container.news_repository() is container.news_repository()
+    assert container.llm_service() is container.llm_service()
+
+
+def test_resources_are_recreated_after_fork(container):
+    inherited = container.news_repository()
+    container._pid = os.getpid() + 1
+
+    repository = container.news_repository()
+
+    assert isinstance(repository, MongoNewsRepository)
+    assert repository is not inherited
+    assert container._pid == os.getpid()
+
+
+def test_close_releases_every_resource(container):
+    container.news_repository()
+    container.close()
+
+    assert container._mongo is None
+    assert container._news_repository is None
+    assert container._pid is None
+
+
+def test_scraper_sends_headers_without_mutating_the_shared_session():
+    session = RecordingSession()
+    default_headers = dict(session.headers)
+    scraper = G1Scraper(session=session)
+
+    scraper.fetch_html("https://g1.globo.com/noticia/a.ghtml", StageTimings())
+
+    assert session.sent_headers == [G1Scraper.HEADERS]
+    assert dict(session.headers) == default_headers
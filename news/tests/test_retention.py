@@ -0,0 +1,137 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from infra.mongo_news_repository import MongoNewsRepository
+from infra.news_archive import NewsArchive
+from infra.news_body_store import NewsBodyStore
+from infra.retention import RetentionManager
+from tests.fakes import make_document
+
+
+def _publish(repo, mongo, url, days_ago):
+    """Grava uma notícia publicada no WordPress há N dias"""
+    mongodb_id = repo.upsert(url, make_document(url))
+    repo.mark_as_published(mongodb_id, 10, f"{url}#wp")
+    mongo.db['news'].update_one(
+        {'url': url},
+        {'$set': {'wordpress_published_at': datetime.now(timezone.utc) - timedelta(days=days_ago)}})
+    return mongodb_id
+
+
+def _manager(mongo, repo, archive, **options):
+    values = dict(archive_after_days=30, failed_ttl_days=0, batch_size=2,
+                  batch_pause=0, max_batches=10)
+    values.update(options)
+    return RetentionManager(mongo, repo, archive, **values)
+
+
+@pytest.fixture
+def archive(mongo):
+    return NewsArchive(mongo, target="collection")
+
+
+@pytest.fixture
+def archive_repo(mongo, archive):
+    return MongoNewsRepository(mongo, archive=archive)
+
+
+def test_old_published_news_move_to_the_archive(mongo, archive_repo, archive):
+    old = [_publish(archive_repo, mongo, f"https://g1.globo.com/old/{i}", 60) for i in range(3)]
+    recent = _publish(archive_repo, mongo, "https://g1.globo.com/recent", 5)
+    archive_repo.upsert("https://g1.globo.com/pending", make_document("https://g1.globo.com/pending"))
+
+    result = _manager(mongo, archive_repo, archive).apply()
+
+    assert result.archived == 3 and result.batches == 2
+    assert mongo.db['news'].count_documents({}) == 2
+    assert mongo.db['news_archive'].count_documents({}) == 3
+    assert archive_repo.find_by_id(recent).get('archived') is None
+
+    news = archive_repo.find_by_id(old[0])
+    assert news['archived'] is True
+    assert news['content'] == "Conteúdo da notícia"
+
+
+def test_archived_reads_apply_the_field_projection(mongo, archive_repo, archive):
+    mongodb_id = archive_repo.upsert("https://g1.globo.com/a", make_document("https://g1.globo.com/a"))
+    archive.write([mongo.db['news'].find_one({})])
+    mongo.db['news'].delete_many({})
+
+    news = archive_repo.find_by_id(mongodb_id, fields="summary")
+
+    assert news['archived'] is True
+    assert 'content' not in news and 'summary' not in news
+    assert news['_id'] == mongodb_id and news['title'] == "Título"
+
+
+def test_bodies_of_news_kept_in_the_collection_are_not_deleted(mongo, archive):
+    repo = MongoNewsRepository(mongo, NewsBodyStore(mongo, storage="split"), archive)
+    for url in ("https://g1.globo.com/old/0", "https://g1.globo.com/old/1"):
+        _publish(repo, mongo, url, 60)
+    documents = repo.find_archivable(datetime.now(timezone.utc), 10)
+    # Deixou de estar publicada entre a leitura e a remoção
+    mongo.db['news'].update_one(
+        {'url': "https://g1.globo.com/old/1"}, {'$set': {'wordpress_published': False}})
+
+    assert repo.delete_archived(documents) == 1
+    assert [body['_id'] for body in mongo.db['news_bodies'].find()] == ["https://g1.globo.com/old/1"]
+    assert repo.find_by_url("https://g1.globo.com/old/1")['content'] == "Conteúdo da notícia"
+
+
+def test_bodies_left_by_the_ttl_index_are_swept(mongo, archive):
+    repo = MongoNewsRepository(mongo, NewsBodyStore(mongo, storage="split"), archive)
+    for n in range(3):
+        url = f"https://g1.globo.com/failed/{n}"
+        repo.upsert(url, make_document(url))
+    # Remoção feita pelo TTL, direto no servidor
+    mongo.db['news'].delete_many({'url': {'$ne': "https://g1.globo.com/failed/2"}})
+
+    result = _manager(mongo, repo, archive, archive_after_days=0, failed_ttl_days=7).apply()
+
+    assert result.orphan_bodies == 2
+    assert [body['_id'] for body in mongo.db['news_bodies'].find()] == ["https://g1.globo.com/failed/2"]
+
+
+def test_max_batches_bounds_one_run(mongo, archive_repo, archive):
+    for i in range(5):
+        _publish(archive_repo, mongo, f"https://g1.globo.com/old/{i}", 60)
+
+    result = _manager(mongo, archive_repo, archive, max_batches=1).apply()
+
+    assert result.archived == 2
+    assert mongo.db['news'].count_documents({}) == 3
+
+
+def test_zero_days_disables_archiving(mongo, archive_repo, archive):
+    _publish(archive_repo, mongo, "https://g1.globo.com/old", 60)
+
+    result = _manager(mongo, archive_repo, archive, archive_after_days=0).apply()
+
+    assert result.archived == 0
+    assert mongo.db['news'].count_documents({}) == 1
+
+
+def test_ndjson_archive_keeps_a_stub_and_reads_the_full_document(mongo, tmp_path):
+    archive = NewsArchive(mongo, target="ndjson", directory=str(tmp_path))
+    repo = MongoNewsRepository(mongo, archive=archive)
+    mongodb_id = _publish(repo, mongo, "https://g1.globo.com/old", 60)
+
+    _manager(mongo, repo, archive).apply()
+
+    stub = mongo.db['news_archive'].find_one({})
+    assert 'content' not in stub and stub['archive_file'].startswith(str(tmp_path))
+
+    news = repo.find_by_id(mongodb_id)
+    assert news['archived'] is True
+    assert news['content'] == "Conteúdo da notícia"
+    assert news['wordpress_post_id'] == 10
+
+
+def test_ttl_index_is_created_and_removed(mongo, archive_repo, archive):
+    _manager(mongo, archive_repo, archive, failed_ttl_days=7).ensure_ttl_index()
+    index = mongo.db['news'].index_information()[RetentionManager.TTL_INDEX_NAME]
+    assert index['expireAfterSeconds'] == 7 * 86400
+
+    _manager(mongo, archive_repo, archive, failed_ttl_days=0).ensure_ttl_index()
+    assert RetentionManager.TTL_INDEX_NAME not in mongo.db['news'].index_information()
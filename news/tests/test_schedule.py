@@ -0,0 +1,127 @@
+"""Agenda do celery beat e varredura de publicações pendentes"""
+import pickle
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from celery.schedules import crontab
+
+from workers import tasks
+from workers.schedule import build_beat_schedule, find_entry, jittered, load_entries, lock_ttl
+from tests.fakes import make_document
+
+
+SCHEDULE = """
+discover_sources:
+  task: workers.tasks.discover_sources
+  every: 300
+  jitter: 30
+apply_retention:
+  task: workers.tasks.apply_retention
+  cron: "30 3 * * *"
+  lock_ttl: 7200
+"""
+
+
+@pytest.fixture
+def schedule_file(tmp_path):
+    path = tmp_path / "beat_schedule.yaml"
+    path.write_text(SCHEDULE, encoding="utf-8")
+    return str(path)
+
+
+def test_entries_come_from_yaml_and_defaults(schedule_file):
+    entries = load_entries(schedule_file, defaults={
+        "adjust": {"task": "workers.tasks.adjust_rate_limits", "every": 60},
+        "disabled": {"task": "x", "every": 60, "enabled": False},
+    })
+
+    assert set(entries) == {"discover_sources", "apply_retention", "adjust"}
+    assert entries["discover_sources"]["jitter"] == 30
+
+
+def test_environment_overrides_interval_cron_and_jitter(schedule_file, monkeypatch):
+    monkeypatch.setenv("BEAT_DISCOVER_SOURCES", "*/5 * * * *")
+    monkeypatch.setenv("BEAT_APPLY_RETENTION", "3600")
+    monkeypatch.setenv("BEAT_APPLY_RETENTION_JITTER", "60")
+
+    entries = load_entries(schedule_file)
+
+    assert entries["discover_sources"]["cron"] == "*/5 * * * *"
+    assert 'every' not in entries["discover_sources"]
+    assert entries["apply_retention"]["every"] == 3600.0
+    assert entries["apply_retention"]["jitter"] == 60.0
+    assert 'cron' not in entries["apply_retention"]
+
+
+def test_environment_can_turn_an_entry_off(schedule_file, monkeypatch):
+    monkeypatch.setenv("BEAT_DISCOVER_SOURCES", "off")
+
+    assert "discover_sources" not in load_entries(schedule_file)
+
+
+def test_missing_file_keeps_the_defaults(tmp_path):
+    defaults = {"adjust": {"task": "t", "every": 60}}
+
+    assert load_entries(str(tmp_path / "nada.yaml"), defaults) == defaults
+
+
+def test_beat_schedule_uses_jitter_for_intervals_and_crontab_for_cron(schedule_file):
+    beat = build_beat_schedule(load_entries(schedule_file))
+
+    interval = beat["discover_sources"]
+    assert isinstance(interval["schedule"], jittered)
+    assert interval["options"] == {"expires": 300.0}
+    assert isinstance(beat["apply_retention"]["schedule"], crontab)
+    assert beat["apply_retention"]["options"] == {}
+
+
+def test_jitter_delays_each_run_within_the_limit():
+    run = jittered(timedelta(seconds=300), jitter=30)
+    now = datetime.now(timezone.utc)
+    remaining = run.remaining_estimate(now).total_seconds()
+
+    assert 299 <= remaining <= 331
+    copy = pickle.loads(pickle.dumps(run))
+    assert (copy.run_every, copy.jitter) == (run.run_every, 30.0)
+
+
+def test_lock_ttl_prefers_the_explicit_value():
+    assert lock_ttl({"every": 120, "lock_ttl": 30}) == 30
+    assert lock_ttl({"every": 120}) == 120
+    assert lock_ttl({"cron": "* * * * *"}, default=60) == 60
+    assert find_entry({"a": {"task": "t1"}}, "t2") is None
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Publicações enfileiradas pela varredura (sem broker)"""
+    messages = []
+
+    def apply_async(args=None, kwargs=None, task_id=None, **options):
+        messages.append(args[0])
+        return task_id
+
+    monkeypatch.setattr(tasks.publish_to_wordpress, "apply_async", apply_async)
+    return messages
+
+
+def test_sweep_skips_news_claimed_by_other_paths(container, repo, sent):
+    ids = [repo.upsert(f"https://g1.globo.com/{i}", make_document(f"https://g1.globo.com/{i}"))
+           for i in range(3)]
+    repo.claim_publish(ids[0], "dispatcher-task", 600)
+
+    first = tasks.sweep_pending_publish.apply(task_id="sweep-1").get()
+    second = tasks.sweep_pending_publish.apply(task_id="sweep-2").get()
+
+    assert (first["pending"], first["queued"]) == (3, 2)
+    assert second["queued"] == 0
+    assert sorted(sent) == sorted(ids[1:])
+
+
+def test_overlapping_runs_are_skipped(container, repo, sent):
+    lock = container.enqueue_lock()
+    lock.acquire(lock.key("periodic", tasks.sweep_pending_publish.name), "sweep-0", 60)
+
+    result = tasks.sweep_pending_publish.apply(task_id="sweep-1").get()
+
+    assert result == {"status": "skipped", "reason": "already_running", "task_id": "sweep-1"}
@@ -0,0 +1,43 @@
+from bson import ObjectId
+
+from api.search import build_snippet, search_terms
+from infra.mongo_news_repository import MongoNewsRepository
+
+
+def test_search_terms_fold_accents_and_skip_exclusions():
+    assert search_terms('Eleição "São Paulo" -futebol a') == ["eleicao", "sao", "paulo"]
+
+
+def test_snippet_highlights_terms_ignoring_accents():
+    item = {'summary': "A eleição em São Paulo terá segundo turno"}
+
+    snippet = build_snippet(item, search_terms("eleicao paulo"))
+
+    assert snippet == "A <mark>eleição</mark> em São <mark>Paulo</mark> terá segundo turno"
+
+
+def test_snippet_escapes_html_and_crops_around_the_match():
+    item = {'summary': "", 'content': "<b>" + "x" * 300 + " prefeitura anuncia obras"}
+
+    snippet = build_snippet(item, ["prefeitura"], width=60)
+
+    assert snippet.startswith("…")
+    assert "<mark>prefeitura</mark>" in snippet
+    assert "<b>" not in snippet
+
+
+def test_snippet_falls_back_to_the_first_text_without_a_match():
+    assert build_snippet({'subtitle': "Sem termos"}, ["inexistente"]) == "Sem termos"
+    assert build_snippet({}, ["x"]) is None
+
+
+def test_search_pipeline_pages_by_score_then_id():
+    after_id = str(ObjectId())
+
+    pipeline = MongoNewsRepository._search_pipeline(
+        "eleição", limit=10, after=(2.5, after_id), source="g1")
+
+    assert pipeline[0]['$match']['$text'] == {'$search': "eleição", '$language': "portuguese"}
+    assert pipeline[0]['$match']['source'] == "g1"
+    assert pipeline[2]['$match']['$or'][1] == {'score': 2.5, '_id': {'$lt': ObjectId(after_id)}}
+    assert pipeline[-2] == {'$limit': 11}
@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta, timezone
+
+import mongomock
+import pytest
+from pymongo.errors import OperationFailure
+
+from domain.entities import StageTimings
+from domain.usecases import ProcessNewsInput, ProcessNewsUseCase
+
+
+def test_span_accumulates_per_stage():
+    timings = StageTimings({'fetch': 10.0})
+
+    timings.add('fetch', 5.5)
+    with timings.span('llm'):
+        pass
+    timings.merge({'parse': 1.25, 'llm': 1.0})
+
+    spans = timings.as_dict()
+    assert spans['fetch'] == 15.5
+    assert spans['parse'] == 1.25
+    assert spans['llm'] >= 1.0
+    assert timings.total_ms == round(sum(spans.values()), 2)
+
+
+def test_span_records_duration_when_the_block_raises():
+    timings = StageTimings()
+
+    with pytest.raises(RuntimeError):
+        with timings.span('publish'):
+            raise RuntimeError("falha")
+
+    assert 'publish' in timings.as_dict()
+
+
+def test_use_case_reports_and_persists_stage_timings(repo, scraper, llm):
+    output = ProcessNewsUseCase(scraper, llm, repo).execute(
+        ProcessNewsInput(url="https://g1.globo.com/noticia/a.ghtml"))
+
+    assert {'llm', 'persist'} <= set(output.timings)
+    assert 'llm' in repo.find_by_id(output.mongodb_id)['timings']
+
+
+def test_pipeline_stats_fall_back_without_percentile_operator(repo, mongo, monkeypatch):
+    now = datetime.now(timezone.utc)
+    mongo.db["news"].insert_many([
+        {'source': "g1", 'fetched_at': now, 'timings': {'fetch': float(ms)}}
+        for ms in range(1, 101)
+    ])
+    aggregate = mongomock.collection.Collection.aggregate
+
+    def without_percentile(self, pipeline, *args, **kwargs):
+        if '$percentile' in str(pipeline):
+            raise OperationFailure("unknown group operator '$percentile'", code=15952)
+        return aggregate(self, pipeline, *args, **kwargs)
+
+    monkeypatch.setattr(mongomock.collection.Collection, "aggregate", without_percentile)
+
+    stats = repo.get_pipeline_stats(since=now - timedelta(hours=1))
+
+    assert stats["g1"]["count"] == 100
+    assert stats["g1"]["stages"] == {'fetch': {'p50': 50.0, 'p90': 90.0, 'p99': 99.0}}
@@ -0,0 +1,84 @@
+"""Resultados compactos das tasks, expandidos pelo /status sob demanda"""
+import importlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+from domain.usecases import ProcessNewsUseCase
+from infra.motor_news_repository import MotorNewsRepository
+from workers import tasks
+from tests.fakes import AsyncMongoClient
+
+
+URL = "https://g1.globo.com/noticia/a.ghtml"
+
+
+class FinishedTask:
+    """AsyncResult de uma task concluída com sucesso"""
+
+    status = "SUCCESS"
+
+    def __init__(self, result):
+        self.result = result
+
+    def ready(self):
+        return True
+
+    def successful(self):
+        return True
+
+
+@pytest.fixture
+def use_case(container, scraper, llm, monkeypatch):
+    monkeypatch.setattr(
+        "domain.factories.UseCaseFactory.create_process_news_usecase",
+        lambda schema_name="g1", **kwargs: ProcessNewsUseCase(scraper, llm, container.news_repository()))
+
+
+@pytest.fixture
+def client(container, mongo, monkeypatch):
+    from api.app import app
+    container._async_news_repository = MotorNewsRepository(
+        AsyncMongoClient(mongo.client), mongo.db_name)
+    return TestClient(app)
+
+
+def _status(client, monkeypatch, result, **params):
+    # 'api.app' também é o nome do objeto FastAPI reexportado por api
+    module = importlib.import_module("api.app")
+    monkeypatch.setattr(module, "AsyncResult", lambda task_id, app=None: FinishedTask(result))
+    response = client.get("/status/task-1", params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_task_result_carries_only_the_reference(use_case):
+    result = tasks.process_news_url.apply((URL, "g1"), task_id="task-1").get()
+
+    assert result['status'] == "success" and result['mongodb_id']
+    assert 'article' not in result and 'llm_processing' not in result
+
+
+def test_status_expands_the_article_from_mongodb(use_case, client, monkeypatch):
+    result = tasks.process_news_url.apply((URL, "g1"), task_id="task-1").get()
+
+    body = _status(client, monkeypatch, result)
+
+    assert body['result']['article']['content'] == "Conteúdo da notícia"
+    assert body['result']['article']['images'] == []
+    assert body['result']['llm_processing'] == {"status": "success", "resumo": "Resumo"}
+    assert body['result']['mongodb_id'] == result['mongodb_id']
+
+
+def test_status_can_skip_the_article(use_case, client, monkeypatch):
+    result = tasks.process_news_url.apply((URL, "g1"), task_id="task-1").get()
+
+    body = _status(client, monkeypatch, result, include_article="false")
+
+    assert body['result'] == result
+
+
+def test_results_without_the_news_are_returned_as_is(client, monkeypatch):
+    result = {"status": "success", "mongodb_id": "6ad56b1501aef4dcb17e7ac7"}
+
+    assert _status(client, monkeypatch, result)['result'] == result
@@ -0,0 +1,36 @@
+from tests.fakes import make_document as document
+
+
+URL = "https://g1.globo.com/noticia/a.ghtml"
+
+
+def test_upsert_inserts_then_updates_the_same_document(repo):
+    created_id = repo.upsert(URL, document())
+
+    updated_id = repo.upsert(URL, document(title="Novo título"))
+
+    assert updated_id == created_id
+    assert repo._db.db['news'].count_documents({'url': URL}) == 1
+    assert repo.find_by_id(created_id)['title'] == "Novo título"
+
+
+def test_upsert_preserves_the_publication_state(repo):
+    mongodb_id = repo.upsert(URL, document())
+    repo.mark_as_published(mongodb_id, post_id=7, post_url="https://site/7")
+
+    repo.upsert(URL, document(title="Reprocessada"))
+
+    news = repo.find_by_id(mongodb_id)
+    assert news['wordpress_published'] is True
+    assert news['wordpress_post_id'] == 7
+    assert news['created_at'] is not None
+
+
+def test_upsert_many_reports_inserted_and_updated(repo):
+    urls = [f"https://g1.globo.com/noticia/{n}.ghtml" for n in range(3)]
+    repo.upsert(urls[0], document(urls[0]))
+
+    summary = repo.upsert_many([document(url) for url in urls])
+
+    assert summary == {"inserted": 2, "updated": 1, "errors": []}
+    assert repo._db.db['news'].count_documents({}) == 3
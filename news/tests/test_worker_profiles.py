@@ -0,0 +1,64 @@
+import pytest
+
+import run
+from workers.celery_app import QUEUES, PRIORITY_LANES, celery_app
+from workers.profiles import PROFILES, get_profile
+
+
+def test_every_queue_has_a_consumer():
+    consumed = {queue for profile in PROFILES.values() for queue in profile.queues}
+    routed = {route['queue'] for route in celery_app.conf.task_routes.values()}
+    lanes = {queue for lanes in PRIORITY_LANES.values() for queue in lanes.values()}
+
+    assert routed | lanes <= set(QUEUES) <= consumed
+    assert set(PROFILES["all"].queues) == set(QUEUES)
+
+
+def test_prefork_profile_accepts_autoscale(monkeypatch):
+    monkeypatch.setattr("workers.profiles.sys.platform", "linux")
+
+    args = get_profile("all").argv(autoscale="8,2")
+
+    assert "--pool=prefork" in args and "--autoscale=8,2" in args
+    assert not any(arg.startswith("--concurrency") for arg in args)
+
+
+def test_thread_profile_ignores_autoscale():
+    args = get_profile("scrape").argv(autoscale="8,2")
+
+    assert "--pool=threads" in args and "--concurrency=8" in args
+    assert "--prefetch-multiplier=2" in args
+    assert not any(arg.startswith("--autoscale") for arg in args)
+
+
+def test_prefork_becomes_solo_on_windows(monkeypatch):
+    monkeypatch.setattr("workers.profiles.sys.platform", "win32")
+
+    args = get_profile("all").argv()
+
+    assert "--pool=solo" in args
+    assert not any(arg.startswith("--concurrency") for arg in args)
+
+
+def test_overrides_replace_profile_values():
+    profile = get_profile("publish", pool="gevent", concurrency=50, queues=["publish"])
+
+    assert (profile.pool, profile.concurrency, profile.queues) == ("gevent", 50, ("publish",))
+    assert PROFILES["publish"].pool == "threads"
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError):
+        get_profile("gpu")
+
+
+def test_run_worker_starts_celery_with_the_profile(monkeypatch):
+    started = []
+    monkeypatch.setattr(celery_app, "worker_main", started.append)
+
+    run.run_worker(["--profile", "urgent", "--concurrency", "2", "--queues", "news_high"])
+
+    [argv] = started
+    assert argv[0] == "worker"
+    assert "--hostname=urgent@%h" in argv and "--concurrency=2" in argv
+    assert argv[argv.index("-Q") + 1] == "news_high"
@@ -0,0 +1,80 @@
+import pytest
+
+from infra.write_behind_repository import WriteBehindError, WriteBehindNewsRepository
+from tests.fakes import make_document
+
+
+URL = "https://g1.globo.com/noticia/a.ghtml"
+
+
+@pytest.fixture
+def buffered(repo):
+    failures = []
+    buffer = WriteBehindNewsRepository(
+        repo, max_batch=3, max_delay=60,
+        on_failure=lambda news, error: failures.append((news, error)))
+    buffer.failures = failures
+    yield buffer
+    buffer.close(timeout=1)
+
+
+def test_upsert_returns_the_id_before_writing(mongo, buffered):
+    mongodb_id = buffered.upsert(URL, make_document())
+
+    assert mongo.db['news'].count_documents({}) == 0
+    assert buffered.find_by_url(URL)['_id'] == mongodb_id
+
+    buffered.flush()
+
+    assert str(mongo.db['news'].find_one({'url': URL})['_id']) == mongodb_id
+
+
+def test_same_url_twice_keeps_one_id_and_the_last_version(mongo, buffered):
+    first = buffered.upsert(URL, make_document(title="v1"))
+    second = buffered.upsert(URL, make_document(title="v2"))
+    buffered.flush()
+
+    assert first == second
+    assert mongo.db['news'].count_documents({}) == 1
+    assert mongo.db['news'].find_one({})['title'] == "v2"
+
+
+def test_known_id_is_kept_on_update(repo, buffered):
+    mongodb_id = repo.upsert(URL, make_document())
+
+    assert buffered.upsert(URL, make_document(_id=mongodb_id, title="novo")) == mongodb_id
+    buffered.flush()
+
+    assert repo.find_by_id(mongodb_id)['title'] == "novo"
+
+
+def test_full_buffer_is_written_by_the_background_thread(mongo, buffered):
+    urls = [f"https://g1.globo.com/noticia/{i}" for i in range(3)]
+    futures = [buffered.upsert_async(url, make_document(url))[1] for url in urls]
+
+    assert [future.result(timeout=5) for future in futures]
+    assert mongo.db['news'].count_documents({}) == 3
+
+
+def test_failed_write_fails_the_future_and_reports_the_news(buffered, monkeypatch):
+    def broken(news_list):
+        raise RuntimeError("mongo fora do ar")
+
+    monkeypatch.setattr(buffered._repository, "upsert_many", broken)
+    _, future = buffered.upsert_async(URL, make_document(task_id="task-9"))
+    buffered.flush()
+
+    with pytest.raises(WriteBehindError):
+        future.result(timeout=1)
+    [(news, error)] = buffered.failures
+    assert news['task_id'] == "task-9" and error.url == URL
+    assert buffered.find_by_url(URL) is None
+
+
+def test_closed_buffer_writes_what_is_left_and_rejects_new_news(mongo, buffered):
+    buffered.upsert(URL, make_document())
+    buffered.close(timeout=1)
+
+    assert mongo.db['news'].count_documents({}) == 1
+    with pytest.raises(RuntimeError):
+        buffered.upsert(URL, make_document())
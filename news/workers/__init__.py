@@ -1,5 +1,5 @@
 from .celery_app import celery_app
-from .tasks import process_news_url, process_news_batch, health_check
+from .tasks import process_news_url, process_news_batch, process_news_backfill, health_check
 
 __all__ = ['celery_app', 'process_news_url',
-           'process_news_batch', 'health_check']
+           'process_news_batch', 'process_news_backfill', 'health_check']
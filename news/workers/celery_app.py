@@ -1,8 +1,27 @@
 """
 Configuração do Celery para processamento assíncrono
 """
+import json
+import os
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
 from celery import Celery
+from celery.signals import (
+    before_task_publish,
+    task_failure,
+    task_postrun,
+    task_prerun,
+    task_retry,
+    task_success,
+    worker_init,
+    worker_process_init,
+    worker_process_shutdown,
+    worker_shutdown
+)
+from core import metrics
 from core.config import settings
+from workers.schedule import build_beat_schedule, load_entries
 
 # Cria a instância do Celery
 celery_app = Celery(
@@ -11,6 +30,9 @@ celery_app = Celery(
     backend=settings.CELERY_RESULT_BACKEND,
     include=["workers.tasks"]
 )
+# App padrão em todas as threads: as tasks (shared_task) também são
+# enfileiradas pelo threadpool da API, onde não há app corrente
+celery_app.set_default()
 
 # Configurações do Celery
 celery_app.conf.update(
@@ -29,10 +51,10 @@ celery_app.conf.update(
 
     # Results
     result_expires=3600,  # Resultados expiram em 1 hora
+    result_compression=settings.CELERY_RESULT_COMPRESSION or None,
 
-    # Worker - Windows compatibility
+    # Worker - pool, concorrência e prefetch vêm dos perfis (workers/profiles.py)
     worker_prefetch_multiplier=1,
-    worker_concurrency=1,  # Solo no Windows
 
     # Retry
     task_acks_late=True,
@@ -46,20 +68,251 @@ celery_app.conf.update(
 celery_app.conf.task_routes = {
     "workers.tasks.process_news_url": {"queue": "news"},
     "workers.tasks.process_news_batch": {"queue": "news"},
+    "workers.tasks.process_news_backfill": {"queue": "backfill"},
     "workers.tasks.publish_to_wordpress": {"queue": "publish"},
     "workers.tasks.publish_batch_to_wordpress": {"queue": "publish"},
     "workers.tasks.process_and_publish": {"queue": "news"},
 }
 
-# Configuração de rate limits (opcional)
-celery_app.conf.task_annotations = {
-    "workers.tasks.process_news_url": {
-        "rate_limit": "10/m"  # 10 por minuto
-    },
-    "workers.tasks.publish_to_wordpress": {
-        "rate_limit": "30/m"  # 30 por minuto - evita sobrecarga no WP
-    },
-    "workers.tasks.process_and_publish": {
-        "rate_limit": "5/m"  # 5 por minuto - mais pesada
-    },
+# Faixas de prioridade: cada faixa tem fila própria, consumida por workers
+# dedicados (perfil urgent) e pelos workers comuns (workers/profiles.py)
+PRIORITY_LANES = {
+    "workers.tasks.process_news_url": {"high": "news_high", "normal": "news", "low": "news_low"},
+    "workers.tasks.process_and_publish": {"high": "news_high", "normal": "news", "low": "news_low"},
+    "workers.tasks.publish_to_wordpress": {"high": "publish_high", "normal": "publish", "low": "publish"},
 }
+
+
+def lane_queue(task_name: str, priority: str = "normal") -> str:
+    """Fila da faixa de prioridade de uma task"""
+    lanes = PRIORITY_LANES[task_name]
+    if priority not in lanes:
+        raise ValueError(f"Prioridade desconhecida: {priority}")
+    return lanes[priority]
+
+
+# Rate limits: em vez de rate_limit por worker (que também frearia a faixa
+# alta), LLM e WordPress têm orçamentos por minuto compartilhados no Redis,
+# com reserva para a faixa alta (infra/rate_budget.py), ajustados pelo
+# controle AIMD (infra/adaptive_rate.py) na task adjust_rate_limits
+
+# Todas as filas consumidas pelos workers (workers/profiles.py)
+QUEUES = ("news_high", "news", "news_low", "celery", "backfill", "publish_high", "publish")
+
+# Filas cujas tasks consomem cada orçamento (demanda para o controle AIMD)
+RATE_QUEUES = {
+    "llm": ("news_high", "news", "news_low", "backfill"),
+    "wordpress": ("publish_high", "publish"),
+}
+
+
+def queue_depths(queues: Iterable[str]) -> Dict[str, Optional[int]]:
+    """
+    Mensagens aguardando em cada fila do broker
+
+    Args:
+        queues: Nomes das filas
+
+    Returns:
+        Dicionário fila -> mensagens (None se não foi possível consultar)
+    """
+    depths: Dict[str, Optional[int]] = {}
+    with celery_app.connection_for_read() as connection:
+        channel = connection.default_channel
+        for queue in queues:
+            try:
+                depths[queue] = channel.queue_declare(queue=queue, passive=True).message_count
+            except Exception:
+                depths[queue] = None
+    return depths
+
+
+def queue_stats(queues: Iterable[str]) -> Dict[str, Tuple[Optional[int], Optional[float]]]:
+    """
+    Profundidade e idade da mensagem mais antiga de cada fila
+
+    A idade vem do header enqueued_at da mensagem mais antiga; só é
+    consultada no broker Redis (as filas são listas com LPUSH/BRPOP).
+
+    Args:
+        queues: Nomes das filas
+
+    Returns:
+        Dicionário fila -> (mensagens, idade em segundos ou None)
+    """
+    queues = list(queues)
+    depths = queue_depths(queues)
+    stats = {}
+    with celery_app.connection_for_read() as connection:
+        client = getattr(connection.default_channel, "client", None)
+        for queue in queues:
+            age = None
+            if client is not None and depths[queue]:
+                try:
+                    oldest = client.lindex(queue, -1)
+                    enqueued_at = json.loads(oldest)["headers"].get("enqueued_at") if oldest else None
+                    if enqueued_at:
+                        age = max(0.0, time.time() - float(enqueued_at))
+                except Exception:
+                    age = None
+            stats[queue] = (depths[queue], age)
+    return stats
+
+
+# Tarefas periódicas (requer o processo beat: python run.py beat), definidas
+# em BEAT_SCHEDULE_FILE e sobrescritas por BEAT_<NOME> no ambiente
+BEAT_ENTRIES = load_entries(settings.BEAT_SCHEDULE_FILE, defaults={
+    "adjust_rate_limits": {
+        "task": "workers.tasks.adjust_rate_limits",
+        "every": settings.ADAPTIVE_RATE_INTERVAL,
+        "enabled": settings.ADAPTIVE_RATE_ENABLED,
+    },
+})
+celery_app.conf.beat_schedule = build_beat_schedule(BEAT_ENTRIES)
+
+
+# Recursos compartilhados por processo (MongoClient, sessão HTTP, scrapers)
+# Inicializados após o fork: MongoClient não pode ser herdado do processo pai
+@worker_process_init.connect
+def init_worker_resources(**kwargs):
+    from infra.resource_container import container
+    container.init()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def close_worker_resources(**kwargs):
+    from infra.resource_container import container
+    container.close()
+
+
+# Métricas (core/metrics.py): o header enqueued_at permite medir a espera
+# na fila; cada worker expõe as métricas em METRICS_PORT
+@before_task_publish.connect
+def stamp_enqueued_at(headers=None, **kwargs):
+    if headers is not None:
+        headers.setdefault("enqueued_at", time.time())
+
+
+@worker_init.connect
+def start_worker_metrics(sender=None, **kwargs):
+    if not settings.METRICS_ENABLED:
+        return
+    metrics.set_worker_concurrency(sender.hostname, sender.concurrency)
+    if settings.METRICS_PORT:
+        metrics.start_exporter(settings.METRICS_PORT)
+
+
+@worker_process_shutdown.connect
+def discard_process_metrics(pid=None, **kwargs):
+    metrics.mark_process_dead(pid or os.getpid())
+
+
+def _request_header(request, name):
+    value = getattr(request, name, None)
+    if value is None:
+        value = (getattr(request, "headers", None) or {}).get(name)
+    return value
+
+
+@task_prerun.connect
+def metrics_task_started(sender=None, task_id=None, **kwargs):
+    if not settings.METRICS_ENABLED:
+        return
+    request = sender.request
+    metrics.task_started(
+        task_id, sender.name, request.hostname,
+        (request.delivery_info or {}).get("routing_key"),
+        _request_header(request, "enqueued_at"))
+
+
+@task_postrun.connect
+def metrics_task_finished(sender=None, task_id=None, state=None, retval=None, **kwargs):
+    if not settings.METRICS_ENABLED:
+        return
+    metrics.task_finished(task_id, sender.name, sender.request.hostname, state, retval)
+    from infra.resource_container import container
+    metrics.observe_http_pool(container.http_session())
+
+
+# Progresso dos lotes: as tasks filhas de um group atualizam os contadores
+# do lote (o ID do group é o ID da task que criou o lote)
+_BATCH_ERROR_STATUSES = ("error", "processing_error", "publish_error")
+
+
+def _record_batch_event(group_id, event):
+    if not group_id:
+        return
+    from infra.resource_container import container
+    container.batch_tracker().record(group_id, event)
+
+
+@task_prerun.connect
+def batch_task_started(sender=None, **kwargs):
+    _record_batch_event(sender.request.group, "started")
+
+
+@task_success.connect
+def batch_task_succeeded(sender=None, result=None, **kwargs):
+    # Tasks que retornam status de erro (sem exceção) contam como falha e
+    # URLs em quarentena têm contador próprio
+    status = result.get("status") if isinstance(result, dict) else None
+    if status == "quarantined":
+        event = "quarantined"
+    else:
+        event = "failed" if status in _BATCH_ERROR_STATUSES else "succeeded"
+    _record_batch_event(sender.request.group, event)
+
+
+@task_failure.connect
+def batch_task_failed(sender=None, **kwargs):
+    _record_batch_event(sender.request.group, "failed")
+
+
+@task_retry.connect
+def batch_task_retried(request=None, **kwargs):
+    _record_batch_event(getattr(request, "group", None), "retried")
+
+
+# Travas de deduplicação por URL (workers.tasks.enqueue_unique): renovadas
+# durante a execução, mantidas em retry e liberadas ao terminar
+_DEDUP_TASKS = ("workers.tasks.process_news_url", "workers.tasks.process_and_publish")
+
+
+def _dedup_key(sender, args, kwargs):
+    if not settings.DEDUP_ENABLED or sender.name not in _DEDUP_TASKS:
+        return None
+    args, kwargs = args or (), kwargs or {}
+    url = args[0] if args else kwargs.get("url")
+    schema_name = args[1] if len(args) > 1 else kwargs.get("schema_name", "g1")
+    if not url:
+        return None
+    from infra.resource_container import container
+    return container.enqueue_lock().url_key(sender.name, url, schema_name)
+
+
+@task_prerun.connect
+def dedup_lock_running(sender=None, task_id=None, args=None, kwargs=None, **extra):
+    key = _dedup_key(sender, args, kwargs)
+    if key:
+        from infra.resource_container import container
+        lock = container.enqueue_lock()
+        # Em execução, a trava é fixada: um pedido na faixa alta não a toma
+        # mais (se já tomou, a task é ignorada por _superseded)
+        pinned = lock.pinned(task_id)
+        if not lock.swap(key, task_id, pinned, settings.DEDUP_RUNNING_TTL):
+            lock.extend(key, pinned, settings.DEDUP_RUNNING_TTL)
+
+
+@task_postrun.connect
+def dedup_lock_finished(sender=None, task_id=None, args=None, kwargs=None, state=None, **extra):
+    key = _dedup_key(sender, args, kwargs)
+    if not key:
+        return
+    from infra.resource_container import container
+    lock = container.enqueue_lock()
+    if state == "RETRY":
+        # A mesma task volta para a fila: novas submissões seguem deduplicadas
+        lock.extend(key, lock.pinned(task_id), settings.DEDUP_ENQUEUE_TTL)
+    else:
+        lock.release(key, lock.pinned(task_id))
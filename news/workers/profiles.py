@@ -0,0 +1,150 @@
+"""
+Perfis de worker do Celery por tipo de carga
+"""
+import sys
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from core.logging import log
+except ImportError:
+    from loguru import logger as log
+
+
+@dataclass(frozen=True)
+class WorkerProfile:
+    """
+    Configuração de um worker: filas, pool, concorrência e prefetch
+
+    - prefork: processos (CPU, isolamento); suporta --autoscale
+    - threads: I/O bloqueante (HTTP, MongoDB) com baixo custo por task
+    - gevent: muitas conexões simultâneas (requer o pacote gevent)
+    - solo: uma task por vez, no processo principal (Windows/debug)
+    """
+    name: str
+    queues: Tuple[str, ...]
+    pool: str
+    concurrency: int
+    prefetch_multiplier: int = 1
+    description: str = ""
+
+    def argv(self, autoscale: Optional[str] = None, loglevel: str = "info") -> List[str]:
+        """
+        Monta os argumentos de celery worker para o perfil
+
+        Args:
+            autoscale: 'max,min' para o autoscaler (apenas prefork)
+            loglevel: Nível de log do worker
+
+        Returns:
+            Argumentos para celery_app.worker_main
+        """
+        profile = self._for_platform()
+        args = [
+            'worker',
+            f'--loglevel={loglevel}',
+            f'--hostname={profile.name}@%h',
+            f'--pool={profile.pool}',
+            f'--prefetch-multiplier={profile.prefetch_multiplier}',
+            '-Q', ','.join(profile.queues),
+        ]
+
+        if autoscale and profile.pool == "prefork":
+            args.append(f'--autoscale={autoscale}')
+        elif profile.pool != "solo":
+            if autoscale:
+                log.warning(
+                    f"--autoscale só é suportado pelo pool prefork; "
+                    f"usando concorrência fixa ({profile.concurrency})")
+            args.append(f'--concurrency={profile.concurrency}')
+        return args
+
+    def _for_platform(self) -> "WorkerProfile":
+        """No Windows o pool prefork não funciona: troca por solo"""
+        if sys.platform == "win32" and self.pool == "prefork":
+            return replace(self, pool="solo", concurrency=1)
+        return self
+
+
+# Perfis padrão por etapa; filas conforme task_routes e PRIORITY_LANES em
+# workers.celery_app. Um worker com várias filas as consome em rodízio (cada
+# faixa tem a mesma vez); a faixa alta ainda tem o perfil urgent dedicado.
+PROFILES: Dict[str, WorkerProfile] = {
+    "urgent": WorkerProfile(
+        name="urgent",
+        queues=("news_high", "publish_high"),
+        pool="threads",
+        concurrency=4,
+        prefetch_multiplier=1,
+        description="Faixa alta: capacidade reservada para notícias urgentes"
+    ),
+    "scrape": WorkerProfile(
+        name="scrape",
+        queues=("news_high", "news", "news_low", "celery"),
+        pool="threads",
+        concurrency=8,
+        prefetch_multiplier=2,
+        description="Processamento de URLs (download, parsing e LLM), I/O"
+    ),
+    "llm": WorkerProfile(
+        name="llm",
+        queues=("backfill",),
+        pool="threads",
+        concurrency=1,
+        prefetch_multiplier=1,
+        description="Backfills em lote: o pipeline já limita as chamadas ao LLM"
+    ),
+    "publish": WorkerProfile(
+        name="publish",
+        queues=("publish_high", "publish"),
+        pool="threads",
+        concurrency=4,
+        prefetch_multiplier=1,
+        description="Publicação no WordPress (HTTP, com rate limit)"
+    ),
+    "all": WorkerProfile(
+        name="all",
+        queues=("news_high", "publish_high", "celery", "news", "news_low",
+                "backfill", "publish"),
+        pool="prefork",
+        concurrency=2,
+        prefetch_multiplier=1,
+        description="Todas as filas em um worker (desenvolvimento)"
+    ),
+}
+
+
+def get_profile(
+    name: str,
+    pool: Optional[str] = None,
+    concurrency: Optional[int] = None,
+    prefetch_multiplier: Optional[int] = None,
+    queues: Optional[List[str]] = None
+) -> WorkerProfile:
+    """
+    Retorna um perfil, com ajustes opcionais
+
+    Args:
+        name: Nome do perfil (urgent, scrape, llm, publish, all)
+        pool: Substitui o pool do perfil
+        concurrency: Substitui a concorrência
+        prefetch_multiplier: Substitui o prefetch
+        queues: Substitui as filas consumidas
+
+    Returns:
+        WorkerProfile configurado
+
+    Raises:
+        ValueError: Se o perfil não existir
+    """
+    if name not in PROFILES:
+        raise ValueError(
+            f"Perfil desconhecido: {name}. Disponíveis: {', '.join(PROFILES)}")
+
+    overrides = {
+        'pool': pool,
+        'concurrency': concurrency,
+        'prefetch_multiplier': prefetch_multiplier,
+        'queues': tuple(queues) if queues else None,
+    }
+    return replace(PROFILES[name], **{k: v for k, v in overrides.items() if v is not None})
@@ -0,0 +1,223 @@
+"""
+Dispatcher de publicação: enfileira publish_to_wordpress assim que uma
+notícia processada chega ao MongoDB
+"""
+import threading
+from datetime import datetime, timezone
+from typing import Callable, Optional, Dict, Any, Tuple
+
+from bson import ObjectId
+from pymongo.errors import OperationFailure, PyMongoError
+
+from core.config import settings
+from infra.mongodb_infra import MongoDBInfra
+from infra.mongo_news_repository import MongoNewsRepository
+
+try:
+    from core.logging import log
+except ImportError:
+    from loguru import logger as log
+
+
+# Código do MongoDB para change streams em servidor standalone
+CHANGE_STREAM_UNSUPPORTED = 40573
+# Código do MongoDB para resume token que já saiu do oplog
+CHANGE_STREAM_HISTORY_LOST = 286
+
+
+class PublishDispatcher:
+    """
+    Acompanha a coleção de notícias e enfileira a publicação no WordPress
+
+    Usa um change stream (requer replica set ou sharded cluster) e grava o
+    resume token a cada evento, retomando do ponto exato após uma queda.
+    Em MongoDB standalone, cai para polling incremental por 'updated_at'.
+
+    Reage a inserções e a atualizações de conteúdo (upserts, que gravam
+    'updated_at'); as marcações de publicação e de erro não disparam
+    nova publicação.
+    """
+
+    STATE_COLLECTION = "dispatcher_state"
+    STATE_ID = "publish_dispatcher"
+    POLL_SORT = [('updated_at', 1), ('_id', 1)]
+
+    def __init__(
+        self,
+        db: MongoDBInfra,
+        enqueue: Callable[[str, str], Any],
+        mode: Optional[str] = None,
+        poll_interval: Optional[float] = None,
+        batch_size: Optional[int] = None
+    ):
+        """
+        Inicializa o dispatcher
+
+        Args:
+            db: Instância de MongoDBInfra
+            enqueue: Função que enfileira a publicação (mongodb_id, prioridade)
+            mode: auto, change_stream ou polling
+            poll_interval: Intervalo (s) do polling e da espera do change stream
+            batch_size: Documentos por consulta no polling
+        """
+        self._db = db
+        self._enqueue = enqueue
+        self._mode = mode or settings.PUBLISH_DISPATCHER_MODE
+        self._poll_interval = poll_interval or settings.PUBLISH_DISPATCHER_POLL_INTERVAL
+        self._batch_size = batch_size or settings.PUBLISH_DISPATCHER_BATCH_SIZE
+        self._stop = threading.Event()
+
+    @property
+    def _news(self):
+        return self._db.db[MongoNewsRepository.COLLECTION]
+
+    @property
+    def _state(self):
+        return self._db.db[self.STATE_COLLECTION]
+
+    def stop(self) -> None:
+        """Solicita o encerramento do loop"""
+        self._stop.set()
+
+    def run(self) -> None:
+        """Executa o dispatcher até stop()"""
+        if self._mode == "polling":
+            self._run_polling()
+            return
+
+        while not self._stop.is_set():
+            try:
+                self._run_change_stream()
+            except OperationFailure as e:
+                if self._mode == "auto" and e.code == CHANGE_STREAM_UNSUPPORTED:
+                    log.warning(
+                        "Change streams indisponíveis (MongoDB standalone); usando polling")
+                    self._run_polling()
+                    return
+                if e.code == CHANGE_STREAM_HISTORY_LOST:
+                    # O oplog já não contém o token: recomeça do momento atual
+                    log.warning(
+                        "Resume token expirado no oplog; reiniciando o change stream")
+                    self._save_state(resume_token=None)
+                    continue
+                raise
+            except PyMongoError as e:
+                # O token está salvo: reabre o stream após a falha
+                log.error(f"Change stream interrompido: {e}")
+                self._stop.wait(self._poll_interval)
+
+    # --- Change stream -------------------------------------------------
+
+    @staticmethod
+    def _change_stream_pipeline() -> list:
+        """Eventos de notícias processadas e ainda não publicadas"""
+        pending = {
+            f'fullDocument.{field}': condition
+            for field, condition in MongoNewsRepository._unpublished_filter().items()
+        }
+        return [{'$match': {
+            **pending,
+            '$and': [
+                {'$or': [
+                    {'operationType': 'insert'},
+                    {
+                        'operationType': 'update',
+                        'updateDescription.updatedFields.updated_at': {'$exists': True}
+                    }
+                ]},
+                {'$or': [
+                    {'fullDocument.publish_attempts': {'$exists': False}},
+                    {'fullDocument.publish_attempts': {'$lt': 3}}
+                ]}
+            ]
+        }}]
+
+    def _run_change_stream(self) -> None:
+        """Consome o change stream, persistindo o resume token a cada evento"""
+        resume_token = (self._load_state() or {}).get('resume_token')
+        log.info(
+            f"Dispatcher em modo change stream "
+            f"({'retomando do último evento' if resume_token else 'a partir de agora'})")
+
+        with self._news.watch(
+            self._change_stream_pipeline(),
+            full_document='updateLookup',
+            resume_after=resume_token,
+            max_await_time_ms=int(self._poll_interval * 1000)
+        ) as stream:
+            while not self._stop.is_set() and stream.alive:
+                change = stream.try_next()
+                if change is None:
+                    continue
+                self._dispatch(
+                    str(change['documentKey']['_id']),
+                    change['fullDocument'].get('priority', 'normal'))
+                self._save_state(resume_token=change['_id'])
+
+    # --- Polling -------------------------------------------------------
+
+    def _run_polling(self) -> None:
+        """Busca notícias pendentes alteradas após a última posição lida"""
+        state = self._load_state() or {}
+        position = (state.get('watermark'), state.get('watermark_id'))
+        log.info(f"Dispatcher em modo polling (a cada {self._poll_interval}s)")
+
+        while not self._stop.is_set():
+            try:
+                position = self._poll_once(*position)
+            except PyMongoError as e:
+                log.error(f"Erro no polling do dispatcher: {e}")
+            self._stop.wait(self._poll_interval)
+
+    def _poll_once(
+        self,
+        watermark: Optional[datetime],
+        watermark_id: Optional[ObjectId]
+    ) -> Tuple[Optional[datetime], Optional[ObjectId]]:
+        """
+        Processa um lote de notícias a partir da posição (updated_at, _id)
+
+        A chave composta evita perder ou repetir documentos gravados no
+        mesmo instante (o bulk upsert usa um único updated_at por lote).
+
+        Returns:
+            Nova posição (updated_at, _id) do último documento enfileirado
+        """
+        query: Dict[str, Any] = MongoNewsRepository._pending_filter()
+        if watermark is None:
+            query['updated_at'] = {'$exists': True}
+        else:
+            query['$and'] = [{'$or': [
+                {'updated_at': {'$gt': watermark}},
+                {'updated_at': watermark, '_id': {'$gt': watermark_id}}
+            ]}]
+
+        cursor = self._news.find(query, {'_id': 1, 'updated_at': 1, 'priority': 1}) \
+            .sort(self.POLL_SORT).limit(self._batch_size)
+
+        for doc in cursor:
+            self._dispatch(str(doc['_id']), doc.get('priority', 'normal'))
+            watermark, watermark_id = doc['updated_at'], doc['_id']
+            self._save_state(watermark=watermark, watermark_id=watermark_id)
+
+        return watermark, watermark_id
+
+    # --- Estado --------------------------------------------------------
+
+    def _dispatch(self, mongodb_id: str, priority: str = "normal") -> None:
+        """Enfileira a publicação de uma notícia na faixa gravada no documento"""
+        if self._enqueue(mongodb_id, priority) is None:
+            # Já publicada ou reservada (ex.: process_and_publish)
+            log.debug(f"[Dispatcher] Publicação já reservada, ignorando: {mongodb_id}")
+            return
+        log.info(f"[Dispatcher] Publicação enfileirada ({priority}): {mongodb_id}")
+
+    def _load_state(self) -> Optional[Dict[str, Any]]:
+        return self._state.find_one({'_id': self.STATE_ID})
+
+    def _save_state(self, **fields: Any) -> None:
+        self._state.update_one(
+            {'_id': self.STATE_ID},
+            {'$set': {**fields, 'updated_at': datetime.now(timezone.utc)}},
+            upsert=True
+        )
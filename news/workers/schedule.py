@@ -0,0 +1,139 @@
+"""
+Agenda do celery beat: tarefas periódicas definidas em YAML e no ambiente
+"""
+import os
+import random
+from datetime import timedelta
+from typing import Dict, Any, Optional
+
+import yaml
+from celery.schedules import crontab, schedule
+
+try:
+    from core.logging import log
+except ImportError:
+    from loguru import logger as log
+
+
+class jittered(schedule):
+    """
+    Intervalo fixo com atraso aleatório de até 'jitter' segundos por execução
+
+    Evita que várias tarefas (ou várias instâncias) disparem sempre no
+    mesmo instante; um novo atraso é sorteado a cada execução.
+    """
+
+    def __init__(self, run_every, jitter: float = 0, *args, **kwargs):
+        super().__init__(run_every, *args, **kwargs)
+        self.jitter = max(0.0, float(jitter))
+        self._offset = random.uniform(0, self.jitter)
+
+    def remaining_estimate(self, last_run_at):
+        return super().remaining_estimate(last_run_at) + timedelta(seconds=self._offset)
+
+    def is_due(self, last_run_at):
+        state = super().is_due(last_run_at)
+        if state.is_due:
+            self._offset = random.uniform(0, self.jitter)
+        return state
+
+    def __reduce__(self):
+        return self.__class__, (self.run_every, self.jitter, self.relative, self.nowfun)
+
+    def __repr__(self):
+        return f"<jittered: every {self.human_seconds} (+{self.jitter:.0f}s)>"
+
+
+def load_entries(
+    path: str,
+    defaults: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Carrega as entradas do YAML e aplica as sobrescritas do ambiente
+
+    Args:
+        path: Caminho do YAML da agenda
+        defaults: Entradas usadas quando o YAML não define o mesmo nome
+
+    Returns:
+        Entradas habilitadas, por nome
+    """
+    entries = {name: dict(entry) for name, entry in (defaults or {}).items()}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entries.update(yaml.safe_load(f) or {})
+    except FileNotFoundError:
+        log.warning(f"Agenda do beat não encontrada: {path}")
+
+    for name, entry in entries.items():
+        env_name = f"BEAT_{name.upper()}"
+        override = os.getenv(env_name)
+        if override:
+            override = override.strip()
+            entry.pop('every', None)
+            entry.pop('cron', None)
+            if override.lower() == 'off':
+                entry['enabled'] = False
+            elif len(override.split()) == 5:
+                entry['cron'] = override
+            else:
+                entry['every'] = float(override)
+        jitter = os.getenv(f"{env_name}_JITTER")
+        if jitter:
+            entry['jitter'] = float(jitter)
+
+    return {name: entry for name, entry in entries.items() if entry.get('enabled', True)}
+
+
+def build_beat_schedule(entries: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Converte as entradas para o formato de beat_schedule do Celery
+
+    Entradas por intervalo expiram após o intervalo: uma execução que
+    ficou na fila não roda depois da seguinte.
+
+    Args:
+        entries: Entradas carregadas por load_entries
+
+    Returns:
+        Dicionário para celery_app.conf.beat_schedule
+    """
+    beat_schedule = {}
+    for name, entry in entries.items():
+        options: Dict[str, Any] = {}
+        if 'cron' in entry:
+            minute, hour, day_of_month, month_of_year, day_of_week = entry['cron'].split()
+            run = crontab(minute=minute, hour=hour, day_of_month=day_of_month,
+                          month_of_year=month_of_year, day_of_week=day_of_week)
+        elif 'every' in entry:
+            every = float(entry['every'])
+            run = jittered(timedelta(seconds=every), entry.get('jitter', 0))
+            options['expires'] = every
+        else:
+            log.warning(f"Entrada '{name}' da agenda sem 'every' nem 'cron', ignorada")
+            continue
+
+        beat_schedule[name] = {
+            "task": entry['task'],
+            "schedule": run,
+            "kwargs": entry.get('kwargs', {}),
+            "options": options,
+        }
+    return beat_schedule
+
+
+def lock_ttl(entry: Dict[str, Any], default: int = 300) -> int:
+    """Validade da trava contra sobreposição de uma entrada"""
+    if 'lock_ttl' in entry:
+        return int(entry['lock_ttl'])
+    if 'every' in entry:
+        return int(float(entry['every']))
+    return default
+
+
+def find_entry(entries: Dict[str, Dict[str, Any]], task_name: str) -> Optional[Dict[str, Any]]:
+    """Entrada da agenda que dispara a task (None se não estiver agendada)"""
+    for entry in entries.values():
+        if entry.get('task') == task_name:
+            return entry
+    return None
@@ -1,14 +1,339 @@
-from celery import shared_task
+from contextlib import contextmanager
+from dataclasses import asdict
+from typing import Optional, Tuple
+from celery import group, shared_task
+from celery.exceptions import Retry
+from celery.utils import uuid
 
 from core.config import settings
 from core.logging import log
+from domain.entities import StageTimings
 from domain.factories import UseCaseFactory
-from domain.usecases import ProcessNewsInput
-from services.wordpress_publisher import WordPressPublisherService
-from infra.mongo_news_repository import MongoNewsRepository
-from infra.mongo_news_repository import MongoNewsRepository
-from services.wordpress_publisher import WordPressPublisherService
-from infra.mongo_news_repository import MongoNewsRepository
+from domain.interfaces import RateBudgetExceeded
+from domain.usecases import ProcessNewsInput, ProcessNewsBatchInput
+from infra.resource_container import container
+from workers.celery_app import lane_queue, queue_depths, BEAT_ENTRIES, RATE_QUEUES
+from workers.schedule import find_entry, lock_ttl
+
+
+def report_write_failure(news_data: dict, error: Exception) -> None:
+    """
+    Reporta à task de origem uma notícia que falhou na gravação adiada
+
+    A task já terminou (a gravação acontece depois), então o resultado dela
+    é substituído por FAILURE no backend.
+    """
+    task_id = news_data.get("task_id")
+    log.error(f"[Task {task_id}] {error}")
+    if task_id:
+        process_news_url.backend.mark_as_failure(task_id, error)
+
+
+# Falhas do buffer de gravação (modo backfill) voltam para as tasks
+container.set_write_failure_handler(report_write_failure)
+
+
+def enqueue_unique(
+    task,
+    url: str,
+    schema_name: str = "g1",
+    *args,
+    priority: str = "normal"
+) -> Tuple[str, bool]:
+    """
+    Enfileira uma task por URL sem duplicar trabalho pendente
+
+    A URL normalizada recebe uma trava curta com o ID da nova task; se a
+    trava já existir, a task dona é devolvida e nada é enfileirado. A task
+    vai para a fila da faixa de prioridade. Um pedido na faixa alta para
+    uma URL ainda na fila normal/baixa toma a trava para uma nova task na
+    fila alta; a task antiga é ignorada ao sair da fila.
+
+    Args:
+        task: Task cujo primeiro argumento é a URL (process_news_url, process_and_publish)
+        url: URL da notícia
+        schema_name: Nome do schema YAML
+        *args: Demais argumentos da task
+        priority: Faixa de prioridade ('high', 'normal' ou 'low')
+
+    Returns:
+        Tupla (task_id, duplicada)
+    """
+    options = {
+        "args": (url, schema_name, *args),
+        "kwargs": {"priority": priority},
+        "queue": lane_queue(task.name, priority),
+    }
+    if not settings.DEDUP_ENABLED:
+        return task.apply_async(**options).id, False
+
+    lock = container.enqueue_lock()
+    key = lock.url_key(task.name, url, schema_name)
+    task_id = uuid()
+    owner = _reserve_url(lock, key, task_id, priority)
+    if owner is not None:
+        log.info(f"URL já enfileirada (task {owner}): {url}")
+        return owner, True
+
+    try:
+        task.apply_async(task_id=task_id, **options)
+    except Exception:
+        lock.release(key, _url_owner(lock, task_id, priority))
+        raise
+    return task_id, False
+
+
+def _url_owner(lock, task_id: str, priority: str) -> str:
+    """Dono da trava por URL: tasks da faixa alta não podem ser substituídas"""
+    return lock.pinned(task_id) if priority == "high" else task_id
+
+
+def _reserve_url(lock, key: str, task_id: str, priority: str) -> Optional[str]:
+    """
+    Obtém a trava da URL para uma nova task
+
+    Na faixa alta, toma a trava de uma task ainda na fila normal/baixa.
+
+    Returns:
+        None se a trava ficou com task_id; senão, o ID da task dona
+    """
+    owner_value = _url_owner(lock, task_id, priority)
+    owner = lock.acquire(key, owner_value, settings.DEDUP_ENQUEUE_TTL)
+    if owner is None:
+        return None
+    if priority == "high" and not lock.is_pinned(owner):
+        if lock.swap(key, owner, owner_value, settings.DEDUP_ENQUEUE_TTL):
+            log.info(f"URL promovida para a faixa alta (task {owner} substituída por {task_id})")
+            return None
+        # A task antiga começou a executar entre o acquire e o swap
+        owner = lock.owner_of(key) or owner
+    return lock.task_of(owner)
+
+
+def _superseded(task, url: str, schema_name: str) -> Optional[dict]:
+    """
+    Resultado de uma task cuja trava da URL passou para outra task
+
+    Acontece quando um pedido na faixa alta substituiu esta task enquanto
+    ela estava na fila (a trava já foi fixada em dedup_lock_running).
+    """
+    if not settings.DEDUP_ENABLED:
+        return None
+    lock = container.enqueue_lock()
+    owner = lock.owner_of(lock.url_key(task.name, url, schema_name))
+    task_id = task.request.id
+    if owner is None or lock.task_of(owner) == task_id:
+        return None
+    log.info(f"[Task {task_id}] URL assumida pela task {lock.task_of(owner)}, ignorando: {url}")
+    return {
+        "status": "superseded",
+        "task_id": task_id,
+        "url": url,
+        "superseded_by": lock.task_of(owner)
+    }
+
+
+def enqueue_publish(mongodb_id: str, priority: str = "normal"):
+    """
+    Reserva a publicação de uma notícia e a enfileira na fila da sua faixa
+
+    A reserva fica com o ID da nova task: dispatcher, varredura e API não
+    enfileiram de novo uma notícia já reservada, e a task a reaproveita.
+
+    Args:
+        mongodb_id: ID do documento no MongoDB
+        priority: Faixa de prioridade
+
+    Returns:
+        AsyncResult da task, ou None se a notícia já foi publicada ou está
+        reservada por outra task
+    """
+    repo = container.news_repository()
+    task_id = uuid()
+    if not repo.claim_publish(mongodb_id, task_id, settings.PUBLISH_CLAIM_TTL):
+        log.info(f"Publicação já reservada ou concluída, ignorando: {mongodb_id}")
+        return None
+
+    try:
+        return publish_to_wordpress.apply_async(
+            (mongodb_id,),
+            {"priority": priority},
+            task_id=task_id,
+            queue=lane_queue(publish_to_wordpress.name, priority)
+        )
+    except Exception:
+        repo.release_publish_claim(mongodb_id, task_id)
+        raise
+
+
+def _publish_claim(task_id: str) -> dict:
+    """Reserva de publicação gravada junto com a notícia pela task que publica"""
+    return container.news_repository().publish_claim(task_id, settings.PUBLISH_CLAIM_TTL)
+
+
+def _claimed_result(task_id: str, mongodb_id: str) -> dict:
+    """Resultado de uma publicação que outro caminho já concluiu ou reservou"""
+    news = container.news_repository().find_by_id(mongodb_id, fields="summary") or {}
+    if news.get("wordpress_published"):
+        return {
+            "status": "already_published",
+            "task_id": task_id,
+            "mongodb_id": mongodb_id,
+            "wordpress_post_id": news.get("wordpress_post_id"),
+            "wordpress_url": news.get("wordpress_url")
+        }
+    log.info(f"[Task {task_id}] Publicação reservada por outra task, ignorando: {mongodb_id}")
+    return {
+        "status": "claimed",
+        "task_id": task_id,
+        "mongodb_id": mongodb_id,
+        "message": "Publicação em andamento por outra task"
+    }
+
+
+def _acquire_publish_budget(task, priority: str) -> None:
+    """
+    Reserva uma publicação no orçamento do WordPress (ou adia a task)
+
+    Chamada logo antes do POST, com a notícia já processada e reservada.
+    """
+    budget = container.rate_budget("wordpress")
+    if not budget.acquire(priority, settings.RATE_BUDGET_MAX_WAIT):
+        raise _defer(task, budget.seconds_to_next_window())
+
+
+def _defer(task, countdown: float) -> Retry:
+    """
+    Reagenda a task sem consumir tentativas
+
+    Orçamento esgotado não é falha: a mensagem volta para a fila com o
+    mesmo ID (reserva e checkpoint preservados) e o mesmo contador de
+    retries, ao contrário de task.retry, que o incrementa.
+
+    Returns:
+        Exceção Retry a ser lançada pela task
+    """
+    signature = task.signature_from_request(
+        countdown=countdown, retries=task.request.retries)
+    signature.apply_async()
+    log.info(f"[Task {task.request.id}] Orçamento esgotado, adiada por {countdown:.0f}s")
+    return Retry(when=countdown, sig=signature)
+
+
+def _publish_overloaded(result) -> bool:
+    """Timeout, falha de conexão ou erro 5xx do WordPress"""
+    status_code = result.status_code or 0
+    return (result.timed_out or status_code >= 500
+            or (not result.success and status_code == 0))
+
+
+def _observe_publish(result, timings: StageTimings) -> None:
+    """Registra a publicação no controle adaptativo do orçamento do WordPress"""
+    container.rate_budget("wordpress").observe(
+        timings.as_dict().get("publish", 0.0) / 1000,
+        error=_publish_overloaded(result),
+        throttled=result.status_code == 429
+    )
+
+
+def _can_retry(task) -> bool:
+    """Indica se a task ainda tem tentativas (o retry retoma do checkpoint)"""
+    return task.request.retries < task.max_retries
+
+
+def _load_checkpoint(task_id: str):
+    """Checkpoint de uma execução anterior da task (None se não houver)"""
+    checkpoints = container.checkpoint_store()
+    return checkpoints.load(task_id) if checkpoints is not None else None
+
+
+def _checkpoint_published(task_id: str, mongodb_id: str, result, timings: StageTimings) -> None:
+    """Registra a publicação antes de marcar a notícia (evita post duplicado no retry)"""
+    checkpoints = container.checkpoint_store()
+    if checkpoints is not None:
+        checkpoints.save(task_id, "published", {
+            'mongodb_id': mongodb_id,
+            'post_id': result.post_id,
+            'post_url': result.post_url,
+            'timings': timings.as_dict()
+        })
+
+
+def _resume_published(task_id: str, checkpoint: dict) -> dict:
+    """Conclui uma task que já publicou no WordPress em uma tentativa anterior"""
+    log.info(f"[Task {task_id}] Já publicada em tentativa anterior, retomando")
+    container.news_repository().mark_as_published(
+        checkpoint['mongodb_id'],
+        post_id=checkpoint['post_id'],
+        post_url=checkpoint['post_url'],
+        timings=checkpoint.get('timings')
+    )
+    return {
+        "status": "published",
+        "task_id": task_id,
+        "mongodb_id": checkpoint['mongodb_id'],
+        "wordpress_post_id": checkpoint['post_id'],
+        "wordpress_url": checkpoint['post_url'],
+        "timings": checkpoint.get('timings', {}),
+        "resumed": True
+    }
+
+
+def _quarantined(url: str, force: bool = False) -> Optional[dict]:
+    """Registro de dead letter da URL se ela estiver em quarentena"""
+    dead_letters = container.dead_letters()
+    if force or dead_letters is None:
+        return None
+    return dead_letters.quarantined(url)
+
+
+def _quarantined_result(task_id: str, url: str, entry: dict) -> dict:
+    """Resultado de uma submissão ignorada por quarentena"""
+    log.info(f"[Task {task_id}] URL em quarentena ({entry.get('failure')}), ignorando: {url}")
+    return {
+        "status": "quarantined",
+        "task_id": task_id,
+        "url": url,
+        "dead_letter_id": entry['_id'],
+        "failure": entry.get('failure'),
+        "attempts": entry.get('attempts'),
+        "last_error": entry.get('last_error'),
+        "quarantined_until": entry['quarantined_until'].isoformat()
+    }
+
+
+def _dead_letter(task_id: str, url: str, schema_name: str, failure: str, error: str) -> None:
+    """Registra a falha definitiva da URL (e a quarentena, conforme a classe)"""
+    dead_letters = container.dead_letters()
+    if dead_letters is not None:
+        dead_letters.record(url, schema_name, failure, error, task_id=task_id)
+
+
+def _enqueue_batch(batch_id: str, kind: str, signatures: list):
+    """
+    Enfileira as tasks filhas como um group do Celery
+
+    O group recebe o ID da task do lote, então /batch/{id} funciona com o
+    ID devolvido pela API. As filhas são publicadas com um único producer
+    e o GroupResult fica salvo no backend.
+
+    Args:
+        batch_id: ID da task que criou o lote
+        kind: Tipo do lote ('process' ou 'publish')
+        signatures: Assinaturas das tasks filhas
+
+    Returns:
+        GroupResult do lote
+    """
+    job = group(signatures, task_id=batch_id)
+    frozen = job.freeze()
+    # Registra antes de enfileirar: as filhas já encontram o lote
+    container.batch_tracker().create(
+        batch_id, kind, len(signatures), [child.id for child in frozen.results])
+
+    result = job.apply_async()
+    result.save()
+    return result
 
 
 @shared_task(
@@ -20,31 +345,54 @@ from infra.mongo_news_repository import MongoNewsRepository
     retry_backoff=True,
     retry_jitter=True,
 )
-def process_news_url(self, url: str, schema_name: str = "g1") -> dict:
+def process_news_url(
+    self,
+    url: str,
+    schema_name: str = "g1",
+    force: bool = False,
+    write_mode: str = "live",
+    priority: str = "normal"
+) -> dict:
     """
     Task para processar uma URL de notícia de forma assíncrona
 
     Args:
         url: URL da notícia a ser processada
         schema_name: Nome do schema YAML (sem extensão) para o prompt da LLM
+        force: Se True, ignora a política de frescor e reprocessa
+        write_mode: 'live' grava na hora; 'backfill' usa o buffer de gravação
+            do worker (falhas posteriores marcam esta task como FAILURE)
+        priority: Faixa de prioridade (orçamento do LLM e fila da publicação)
 
     Returns:
-        Dicionário com o resultado do processamento
+        Dicionário com a referência da notícia processada (sem o conteúdo)
     """
     task_id = self.request.id
     log.info(f"[Task {task_id}] Iniciando processamento: {url}")
 
+    superseded = _superseded(self, url, schema_name)
+    if superseded:
+        return superseded
+
+    quarantined = _quarantined(url, force)
+    if quarantined:
+        return _quarantined_result(task_id, url, quarantined)
+
     try:
         # Cria Use Case via Factory (Dependency Injection)
         use_case = UseCaseFactory.create_process_news_usecase(
-            schema_name=schema_name
+            schema_name=schema_name,
+            write_mode=write_mode,
+            priority=priority
         )
 
         # Prepara input
         input_data = ProcessNewsInput(
             url=url,
             schema_name=schema_name,
-            task_id=task_id
+            task_id=task_id,
+            force=force,
+            priority=priority
         )
 
         # Executa o Use Case
@@ -52,15 +400,29 @@ def process_news_url(self, url: str, schema_name: str = "g1") -> dict:
 
         if output.status == "error":
             log.error(f"[Task {task_id}] Erro: {output.error}")
+            if output.stage and _can_retry(self):
+                # Falha após uma etapa concluída (ex.: LLM, MongoDB): o
+                # retry retoma do checkpoint sem baixar a página de novo
+                raise self.retry(exc=RuntimeError(output.error))
+            if output.failure == "transient" and _can_retry(self):
+                raise self.retry(exc=RuntimeError(output.error))
+            if output.failure:
+                # Permanente (404, paywall, seletores) ou transitória sem
+                # mais tentativas: vai para os dead letters
+                _dead_letter(task_id, url, schema_name, output.failure, output.error)
             return {
                 "status": "error",
                 "task_id": task_id,
                 "message": output.error,
-                "url": url
+                "failure": output.failure,
+                "url": url,
+                "timings": output.timings
             }
 
         log.info(f"[Task {task_id}] Processamento concluído com sucesso")
 
+        # Resultado compacto (claim check): a notícia fica no MongoDB e o
+        # /status/{task_id} a busca pelo mongodb_id quando pedida
         return {
             "status": output.status,
             "task_id": task_id,
@@ -68,15 +430,20 @@ def process_news_url(self, url: str, schema_name: str = "g1") -> dict:
             "url": url,
             "title": output.title,
             "schema_used": output.schema_used,
-            "llm_processing": {
-                "status": output.llm_status,
-                "resumo": output.resumo,
-            },
-            "article": output.article
+            "freshness": output.freshness,
+            "llm_status": output.llm_status,
+            "timings": output.timings
         }
 
+    except Retry:
+        raise
+    except RateBudgetExceeded:
+        # Orçamento do LLM esgotado: adia sem gastar tentativas
+        raise _defer(self, container.rate_budget("llm").seconds_to_next_window())
     except Exception as e:
         log.exception(f"[Task {task_id}] Erro no processamento: {e}")
+        if not _can_retry(self):
+            _dead_letter(task_id, url, schema_name, "exhausted", str(e))
         raise
 
 
@@ -85,35 +452,107 @@ def process_news_url(self, url: str, schema_name: str = "g1") -> dict:
     name="workers.tasks.process_news_batch",
     max_retries=1,
 )
-def process_news_batch(self, urls: list, schema_name: str = "g1") -> dict:
+def process_news_batch(
+    self,
+    urls: list,
+    schema_name: str = "g1",
+    force: bool = False,
+    write_mode: str = None,
+    priority: str = "low"
+) -> dict:
     """
     Task para processar múltiplas URLs de notícias
 
     Args:
         urls: Lista de URLs para processar
         schema_name: Nome do schema YAML para todas as URLs
+        force: Se True, ignora a política de frescor e reprocessa
+        write_mode: 'live' ou 'backfill' (padrão: settings.BATCH_WRITE_MODE)
+        priority: Faixa das tasks filhas (padrão 'low': não atrasa URLs avulsas)
 
     Returns:
-        Dicionário com IDs das tasks criadas
+        Dicionário com IDs das tasks criadas (progresso em /batch/{id})
     """
     task_id = self.request.id
     log.info(f"[Batch {task_id}] Iniciando batch com {len(urls)} URLs")
 
-    task_ids = []
+    write_mode = write_mode or settings.BATCH_WRITE_MODE
+    lock = container.enqueue_lock()
+    task_ids, duplicates, signatures, seen = [], [], [], {}
+
+    queue = lane_queue(process_news_url.name, priority)
     for url in urls:
-        # Cria uma task para cada URL
-        task = process_news_url.delay(url, schema_name)
-        task_ids.append({
-            "url": url,
-            "task_id": task.id
-        })
-        log.info(f"[Batch {task_id}] Task criada: {task.id} para {url}")
+        key = lock.url_key(process_news_url.name, url, schema_name)
+        child_id = uuid()
+        owner = seen.get(key)
+        if owner is None and settings.DEDUP_ENABLED:
+            owner = _reserve_url(lock, key, child_id, priority)
+        if owner is not None:
+            # Repetida no lote ou já enfileirada por outra requisição
+            duplicates.append({"url": url, "task_id": owner})
+            continue
+
+        seen[key] = child_id
+        signatures.append(
+            process_news_url.s(url, schema_name, force, write_mode, priority=priority)
+            .set(task_id=child_id, queue=queue))
+        task_ids.append({"url": url, "task_id": child_id})
+
+    if signatures:
+        _enqueue_batch(task_id, "process", signatures)
+    log.info(
+        f"[Batch {task_id}] {len(task_ids)} tasks enfileiradas, "
+        f"{len(duplicates)} duplicadas")
 
     return {
         "status": "batch_queued",
         "batch_task_id": task_id,
+        "batch_id": task_id,
         "total_urls": len(urls),
         "tasks": task_ids,
+        "duplicates": duplicates,
+        "schema_used": schema_name,
+        "write_mode": write_mode,
+        "priority": priority
+    }
+
+
+@shared_task(
+    bind=True,
+    name="workers.tasks.process_news_backfill",
+    max_retries=0,
+    time_limit=None,
+)
+def process_news_backfill(self, urls: list, schema_name: str = "g1") -> dict:
+    """
+    Task para backfills grandes usando o pipeline em lote
+
+    Ao contrário de process_news_batch, não cria uma task por URL: executa
+    download, parsing, LLM e persistência em pipeline com concorrência
+    própria por etapa e gravações em bulk.
+
+    Args:
+        urls: Lista de URLs para processar
+        schema_name: Nome do schema YAML para todas as URLs
+
+    Returns:
+        Dicionário com contagens e erros por URL
+    """
+    task_id = self.request.id
+    log.info(f"[Backfill {task_id}] Iniciando backfill com {len(urls)} URLs")
+
+    use_case = UseCaseFactory.create_process_news_batch_usecase(
+        schema_name=schema_name
+    )
+    output = use_case.execute(ProcessNewsBatchInput(
+        urls=urls,
+        schema_name=schema_name,
+        task_id=task_id
+    ))
+
+    return {
+        **asdict(output),
+        "task_id": task_id,
         "schema_used": schema_name
     }
 
@@ -128,6 +567,195 @@ def health_check() -> dict:
     }
 
 
+@contextmanager
+def _exclusive(task):
+    """
+    Trava contra sobreposição de uma task periódica
+
+    Uma execução lenta não se acumula com a seguinte: enquanto a trava
+    existir, as novas execuções terminam sem fazer nada. A validade vem da
+    entrada da agenda (lock_ttl ou o intervalo) e limita travas órfãs.
+
+    Yields:
+        True se a trava foi obtida
+    """
+    lock = container.enqueue_lock()
+    key = lock.key("periodic", task.name)
+    owner = task.request.id or uuid()
+    ttl = lock_ttl(find_entry(BEAT_ENTRIES, task.name) or {}, settings.PERIODIC_LOCK_TTL)
+
+    current = lock.acquire(key, owner, ttl)
+    if current is not None:
+        log.info(f"[{task.name}] Execução anterior ainda em andamento (task {current}), ignorando")
+        yield False
+        return
+    try:
+        yield True
+    finally:
+        lock.release(key, owner)
+
+
+def _skipped(task) -> dict:
+    return {
+        "status": "skipped",
+        "reason": "already_running",
+        "task_id": task.request.id
+    }
+
+
+@shared_task(bind=True, name="workers.tasks.apply_retention")
+def apply_retention(self) -> dict:
+    """
+    Aplica a política de retenção (arquivamento e TTL de falhas)
+
+    As remoções por TTL acontecem no servidor, fora do repositório: os
+    contadores de publicação são reconciliados ao final quando o TTL está ativo.
+    """
+    from infra.retention import RetentionManager
+
+    with _exclusive(self) as acquired:
+        if not acquired:
+            return _skipped(self)
+
+        repo = container.news_repository()
+        result = RetentionManager(container.mongo(), repo).apply()
+        if result.ttl_days > 0:
+            repo.reconcile_publish_stats()
+
+    return {
+        "status": "success",
+        **asdict(result)
+    }
+
+
+@shared_task(bind=True, name="workers.tasks.adjust_rate_limits")
+def adjust_rate_limits(self) -> dict:
+    """
+    Ciclo do controle AIMD dos orçamentos do LLM e do WordPress
+
+    Usa as chamadas observadas pelos workers desde o último ciclo e a
+    profundidade das filas que dependem de cada serviço.
+    """
+    with _exclusive(self) as acquired:
+        if not acquired:
+            return _skipped(self)
+
+        limits = {}
+        for name, queues in RATE_QUEUES.items():
+            controller = container.rate_controller(name)
+            if controller is None:
+                continue
+            depths = queue_depths(queues)
+            limits[name] = controller.adjust(
+                queue_depth=sum(depth or 0 for depth in depths.values()))
+
+    return {
+        "status": "success",
+        "limits": limits
+    }
+
+
+@shared_task(bind=True, name="workers.tasks.reconcile_publish_stats")
+def reconcile_publish_stats(self) -> dict:
+    """Reconstrói os contadores de publicação a partir da coleção de notícias"""
+    with _exclusive(self) as acquired:
+        if not acquired:
+            return _skipped(self)
+        stats = container.news_repository().reconcile_publish_stats()
+
+    return {
+        "status": "success",
+        "stats": stats
+    }
+
+
+@shared_task(bind=True, name="workers.tasks.discover_sources")
+def discover_sources(self, schema_name: Optional[str] = None) -> dict:
+    """
+    Descobre notícias novas nas fontes e enfileira o processamento
+
+    Lê os feeds declarados na seção 'discovery' de cada schema, descarta
+    as URLs que já estão no MongoDB ou em quarentena e enfileira as demais com deduplicação
+    (uma URL ainda na fila não é enfileirada de novo).
+
+    Args:
+        schema_name: Schema a verificar (None verifica todos)
+
+    Returns:
+        URLs encontradas e enfileiradas por schema
+    """
+    with _exclusive(self) as acquired:
+        if not acquired:
+            return _skipped(self)
+
+        repo = container.news_repository()
+        schemas = {}
+        for name in ([schema_name] if schema_name else settings.list_schemas()):
+            try:
+                urls = container.scraper(name).discover_urls(settings.DISCOVERY_MAX_ITEMS)
+            except Exception as e:
+                log.error(f"[Discovery] Falha ao ler as fontes do schema {name}: {e}")
+                schemas[name] = {"error": str(e)}
+                continue
+
+            existing = repo.find_existing_urls(urls)
+            dead_letters = container.dead_letters()
+            if dead_letters is not None:
+                existing |= dead_letters.find_quarantined(urls)
+            queued = 0
+            for url in urls:
+                if url in existing:
+                    continue
+                _, duplicate = enqueue_unique(
+                    process_news_url, url, name, priority=settings.DISCOVERY_PRIORITY)
+                queued += not duplicate
+
+            schemas[name] = {"found": len(urls), "new": len(urls) - len(existing), "queued": queued}
+            if queued:
+                log.info(f"[Discovery] {name}: {queued} notícias novas enfileiradas")
+
+    return {
+        "status": "success",
+        "schemas": schemas
+    }
+
+
+@shared_task(bind=True, name="workers.tasks.sweep_pending_publish")
+def sweep_pending_publish(self, limit: Optional[int] = None) -> dict:
+    """
+    Enfileira a publicação de notícias processadas e ainda não publicadas
+
+    Trabalha em lotes de até PUBLISH_SWEEP_BATCH notícias. Usa a mesma
+    reserva de publicação dos demais caminhos (enqueue_publish): notícias
+    reservadas pelo dispatcher, pela API ou por process_and_publish não
+    são enfileiradas de novo.
+
+    Args:
+        limit: Tamanho do lote (padrão: PUBLISH_SWEEP_BATCH)
+
+    Returns:
+        Notícias pendentes encontradas e enfileiradas
+    """
+    with _exclusive(self) as acquired:
+        if not acquired:
+            return _skipped(self)
+
+        pending = container.news_repository().find_pending_publish(
+            limit=limit or settings.PUBLISH_SWEEP_BATCH, fields="ids")
+        queued = 0
+        for news in pending:
+            if enqueue_publish(str(news["_id"])) is not None:
+                queued += 1
+
+    if queued:
+        log.info(f"[Publish Sweep] {queued} de {len(pending)} notícias pendentes enfileiradas")
+    return {
+        "status": "success",
+        "pending": len(pending),
+        "queued": queued
+    }
+
+
 @shared_task(
     bind=True,
     name="workers.tasks.publish_to_wordpress",
@@ -136,12 +764,13 @@ def health_check() -> dict:
     autoretry_for=(Exception,),
     retry_backoff=True,
 )
-def publish_to_wordpress(self, mongodb_id: str) -> dict:
+def publish_to_wordpress(self, mongodb_id: str, priority: str = "normal") -> dict:
     """
     Task para publicar uma notícia do MongoDB no WordPress
 
     Args:
         mongodb_id: ID do documento no MongoDB
+        priority: Faixa de prioridade (orçamento de publicações no WordPress)
 
     Returns:
         Dicionário com resultado da publicação
@@ -150,9 +779,13 @@ def publish_to_wordpress(self, mongodb_id: str) -> dict:
     task_id = self.request.id
     log.info(f"[Task {task_id}] Publicando notícia: {mongodb_id}")
 
+    checkpoint = _load_checkpoint(task_id)
+    if checkpoint and checkpoint.get('stage') == "published":
+        return _resume_published(task_id, checkpoint)
+
     try:
         # Busca notícia no MongoDB
-        repo = MongoNewsRepository()
+        repo = container.news_repository()
         news = repo.find_by_id(mongodb_id)
 
         if not news:
@@ -173,16 +806,29 @@ def publish_to_wordpress(self, mongodb_id: str) -> dict:
                 "wordpress_url": news.get("wordpress_url")
             }
 
+        # Só quem reserva publica (reentrante: a reserva do enqueue_publish
+        # e a de tentativas anteriores têm o ID desta task)
+        if not repo.claim_publish(mongodb_id, task_id, settings.PUBLISH_CLAIM_TTL):
+            return _claimed_result(task_id, mongodb_id)
+
+        _acquire_publish_budget(self, priority)
+
         # Publica no WordPress
-        publisher = WordPressPublisherService()
-        result = publisher.publish_from_processed_news(news)
+        timings = StageTimings()
+        publisher = container.wordpress_publisher()
+        with timings.span("publish"):
+            result = publisher.publish_from_processed_news(news)
+        _observe_publish(result, timings)
 
         if result.success:
+            _checkpoint_published(task_id, mongodb_id, result, timings)
+
             # Atualiza status no MongoDB
             repo.mark_as_published(
                 mongodb_id,
                 post_id=result.post_id,
-                post_url=result.post_url
+                post_url=result.post_url,
+                timings=timings.as_dict()
             )
 
             log.success(
@@ -192,11 +838,13 @@ def publish_to_wordpress(self, mongodb_id: str) -> dict:
                 "task_id": task_id,
                 "mongodb_id": mongodb_id,
                 "wordpress_post_id": result.post_id,
-                "wordpress_url": result.post_url
+                "wordpress_url": result.post_url,
+                "timings": timings.as_dict()
             }
         else:
             # Marca erro no MongoDB
             repo.mark_publish_error(mongodb_id, result.error)
+            repo.release_publish_claim(mongodb_id, task_id)
 
             return {
                 "status": "error",
@@ -205,8 +853,13 @@ def publish_to_wordpress(self, mongodb_id: str) -> dict:
                 "error": result.error
             }
 
+    except Retry:
+        raise
     except Exception as e:
         log.exception(f"[Task {task_id}] Erro ao publicar: {e}")
+        if not _can_retry(self):
+            # Sem novas tentativas: libera a notícia para o dispatcher
+            container.news_repository().release_publish_claim(mongodb_id, task_id)
         raise
 
 
@@ -230,18 +883,17 @@ def publish_batch_to_wordpress(
         limit: Limite de notícias a publicar quando publish_pending=True
 
     Returns:
-        Dicionário com IDs das tasks criadas
+        Dicionário com IDs das tasks criadas (progresso em /batch/{id})
     """
 
     task_id = self.request.id
     log.info(f"[Batch Publish {task_id}] Iniciando batch publish")
 
-    repo = MongoNewsRepository()
-    task_ids = []
+    repo = container.news_repository()
 
     # Se publish_pending, busca notícias não publicadas
     if publish_pending:
-        pending_news = repo.find_pending_publish(limit=limit)
+        pending_news = repo.find_pending_publish(limit=limit, fields="ids")
         mongodb_ids = [news["_id"] for news in pending_news]
         log.info(
             f"[Batch Publish {task_id}] Encontradas {len(mongodb_ids)} notícias pendentes")
@@ -253,19 +905,21 @@ def publish_batch_to_wordpress(
             "message": "Nenhuma notícia para publicar"
         }
 
-    # Cria task para cada notícia
-    for mongodb_id in mongodb_ids:
-        task = publish_to_wordpress.delay(str(mongodb_id))
-        task_ids.append({
-            "mongodb_id": str(mongodb_id),
-            "task_id": task.id
-        })
-        log.info(
-            f"[Batch Publish {task_id}] Task criada: {task.id} para {mongodb_id}")
+    # Um group com uma task por notícia
+    mongodb_ids = [str(mongodb_id) for mongodb_id in mongodb_ids]
+    batch = _enqueue_batch(task_id, "publish", [
+        publish_to_wordpress.s(mongodb_id) for mongodb_id in mongodb_ids
+    ])
+    task_ids = [
+        {"mongodb_id": mongodb_id, "task_id": child.id}
+        for mongodb_id, child in zip(mongodb_ids, batch.results)
+    ]
+    log.info(f"[Batch Publish {task_id}] {len(task_ids)} tasks enfileiradas")
 
     return {
         "status": "batch_queued",
         "batch_task_id": task_id,
+        "batch_id": batch.id,
         "total": len(task_ids),
         "tasks": task_ids
     }
@@ -277,13 +931,21 @@ def publish_batch_to_wordpress(
     max_retries=3,
     default_retry_delay=60,
 )
-def process_and_publish(self, url: str, schema_name: str = "g1") -> dict:
+def process_and_publish(
+    self,
+    url: str,
+    schema_name: str = "g1",
+    force: bool = False,
+    priority: str = "normal"
+) -> dict:
     """
     Task que processa uma URL E publica no WordPress automaticamente
 
     Args:
         url: URL da notícia
         schema_name: Nome do schema YAML
+        force: Se True, ignora a política de frescor e reprocessa
+        priority: Faixa de prioridade (orçamentos do LLM e do WordPress)
 
     Returns:
         Dicionário com resultado completo
@@ -292,26 +954,51 @@ def process_and_publish(self, url: str, schema_name: str = "g1") -> dict:
     task_id = self.request.id
     log.info(f"[Task {task_id}] Processando e publicando: {url}")
 
+    # Retry: as etapas já concluídas (scraped, summarised, persisted,
+    # published) não são refeitas
+    checkpoint = _load_checkpoint(task_id)
+    if checkpoint and checkpoint.get('stage') == "published":
+        return _resume_published(task_id, checkpoint)
+
+    superseded = _superseded(self, url, schema_name)
+    if superseded:
+        return superseded
+
+    quarantined = _quarantined(url, force)
+    if quarantined:
+        return _quarantined_result(task_id, url, quarantined)
+
     try:
         # 1. Processa a notícia
         use_case = UseCaseFactory.create_process_news_usecase(
-            schema_name=schema_name
+            schema_name=schema_name,
+            priority=priority
         )
 
         input_data = ProcessNewsInput(
             url=url,
             schema_name=schema_name,
-            task_id=task_id
+            task_id=task_id,
+            force=force,
+            priority=priority,
+            # Gravada com a notícia: o dispatcher não a publica em paralelo
+            publish_claim=_publish_claim(task_id)
         )
 
         output = use_case.execute(input_data)
 
         if output.status == "error":
+            if (output.stage or output.failure == "transient") and _can_retry(self):
+                raise self.retry(exc=RuntimeError(output.error))
+            if output.failure:
+                _dead_letter(task_id, url, schema_name, output.failure, output.error)
             return {
                 "status": "processing_error",
                 "task_id": task_id,
                 "url": url,
-                "error": output.error
+                "error": output.error,
+                "failure": output.failure,
+                "timings": output.timings
             }
 
         # 2. Prepara dados para publicação
@@ -328,17 +1015,32 @@ def process_and_publish(self, url: str, schema_name: str = "g1") -> dict:
             "article": output.article
         }
 
-        # 3. Publica no WordPress
-        publisher = WordPressPublisherService()
-        result = publisher.publish_from_processed_news(processed_data)
+        # 3. Publica no WordPress (notícia reprocessada já publicada ou
+        # reservada por outro caminho não é publicada de novo)
+        repo = container.news_repository()
+        if not repo.claim_publish(output.mongodb_id, task_id, settings.PUBLISH_CLAIM_TTL):
+            # A reserva gravada pelo upsert não vale para notícia já publicada
+            repo.release_publish_claim(output.mongodb_id, task_id)
+            return {**_claimed_result(task_id, output.mongodb_id), "url": url}
+
+        # Depois do scraping e do LLM: o adiamento retoma do checkpoint
+        _acquire_publish_budget(self, priority)
+
+        timings = StageTimings(output.timings)
+        publisher = container.wordpress_publisher()
+        with timings.span("publish"):
+            result = publisher.publish_from_processed_news(processed_data)
+        _observe_publish(result, timings)
 
         if result.success:
+            _checkpoint_published(task_id, output.mongodb_id, result, timings)
+
             # Atualiza MongoDB com status de publicação
-            repo = MongoNewsRepository()
             repo.mark_as_published(
                 output.mongodb_id,
                 post_id=result.post_id,
-                post_url=result.post_url
+                post_url=result.post_url,
+                timings=timings.as_dict()
             )
 
             log.success(
@@ -350,17 +1052,30 @@ def process_and_publish(self, url: str, schema_name: str = "g1") -> dict:
                 "mongodb_id": output.mongodb_id,
                 "title": output.title,
                 "wordpress_post_id": result.post_id,
-                "wordpress_url": result.post_url
+                "wordpress_url": result.post_url,
+                "timings": timings.as_dict()
             }
         else:
+            if (_publish_overloaded(result) or result.status_code == 429) and _can_retry(self):
+                # Notícia já persistida: o retry vai direto para a publicação
+                log.warning(f"[Task {task_id}] Falha transitória ao publicar, reagendando: {result.error}")
+                raise self.retry(exc=RuntimeError(result.error))
+            repo.release_publish_claim(output.mongodb_id, task_id)
             return {
                 "status": "publish_error",
                 "task_id": task_id,
                 "url": url,
                 "mongodb_id": output.mongodb_id,
-                "error": result.error
+                "error": result.error,
+                "timings": timings.as_dict()
             }
 
+    except Retry:
+        raise
+    except RateBudgetExceeded:
+        raise _defer(self, container.rate_budget("llm").seconds_to_next_window())
     except Exception as e:
         log.exception(f"[Task {task_id}] Erro: {e}")
+        if not _can_retry(self):
+            _dead_letter(task_id, url, schema_name, "exhausted", str(e))
         raise